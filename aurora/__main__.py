@@ -0,0 +1,5 @@
+"""Entry point of ``python -m aurora`` (see aurora.cli)."""
+
+from aurora.cli import main
+
+raise SystemExit(main())
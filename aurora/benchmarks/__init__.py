@@ -0,0 +1,3 @@
+# Benchmark exports
+
+from .synthetic import SyntheticECGConfig, generate_ecg
@@ -0,0 +1,404 @@
+"""
+Headless end-to-end benchmark of the user path on synthetic recordings.
+
+Writes a synthetic multi-channel EDF+ file (see synthetic.py) and times, in
+order, the stages a user goes through:
+
+    load_file             DataManager.load_file
+    session_setup         Session.load_file (channel selection, ChunkLoader)
+    first_chunk           first ChunkLoader.request_chunk until chunk_loaded
+    scroll                K scripted windows, each awaited like the viewer does
+    hr_aurora             DataManager.get_trace("hr_aurora")
+    event_intervals       DataManager.get_event_intervals
+    hemodynamic_analysis  HemodynamicAnalyzer.prepare_hemodynamic_analysis
+    export                EDFExporter.export_clean_signals
+
+Each stage reports wall time, start/end/peak RSS and the hit/miss deltas of
+the caches involved. Runs without a display (QCoreApplication only); disk
+caches go to a temporary directory unless --cache-dir is given, so a default
+run measures a cold start.
+
+Usage:
+    python -m aurora.benchmarks.end_to_end --hours 2 --channels 6 --output e2e.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from aurora.benchmarks.measure import (
+    RSSSampler,
+    Stopwatch,
+    counter_delta,
+    percentiles,
+)
+from aurora.benchmarks.peak_detection import environment_info
+from aurora.benchmarks.synthetic import (
+    SyntheticECGConfig,
+    SyntheticRecordingConfig,
+    write_synthetic_edf,
+)
+from aurora.core.config_manager import get_config_manager
+
+
+class EndToEndBenchmark:
+    """
+    Runs the user path stage by stage on one recording and collects metrics.
+
+    Args:
+        path: EDF+ recording to open
+        scroll_windows: Number of windows requested in the scroll stage
+        scroll_step_sec: Start-time step between scroll windows (default: half
+                         a window)
+        window_sec: Window duration (default: session default_chunk_size)
+        export_path: Destination of the export stage (default: temp file)
+        timeout_sec: Maximum wait for one chunk
+        include_hr: Also request hr_aurora in chunks (R-peak detection then
+                    happens in first_chunk and hr_aurora becomes a cache hit)
+
+    Chunks and the export use the recorded channels only by default, so that
+    each stage's time stays attributable to that stage. hr_aurora exports are
+    left out because NaN gaps in HR cannot be written to EDF yet.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        scroll_windows: int = 20,
+        scroll_step_sec: Optional[float] = None,
+        window_sec: Optional[float] = None,
+        export_path: Optional[str] = None,
+        timeout_sec: float = 120.0,
+        include_hr: bool = False,
+    ):
+        self.path = os.path.abspath(path)
+        self.scroll_windows = scroll_windows
+        self.scroll_step_sec = scroll_step_sec
+        self.window_sec = window_sec
+        self.export_path = export_path
+        self.timeout_sec = timeout_sec
+        self.include_hr = include_hr
+        self.session = None
+        self.channels: List[str] = []  # Recorded channels
+        self.chunk_channels: List[str] = []
+        self.stages: List[Dict[str, Any]] = []
+        self.logger = logging.getLogger("aurora.benchmarks.EndToEndBenchmark")
+
+    # ------------------------------------------------------------------ run
+
+    def run(self) -> List[Dict[str, Any]]:
+        """Run every stage in order; a failing stage is recorded and the run stops."""
+        from PySide6.QtCore import QCoreApplication
+
+        from aurora.core.session import Session
+
+        self._app = QCoreApplication.instance() or QCoreApplication([])
+        self.session = Session(self.path, "benchmark")
+        dm = self.session.data_manager
+
+        steps = [
+            ("load_file", lambda: dm.load_file(self.path)),
+            ("session_setup", self._session_setup),
+            ("first_chunk", self._first_chunk),
+            ("scroll", self._scroll),
+            ("hr_aurora", lambda: {"beats": len(self._hr().r_peaks)}),
+            (
+                "event_intervals",
+                lambda: {"intervals": len(dm.get_event_intervals(self.path))},
+            ),
+            ("hemodynamic_analysis", self._hemodynamic_analysis),
+            ("export", self._export),
+        ]
+        try:
+            for name, step in steps:
+                if not self._stage(name, step):
+                    break
+        finally:
+            self.session.close()
+        return self.stages
+
+    def _stage(self, name: str, step: Callable[[], Optional[Dict[str, Any]]]) -> bool:
+        before = self.cache_snapshot()
+        result: Dict[str, Any] = {"stage": name}
+        with RSSSampler() as rss, Stopwatch() as watch:
+            try:
+                extra = step()
+            except Exception as e:
+                self.logger.error(f"Benchmark stage {name} failed: {e}", exc_info=True)
+                extra = None
+                result["error"] = f"{type(e).__name__}: {e}"
+        result["seconds"] = watch.seconds
+        result.update(rss.to_dict())
+        result["caches"] = counter_delta(before, self.cache_snapshot())
+        if extra:
+            result.update(extra)
+        self.stages.append(result)
+        return "error" not in result
+
+    def cache_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Counters and sizes of the caches touched by the user path."""
+        from aurora.processing.peak_detection_strategies import (
+            get_preprocessing_cache,
+        )
+
+        snapshot = {"preprocessing": get_preprocessing_cache().get_stats()}
+        if self.session is not None and self.session.data_manager is not None:
+            snapshot.update(self.session.get_cache_stats()["caches"])
+        return snapshot
+
+    # --------------------------------------------------------------- stages
+
+    def _session_setup(self) -> Dict[str, Any]:
+        dm = self.session.data_manager
+        available = list(dm.get_available_channels(self.path))
+        self.channels = [
+            c for c in available if c.lower() not in ("hr_aurora", "hr_gen")
+        ]
+        self.chunk_channels = available if self.include_hr else list(self.channels)
+        if not self.session.load_file(selected_channels=list(available)):
+            raise RuntimeError("Session.load_file failed")
+        if self.session.chunk_loader is None:
+            raise RuntimeError("ChunkLoader was not created")
+        if self.window_sec is None:
+            self.window_sec = float(self.session.get_config("default_chunk_size", 60.0))
+        return {"channels": self.chunk_channels, "window_sec": self.window_sec}
+
+    def _first_chunk(self) -> Dict[str, Any]:
+        points = self._request_chunk(0.0)
+        return {"points": points}
+
+    def _scroll(self) -> Dict[str, Any]:
+        dm = self.session.data_manager
+        duration = dm.get_channel_duration(self.path, self.channels[0])
+        step = self.scroll_step_sec or self.window_sec / 2
+        latencies = []
+        start = 0.0
+        for _ in range(self.scroll_windows):
+            start += step
+            if start + self.window_sec > duration:
+                start = 0.0
+            with Stopwatch() as watch:
+                self._request_chunk(start)
+            latencies.append(watch.seconds * 1000.0)
+        return {"windows": len(latencies), "latency_ms": percentiles(latencies)}
+
+    def _hr(self):
+        return self.session.data_manager.get_trace(self.path, "hr_aurora")
+
+    def _hemodynamic_analysis(self) -> Dict[str, Any]:
+        from aurora.processing.hemodynamic_analyzer import HemodynamicAnalyzer
+
+        dm = self.session.data_manager
+        names = ["hr_aurora", "FBP", "MAP", "CO", "SV", "SVR", "ETCO2"]
+        signals = {
+            name: dm.get_trace(self.path, name)
+            for name in names
+            if name == "hr_aurora" or name in self.channels
+        }
+        results = HemodynamicAnalyzer().prepare_hemodynamic_analysis(signals, "stand")
+        return {
+            "signals": sorted(signals),
+            "hr_peak_events": len(results["peak_events"]),
+        }
+
+    def _export(self) -> Dict[str, Any]:
+        from aurora.data.edf_exporter import EDFExporter
+
+        export_path = self.export_path or os.path.join(
+            tempfile.mkdtemp(prefix="aurora_bench_export_"), "export.edf"
+        )
+        try:
+            EDFExporter(self.session.data_manager).export_clean_signals(
+                self.path, export_path, channels=list(self.channels)
+            )
+            size = os.path.getsize(export_path)
+        finally:
+            if self.export_path is None:
+                shutil.rmtree(os.path.dirname(export_path), ignore_errors=True)
+        return {"export_mb": size / 1e6}
+
+    # -------------------------------------------------------------- helpers
+
+    def _request_chunk(self, start_sec: float) -> int:
+        """Request one window and spin the event loop until it is delivered."""
+        from PySide6.QtCore import QEventLoop, QTimer
+
+        loader = self.session.chunk_loader
+        loop = QEventLoop()
+        state: Dict[str, Any] = {"id": None}
+
+        def on_loaded(start, end, data, request_id):
+            if request_id == state["id"]:
+                state["data"] = data
+                loop.quit()
+
+        def on_error(message):
+            state["error"] = message
+            loop.quit()
+
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(loop.quit)
+        loader.chunk_loaded.connect(on_loaded)
+        loader.chunk_error.connect(on_error)
+        try:
+            state["id"] = loader.request_chunk(
+                self.chunk_channels, start_sec, self.window_sec, consumer="benchmark"
+            )
+            timer.start(int(self.timeout_sec * 1000))
+            loop.exec()
+        finally:
+            loader.chunk_loaded.disconnect(on_loaded)
+            loader.chunk_error.disconnect(on_error)
+            timer.stop()
+
+        if "error" in state:
+            raise RuntimeError(state["error"])
+        if "data" not in state:
+            raise TimeoutError(f"No chunk within {self.timeout_sec}s")
+        return sum(len(v) for v in state["data"].values())
+
+
+def run_end_to_end(
+    recording: SyntheticRecordingConfig,
+    work_dir: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    **benchmark_kwargs,
+) -> Dict[str, Any]:
+    """
+    Write a synthetic recording, run EndToEndBenchmark on it, return the report.
+
+    Args:
+        recording: Synthetic recording parameters
+        work_dir: Where the EDF file is written (default: temporary, removed)
+        cache_dir: Disk cache directory (default: temporary, i.e. cold caches)
+        **benchmark_kwargs: Passed to EndToEndBenchmark
+    """
+    temp_dirs = []
+    if work_dir is None:
+        work_dir = tempfile.mkdtemp(prefix="aurora_bench_")
+        temp_dirs.append(work_dir)
+    if cache_dir is None:
+        cache_dir = tempfile.mkdtemp(prefix="aurora_bench_cache_")
+        temp_dirs.append(cache_dir)
+    # Must happen before the disk caches are first used
+    get_config_manager().update_disk_cache_settings(directory=cache_dir)
+
+    try:
+        path = os.path.join(work_dir, "synthetic_recording.edf")
+        with Stopwatch() as watch:
+            info = write_synthetic_edf(path, recording)
+        file_mb = os.path.getsize(path) / 1e6
+
+        benchmark = EndToEndBenchmark(path, **benchmark_kwargs)
+        stages = benchmark.run()
+    finally:
+        for directory in temp_dirs:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    return {
+        "benchmark": "end_to_end",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment_info(),
+        "recording": {
+            **recording.to_dict(),
+            "channels": info["channels"],
+            "beats": int(len(info["r_peaks"])),
+            "annotations": len(info["annotations"]),
+            "file_mb": file_mb,
+            "write_seconds": watch.seconds,
+        },
+        "stages": stages,
+    }
+
+
+def format_stage(stage: Dict[str, Any]) -> str:
+    line = f"{stage['stage']:<22} {stage['seconds'] * 1000:>10.1f} ms"
+    if stage.get("peak_rss_mb") is not None:
+        line += f"  peak RSS {stage['peak_rss_mb']:>8.1f} MB"
+    rates = [
+        f"{name} {c['hit_rate']:.0%}"
+        for name, c in stage["caches"].items()
+        if c.get("hit_rate") is not None
+    ]
+    if rates:
+        line += "  hits: " + ", ".join(rates)
+    if "latency_ms" in stage:
+        lat = stage["latency_ms"]
+        line += f"  window p50 {lat['p50']:.1f} / p95 {lat['p95']:.1f} ms"
+    if "error" in stage:
+        line += f"  ERROR {stage['error']}"
+    return line
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m aurora.benchmarks.end_to_end",
+        description="Time the user path on a synthetic EDF+ recording.",
+    )
+    parser.add_argument("--hours", type=float, default=1.0)
+    parser.add_argument("--channels", type=int, default=4, help="Total channels")
+    parser.add_argument("--ecg-fs", type=float, default=1000.0)
+    parser.add_argument("--bp-fs", type=int, default=250)
+    parser.add_argument("--slow-fs", type=int, nargs="+", default=[100, 50, 10])
+    parser.add_argument("--comments-per-hour", type=int, default=30)
+    parser.add_argument("--scroll-windows", type=int, default=20)
+    parser.add_argument("--scroll-step-sec", type=float)
+    parser.add_argument("--window-sec", type=float)
+    parser.add_argument(
+        "--include-hr", action="store_true", help="Request hr_aurora in chunks"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--work-dir", help="Keep the synthetic EDF file here")
+    parser.add_argument("--cache-dir", help="Disk cache directory (default: cold)")
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    parser.add_argument("--verbose", action="store_true", help="Keep app logging")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        # Read when the application logger is set up (on first use)
+        os.environ.setdefault("AURORA_LOG_LEVEL", "WARNING")
+        os.environ.setdefault("MNE_LOGGING_LEVEL", "WARNING")
+        logging.getLogger().setLevel(logging.WARNING)
+
+    recording = SyntheticRecordingConfig(
+        duration_sec=args.hours * 3600.0,
+        n_channels=args.channels,
+        ecg=SyntheticECGConfig(fs=args.ecg_fs, seed=args.seed),
+        bp_fs=args.bp_fs,
+        slow_fs=tuple(args.slow_fs),
+        comments_per_hour=args.comments_per_hour,
+        seed=args.seed,
+    )
+    report = run_end_to_end(
+        recording,
+        work_dir=args.work_dir,
+        cache_dir=args.cache_dir,
+        scroll_windows=args.scroll_windows,
+        scroll_step_sec=args.scroll_step_sec,
+        window_sec=args.window_sec,
+        include_hr=args.include_hr,
+    )
+
+    rec = report["recording"]
+    print(
+        f"{rec['duration_sec'] / 3600:.1f} h, {len(rec['channels'])} channels, "
+        f"{rec['file_mb']:.0f} MB EDF (written in {rec['write_seconds']:.1f} s)"
+    )
+    for stage in report["stages"]:
+        print(format_stage(stage))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, default=str)
+        print(f"Report written to {args.output}")
+    return 0 if all("error" not in s for s in report["stages"]) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
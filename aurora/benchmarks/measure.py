@@ -0,0 +1,157 @@
+"""
+Wall-time, memory and cache-counter measurement helpers for benchmarks.
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+
+def current_rss_bytes() -> Optional[int]:
+    """
+    Resident set size of this process, or None if it cannot be read.
+
+    Uses /proc on Linux and GetProcessMemoryInfo on Windows; elsewhere falls
+    back to the peak RSS reported by getrusage.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm", "r") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError):
+            return None
+
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class _Counters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = _Counters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(
+            process, ctypes.byref(counters), counters.cb
+        ):
+            return int(counters.WorkingSetSize)
+        return None
+
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+    except (ImportError, OSError):
+        return None
+
+
+class RSSSampler:
+    """
+    Context manager sampling RSS in a background thread to find the peak.
+
+    Example:
+        with RSSSampler() as rss:
+            work()
+        print(rss.peak_mb)
+    """
+
+    def __init__(self, interval_sec: float = 0.01):
+        self.interval_sec = interval_sec
+        self.start_bytes = None
+        self.end_bytes = None
+        self.peak_bytes = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self) -> "RSSSampler":
+        self.start_bytes = self.peak_bytes = current_rss_bytes()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.end_bytes = current_rss_bytes()
+        self._sample(self.end_bytes)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_sec):
+            self._sample(current_rss_bytes())
+
+    def _sample(self, value: Optional[int]) -> None:
+        if value is not None:
+            self.peak_bytes = max(self.peak_bytes or 0, value)
+
+    def to_dict(self) -> Dict[str, Optional[float]]:
+        def mb(value):
+            return value / 1e6 if value is not None else None
+
+        return {
+            "rss_start_mb": mb(self.start_bytes),
+            "rss_end_mb": mb(self.end_bytes),
+            "peak_rss_mb": mb(self.peak_bytes),
+        }
+
+
+class Stopwatch:
+    """Context manager measuring wall time with time.perf_counter."""
+
+    def __enter__(self) -> "Stopwatch":
+        self.seconds = 0.0
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.seconds = time.perf_counter() - self._start
+
+
+def percentiles(values: Iterable[float], qs=(50, 90, 95, 99)) -> Dict[str, float]:
+    """p50/p90/... and max of a sample (empty dict for no values)."""
+    values = np.asarray(list(values), dtype=float)
+    if len(values) == 0:
+        return {}
+    result = {f"p{q}": float(np.percentile(values, q)) for q in qs}
+    result["max"] = float(values.max())
+    result["mean"] = float(values.mean())
+    return result
+
+
+def counter_delta(
+    before: Dict[str, Dict[str, Any]], after: Dict[str, Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Hit/miss/eviction deltas and hit rate per cache between two snapshots.
+
+    Each snapshot maps a cache name to its get_stats() dict; other fields of
+    the later snapshot (sizes) are reported as they are.
+    """
+    deltas = {}
+    for name, stats in after.items():
+        prev = before.get(name, {})
+        entry = dict(stats)
+        for key in ("hits", "misses", "evictions"):
+            if key in stats:
+                entry[key] = stats[key] - prev.get(key, 0)
+        lookups = entry.get("hits", 0) + entry.get("misses", 0)
+        if "hits" in entry:
+            entry["hit_rate"] = entry["hits"] / lookups if lookups else None
+        deltas[name] = entry
+    return deltas
@@ -0,0 +1,290 @@
+"""
+Throughput and accuracy benchmark of the registered peak detection strategies.
+
+Every strategy in strategy_registry (or a selection) runs on synthetic ECG
+recordings with known R-peaks. Each run reports samples per second, peak
+Python-heap memory (tracemalloc), sensitivity, PPV and timing error. Results
+are printed as a table and can be written as JSON, e.g. to choose
+hr_generation["default_method"] or to compare two versions of a strategy.
+
+Usage:
+    python -m aurora.benchmarks.peak_detection --fs 250 1000 --duration-min 10 60
+    python -m aurora.benchmarks.peak_detection --noise-mv 0.2 --ectopic-rate 0.05 \
+        --mode analyzer --output results.json
+"""
+
+import argparse
+import gc
+import itertools
+import json
+import platform
+import time
+import tracemalloc
+import warnings
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from aurora.benchmarks.synthetic import SyntheticECGConfig, generate_ecg
+from aurora.processing.ecg_analyzer import ECGAnalyzer
+from aurora.processing.peak_detection_strategies import (
+    get_preprocessing_cache,
+    strategy_registry,
+)
+
+# "strategy" calls strategy.detect_peaks on the whole signal; "analyzer" goes
+# through ECGAnalyzer.detect_rr_peaks with the configured segmentation and
+# coarse-to-fine settings (what hr_aurora generation does)
+MODES = ("strategy", "analyzer")
+
+
+def _detect(method: str, ecg: np.ndarray, fs: float, mode: str) -> np.ndarray:
+    if mode == "analyzer":
+        return ECGAnalyzer.detect_rr_peaks(ecg, fs, method=method)
+    return strategy_registry.get_strategy(method).detect_peaks(ecg, fs)
+
+
+def _warm_up(method: str, fs: float, mode: str) -> None:
+    ecg, _ = generate_ecg(SyntheticECGConfig(fs=fs, duration_sec=20.0))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        try:
+            _detect(method, ecg, fs, mode)
+        except Exception:
+            pass  # Reported by the timed run
+    get_preprocessing_cache().clear()
+
+
+def benchmark_strategy(
+    method: str,
+    ecg: np.ndarray,
+    r_peaks: np.ndarray,
+    fs: float,
+    mode: str = "strategy",
+    repeats: int = 1,
+    tolerance_sec: float = 0.05,
+) -> Dict[str, Any]:
+    """
+    Time one strategy on one recording and score it against the true R-peaks.
+
+    The preprocessing cache is cleared before every run so repeats measure
+    the full computation. Timing is the best of `repeats` runs; peak memory is
+    measured in a separate run because tracemalloc slows allocation down.
+
+    Returns:
+        Dict with seconds, samples_per_sec, peak_memory_mb and the
+        ECGAnalyzer.compare_peaks scores (or an error message)
+    """
+    result: Dict[str, Any] = {"method": method, "mode": mode}
+    timings = []
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for _ in range(max(1, repeats)):
+                get_preprocessing_cache().clear()
+                gc.collect()
+                start = time.perf_counter()
+                peaks = _detect(method, ecg, fs, mode)
+                timings.append(time.perf_counter() - start)
+
+            get_preprocessing_cache().clear()
+            gc.collect()
+            tracemalloc.start()
+            try:
+                _detect(method, ecg, fs, mode)
+                _, peak_bytes = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+    finally:
+        get_preprocessing_cache().clear()
+
+    seconds = min(timings)
+    result.update(
+        {
+            "seconds": seconds,
+            "samples_per_sec": len(ecg) / seconds if seconds > 0 else float("inf"),
+            "peak_memory_mb": peak_bytes / 1e6,
+            "n_detected": int(len(peaks)),
+        }
+    )
+    result.update(
+        ECGAnalyzer.compare_peaks(r_peaks, peaks, fs, tolerance_sec=tolerance_sec)
+    )
+    return result
+
+
+def run_benchmark(
+    configs: Sequence[SyntheticECGConfig],
+    methods: Optional[Sequence[str]] = None,
+    mode: str = "strategy",
+    repeats: int = 1,
+    tolerance_sec: float = 0.05,
+    progress: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run every method on every synthetic recording.
+
+    Args:
+        configs: Synthetic recordings to generate
+        methods: Strategy names (default: all registered strategies)
+        mode: "strategy" or "analyzer" (see MODES)
+        repeats: Timed runs per case (best is reported)
+        tolerance_sec: Matching tolerance for sensitivity/PPV
+        progress: Print one line per finished case
+
+    Returns:
+        Machine-readable report with environment, per-case results and a
+        per-method summary
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode '{mode}', expected one of {MODES}")
+    methods = list(methods or strategy_registry.list_strategies())
+
+    results: List[Dict[str, Any]] = []
+    warmed_up = set()
+    for config in configs:
+        ecg, r_peaks = generate_ecg(config)
+        for method in methods:
+            if method not in warmed_up:
+                # Lazy imports, pools and first-call overhead stay out of timings
+                _warm_up(method, config.fs, mode)
+                warmed_up.add(method)
+            result = benchmark_strategy(
+                method, ecg, r_peaks, config.fs, mode, repeats, tolerance_sec
+            )
+            result["recording"] = config.to_dict()
+            result["n_samples"] = int(len(ecg))
+            result["n_beats"] = int(len(r_peaks))
+            results.append(result)
+            if progress:
+                print(format_result(result), flush=True)
+        del ecg
+
+    return {
+        "benchmark": "peak_detection",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment_info(),
+        "mode": mode,
+        "repeats": repeats,
+        "tolerance_sec": tolerance_sec,
+        "results": results,
+        "summary": summarize(results),
+    }
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """Per-method aggregate: median throughput, worst and mean accuracy."""
+    summary = {}
+    for method in dict.fromkeys(r["method"] for r in results):
+        ok = [r for r in results if r["method"] == method and "error" not in r]
+        failed = sum(1 for r in results if r["method"] == method and "error" in r)
+        if not ok:
+            summary[method] = {"cases": 0, "errors": failed}
+            continue
+        summary[method] = {
+            "cases": len(ok),
+            "errors": failed,
+            "median_samples_per_sec": float(
+                np.median([r["samples_per_sec"] for r in ok])
+            ),
+            "max_peak_memory_mb": max(r["peak_memory_mb"] for r in ok),
+            "mean_sensitivity": float(np.mean([r["sensitivity"] for r in ok])),
+            "min_sensitivity": min(r["sensitivity"] for r in ok),
+            "mean_ppv": float(np.mean([r["ppv"] for r in ok])),
+            "min_ppv": min(r["ppv"] for r in ok),
+            "mean_abs_error_ms": float(np.mean([r["mean_abs_error_ms"] for r in ok])),
+        }
+    return summary
+
+
+def environment_info() -> Dict[str, str]:
+    import scipy
+
+    info = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+    }
+    try:
+        import pywt
+
+        info["pywt"] = pywt.__version__
+    except ImportError:
+        pass
+    return info
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    rec = result["recording"]
+    case = f"{rec['fs']:>6.0f} Hz {rec['duration_sec'] / 60:>7.1f} min"
+    if "error" in result:
+        return f"{result['method']:<16} {case}  ERROR {result['error']}"
+    return (
+        f"{result['method']:<16} {case} "
+        f"{result['samples_per_sec'] / 1e6:>8.2f} MS/s "
+        f"{result['peak_memory_mb']:>8.1f} MB "
+        f"Se {result['sensitivity']:.4f} PPV {result['ppv']:.4f} "
+        f"err {result['mean_abs_error_ms']:.1f} ms"
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m aurora.benchmarks.peak_detection",
+        description="Benchmark peak detection strategies on synthetic ECG.",
+    )
+    parser.add_argument("--methods", nargs="+", help="Strategies (default: all)")
+    parser.add_argument("--mode", choices=MODES, default="strategy")
+    parser.add_argument("--fs", nargs="+", type=float, default=[250.0, 1000.0])
+    parser.add_argument("--duration-min", nargs="+", type=float, default=[10.0])
+    parser.add_argument("--hr-bpm", type=float, default=70.0)
+    parser.add_argument("--hrv-sd-sec", type=float, default=0.04)
+    parser.add_argument("--noise-mv", type=float, default=0.05)
+    parser.add_argument("--wander-mv", type=float, default=0.2)
+    parser.add_argument("--powerline-mv", type=float, default=0.0)
+    parser.add_argument("--ectopic-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--tolerance-sec", type=float, default=0.05)
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args(argv)
+
+    configs = [
+        SyntheticECGConfig(
+            fs=fs,
+            duration_sec=minutes * 60.0,
+            hr_bpm=args.hr_bpm,
+            hrv_sd_sec=args.hrv_sd_sec,
+            noise_mv=args.noise_mv,
+            wander_mv=args.wander_mv,
+            powerline_mv=args.powerline_mv,
+            ectopic_rate=args.ectopic_rate,
+            seed=args.seed,
+        )
+        for fs, minutes in itertools.product(args.fs, args.duration_min)
+    ]
+
+    report = run_benchmark(
+        configs,
+        methods=args.methods,
+        mode=args.mode,
+        repeats=args.repeats,
+        tolerance_sec=args.tolerance_sec,
+        progress=True,
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,360 @@
+"""
+Offscreen rendering benchmark for PlotContainerWidget and CustomPlot.
+
+Builds a PlotContainerWidget with N plots under the Qt "offscreen" platform
+and times frames in three scenarios:
+
+    scroll    update_chunk_data with a shifted M-point window per plot
+    resize    container resized between a set of sizes, data unchanged
+    comments  refresh_comment_display with K markers per plot
+
+A frame is the widget call followed by processing pending events and a
+synchronous repaint of the whole container, so it covers
+update_chunk_data -> CustomPlot.update_data -> curve.setData, layout and paint.
+Chunks are min/max envelopes of a synthetic ECG, like the ones ChunkLoader
+produces at max_points_per_plot.
+
+Usage:
+    python -m aurora.benchmarks.rendering --plots 4 10 16 --points 2000 5000 --output render.json
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import time
+import warnings
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from aurora.benchmarks.measure import percentiles
+from aurora.benchmarks.peak_detection import environment_info
+from aurora.benchmarks.synthetic import SyntheticECGConfig, generate_ecg
+from aurora.processing.lod_pyramid import minmax_envelope
+
+SCENARIOS = ("scroll", "resize", "comments")
+
+
+class _Comment:
+    """Minimal comment carrying the attributes refresh_comment_display reads."""
+
+    def __init__(self, text: str, time_sec: float, user_defined: bool):
+        self.text = text
+        self.time = time_sec
+        self.user_defined = user_defined
+
+
+def _ensure_app():
+    """Return the running QApplication, creating an offscreen one if needed."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+def make_chunks(
+    n_frames: int,
+    points: int,
+    window_sec: float,
+    step_sec: float,
+    fs: float = 1000.0,
+    seed: int = 0,
+) -> List[np.ndarray]:
+    """
+    Min/max envelopes of consecutive windows of a synthetic ECG.
+
+    Each chunk has about `points` values, like a ChunkLoader window downsampled
+    to max_points_per_plot.
+    """
+    duration = window_sec + step_sec * n_frames
+    ecg, _ = generate_ecg(SyntheticECGConfig(fs=fs, duration_sec=duration, seed=seed))
+    raw = int(round(window_sec * fs))
+    step = int(round(step_sec * fs))
+    bucket = max(1, -(-2 * raw // points))
+
+    chunks = []
+    for i in range(n_frames):
+        window = ecg[i * step : i * step + raw]
+        chunks.append(window if bucket == 1 else minmax_envelope(window, bucket))
+    return chunks
+
+
+class RenderingBenchmark:
+    """
+    Times frames of one PlotContainerWidget layout.
+
+    Args:
+        n_plots: Number of CustomPlot widgets in the container
+        points: Points per plot and chunk (max_points_per_plot)
+        n_comments: Comment markers in the visible window (per plot)
+        frames: Timed frames per scenario
+        warmup: Untimed frames run before each scenario
+        window_sec: Visible window duration
+        size: Container size (width, height) in pixels
+    """
+
+    def __init__(
+        self,
+        n_plots: int = 4,
+        points: int = 5000,
+        n_comments: int = 10,
+        frames: int = 50,
+        warmup: int = 3,
+        window_sec: float = 60.0,
+        size=(1600, 900),
+    ):
+        self.n_plots = n_plots
+        self.points = points
+        self.n_comments = n_comments
+        self.frames = frames
+        self.warmup = warmup
+        self.window_sec = window_sec
+        self.size = tuple(size)
+        self.app = _ensure_app()
+        self.container = None
+
+    # ------------------------------------------------------------ lifecycle
+
+    def setup(self) -> None:
+        from aurora.ui.widgets.plot_container_widget import PlotContainerWidget
+
+        names = [f"CH{i + 1}" for i in range(self.n_plots)]
+        self.container = PlotContainerWidget()
+        self.container.target_signals = names
+        self.container.available_signals = names
+        self.container.create_plots()
+        self.container.resize(*self.size)
+        self.container.show()
+        self._render()
+
+    def teardown(self) -> None:
+        if self.container is not None:
+            with warnings.catch_warnings():
+                # CustomPlot.cleanup disconnects signals that may not be connected
+                warnings.simplefilter("ignore", RuntimeWarning)
+                self.container.cleanup()
+            self.container.close()
+            self.container.deleteLater()
+            self.container = None
+        self.app.processEvents()
+
+    # ------------------------------------------------------------ scenarios
+
+    def run(self, scenarios: Sequence[str] = SCENARIOS) -> Dict[str, Any]:
+        """Run the scenarios on a fresh container and return their frame times."""
+        result = {
+            "layout": {
+                "plots": self.n_plots,
+                "points": self.points,
+                "comments": self.n_comments,
+                "window_sec": self.window_sec,
+                "size": list(self.size),
+            },
+            "scenarios": {},
+        }
+
+        self.setup()
+        try:
+            for name in scenarios:
+                try:
+                    result["scenarios"][name] = getattr(self, f"_run_{name}")()
+                except Exception as e:
+                    result["scenarios"][name] = {"error": f"{type(e).__name__}: {e}"}
+        finally:
+            self.teardown()
+        return result
+
+    def _run_scroll(self) -> Dict[str, Any]:
+        step = self.window_sec / 2
+        n = self.warmup + self.frames
+        chunks = make_chunks(n, self.points, self.window_sec, step)
+
+        def frame(i):
+            start = i * step
+            data = {name: chunks[i] for name in self.container.target_signals}
+            self.container.update_chunk_data(start, start + self.window_sec, data)
+
+        return self._time_frames(frame)
+
+    def _run_resize(self) -> Dict[str, Any]:
+        width, height = self.size
+        sizes = [
+            (width, height),
+            (int(width * 0.75), height),
+            (int(width * 0.75), int(height * 0.8)),
+            (width, int(height * 0.8)),
+        ]
+        self._load_window()
+
+        def frame(i):
+            self.container.resize(*sizes[(i + 1) % len(sizes)])
+
+        try:
+            return self._time_frames(frame)
+        finally:
+            self.container.resize(*self.size)
+            self._render()
+
+    def _run_comments(self) -> Dict[str, Any]:
+        self._load_window()
+        offsets = np.linspace(0, self.window_sec, self.n_comments, endpoint=False)
+
+        def frame(i):
+            # Shift markers every frame so each refresh draws a new set
+            shift = (i % 2) * self.window_sec / (2 * max(1, self.n_comments))
+            comments = [
+                _Comment(f"Comment {k} at frame {i}", t + shift, bool(k % 2))
+                for k, t in enumerate(offsets)
+            ]
+            self.container.refresh_comment_display(comments)
+
+        try:
+            return self._time_frames(frame)
+        finally:
+            self.container.refresh_comment_display([])
+            self._render()
+
+    # ------------------------------------------------------------- helpers
+
+    def _load_window(self) -> None:
+        chunk = make_chunks(1, self.points, self.window_sec, 0.0)[0]
+        data = {name: chunk for name in self.container.target_signals}
+        self.container.update_chunk_data(0.0, self.window_sec, data)
+        self._render()
+
+    def _render(self) -> None:
+        """Deliver pending events (layout, scene updates) and paint the container."""
+        self.app.processEvents()
+        self.container.repaint()
+
+    def _time_frames(self, frame) -> Dict[str, Any]:
+        """Run warmup + frames calls of frame(i), timing update and paint."""
+        update_ms = []
+        paint_ms = []
+        for i in range(self.warmup + self.frames):
+            t0 = time.perf_counter()
+            frame(i)
+            t1 = time.perf_counter()
+            self._render()
+            t2 = time.perf_counter()
+            if i >= self.warmup:
+                update_ms.append((t1 - t0) * 1e3)
+                paint_ms.append((t2 - t1) * 1e3)
+
+        frame_ms = np.add(update_ms, paint_ms)
+        return {
+            "frames": self.frames,
+            "frame_ms": percentiles(frame_ms),
+            "update_ms": percentiles(update_ms),
+            "paint_ms": percentiles(paint_ms),
+            "fps_p50": 1e3 / float(np.median(frame_ms)) if len(frame_ms) else None,
+        }
+
+
+def run_rendering_benchmark(
+    plots: Sequence[int] = (4, 10),
+    points: Sequence[int] = (5000,),
+    comments: Sequence[int] = (10,),
+    scenarios: Sequence[str] = SCENARIOS,
+    progress=None,
+    **kwargs,
+) -> Dict[str, Any]:
+    """
+    Run every (plots, points, comments) combination and collect a report.
+
+    Args:
+        plots, points, comments: Values to sweep
+        scenarios: Scenario names (see SCENARIOS)
+        progress: Optional callable receiving each layout result
+        **kwargs: Passed to RenderingBenchmark (frames, warmup, window_sec, size)
+    """
+    app = _ensure_app()
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "environment": dict(environment_info(), qt_platform=app.platformName()),
+        "results": [],
+    }
+    for n_plots, n_points, n_comments in itertools.product(plots, points, comments):
+        bench = RenderingBenchmark(n_plots, n_points, n_comments, **kwargs)
+        result = bench.run(scenarios)
+        report["results"].append(result)
+        if progress is not None:
+            progress(result)
+    return report
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    layout = result["layout"]
+    head = (
+        f"{layout['plots']:>3} plots {layout['points']:>6} pts "
+        f"{layout['comments']:>3} comments"
+    )
+    lines = []
+    for name, stats in result["scenarios"].items():
+        if "error" in stats:
+            lines.append(f"{head}  {name:<8} ERROR {stats['error']}")
+            continue
+        frame = stats["frame_ms"]
+        lines.append(
+            f"{head}  {name:<8} p50 {frame['p50']:>7.2f} ms  "
+            f"p95 {frame['p95']:>7.2f} ms  p99 {frame['p99']:>7.2f} ms  "
+            f"(update {stats['update_ms']['p50']:.2f} / "
+            f"paint {stats['paint_ms']['p50']:.2f} ms)"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m aurora.benchmarks.rendering",
+        description="Time PlotContainerWidget frames under the offscreen platform.",
+    )
+    parser.add_argument("--plots", type=int, nargs="+", default=[4, 10, 16])
+    parser.add_argument("--points", type=int, nargs="+", default=[2000, 5000])
+    parser.add_argument("--comments", type=int, nargs="+", default=[10])
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--window-sec", type=float, default=60.0)
+    parser.add_argument("--width", type=int, default=1600)
+    parser.add_argument("--height", type=int, default=900)
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    parser.add_argument("--verbose", action="store_true", help="Keep app logging")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        # Read when the application logger is set up (on first use)
+        os.environ.setdefault("AURORA_LOG_LEVEL", "WARNING")
+        logging.getLogger().setLevel(logging.WARNING)
+
+    report = run_rendering_benchmark(
+        plots=args.plots,
+        points=args.points,
+        comments=args.comments,
+        scenarios=args.scenarios,
+        progress=lambda result: print(format_result(result), flush=True),
+        frames=args.frames,
+        warmup=args.warmup,
+        window_sec=args.window_sec,
+        size=(args.width, args.height),
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+    failed = any(
+        "error" in stats
+        for result in report["results"]
+        for stats in result["scenarios"].values()
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
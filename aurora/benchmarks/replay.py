@@ -0,0 +1,403 @@
+"""
+Headless replay of recorded navigation against ChunkLoader and DataManager.
+
+Reads a navigation log written with AURORA_NAV_RECORD (see
+aurora.core.navigation_log), opens the recording in a Session without a
+display and issues the same chunk requests with the recorded timing. Each
+request reports its latency until chunk_loaded, whether the tile cache
+served it, or that a newer request superseded it (the loader coalesces
+requests per consumer, as in the viewer).
+
+Chunk-loading settings default to the ones recorded in the log and can be
+overridden; several values per option are run as a sweep:
+
+    python -m aurora.benchmarks.replay session.jsonl --cache-mb 32 128 --prefetch on off
+
+Every configuration runs in a fresh Session. Decoded channels are loaded
+once before the first run, so all runs start with the same disk cache and
+differ only in the settings being tuned.
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from aurora.benchmarks.measure import counter_delta, percentiles
+from aurora.benchmarks.peak_detection import environment_info
+from aurora.core.config_manager import get_config_manager
+from aurora.core.navigation_log import read_navigation_log
+
+# Replay option -> session configuration key
+OVERRIDE_KEYS = {
+    "cache_mb": "chunk_cache_mb",
+    "prefetch": "prefetch_enabled",
+    "lod": "enable_lod_pyramid",
+    "throttle_ms": "throttle_delay_ms",
+    "max_points": "max_points_per_plot",
+    "prefetch_comment_windows": "prefetch_comment_windows",
+    "prefetch_scroll_step_sec": "prefetch_scroll_step_sec",
+}
+
+
+class NavigationReplay:
+    """
+    Replays navigation events on one recording and collects per-request results.
+
+    Args:
+        path: Recording to open (usually the header's "file")
+        events: Events from read_navigation_log
+        config: Session configuration overrides (e.g. chunk_cache_mb)
+        channels: Channels to select in the session (default: from events)
+        speed: Playback speed; 1.0 keeps the recorded timing, 0 sends each
+               request as soon as the previous one was answered
+        timeout_sec: Maximum wait for outstanding requests at the end
+    """
+
+    def __init__(
+        self,
+        path: str,
+        events: List[Dict[str, Any]],
+        config: Optional[Dict[str, Any]] = None,
+        channels: Optional[List[str]] = None,
+        speed: float = 1.0,
+        timeout_sec: float = 60.0,
+    ):
+        self.path = os.path.abspath(path)
+        self.events = events
+        self.config = dict(config or {})
+        self.channels = channels or sorted(
+            {ch for event in events for ch in event["channels"]}
+        )
+        self.speed = speed
+        self.timeout_sec = timeout_sec
+        self.session = None
+        self.requests: List[Dict[str, Any]] = []
+        self._latest_ids: Dict[str, int] = {}
+        self.logger = logging.getLogger("aurora.benchmarks.NavigationReplay")
+
+    def run(self) -> Dict[str, Any]:
+        """Replay every event in a new Session and return the summary."""
+        from PySide6.QtCore import QCoreApplication
+
+        from aurora.core.session import Session
+
+        self._app = QCoreApplication.instance() or QCoreApplication([])
+        self.session = Session(self.path, "replay")
+        for key, value in self.config.items():
+            self.session.update_config(key, value)
+        if not self.session.load_file(selected_channels=list(self.channels)):
+            raise RuntimeError(f"Could not open {self.path}")
+        loader = self.session.chunk_loader
+        if loader is None:
+            raise RuntimeError("ChunkLoader was not created")
+
+        self.requests = []
+        self._latest_ids = {}
+        by_id: Dict[int, Dict[str, Any]] = {}
+
+        def on_loaded(start, end, data, request_id):
+            request = by_id.get(request_id)
+            if request is not None and request["latency_ms"] is None:
+                request["latency_ms"] = (time.perf_counter() - request["issued"]) * 1e3
+
+        loader.chunk_loaded.connect(on_loaded)
+        before = self._cache_snapshot()
+        origin = time.perf_counter()
+        first_t = self.events[0]["t"] if self.events else 0.0
+        try:
+            for event in self.events:
+                if self.speed > 0:
+                    due = origin + (event["t"] - first_t) / self.speed
+                    self._spin_until(lambda: time.perf_counter() >= due, due)
+                elif self.requests:
+                    last = self.requests[-1]
+                    self._spin_until(
+                        lambda: last["latency_ms"] is not None
+                        or self._superseded(last),
+                        time.perf_counter() + self.timeout_sec,
+                    )
+
+                issued = time.perf_counter()
+                request_id = loader.request_chunk(
+                    event["channels"],
+                    event["start"],
+                    event["duration"],
+                    consumer=event.get("consumer", "tab"),
+                    **event["hr_params"],
+                )
+                request = {
+                    "id": request_id,
+                    "action": event["action"],
+                    "consumer": event.get("consumer", "tab"),
+                    "start": event["start"],
+                    "duration": event["duration"],
+                    "cache_hit": loader.last_request_cache_hit,
+                    "issued": issued,
+                    "latency_ms": None,
+                }
+                by_id[request_id] = request
+                self.requests.append(request)
+                self._latest_ids[request["consumer"]] = request_id
+
+            # Wait for the last request of every consumer
+            self._spin_until(
+                lambda: all(
+                    by_id[request_id]["latency_ms"] is not None
+                    for request_id in self._latest_ids.values()
+                ),
+                time.perf_counter() + self.timeout_sec,
+            )
+            replay_seconds = time.perf_counter() - origin
+            caches = counter_delta(before, self._cache_snapshot())
+        finally:
+            loader.chunk_loaded.disconnect(on_loaded)
+            self.session.close()
+
+        return self._summary(replay_seconds, caches)
+
+    # -------------------------------------------------------------- helpers
+
+    def _superseded(self, request: Dict[str, Any]) -> bool:
+        """A newer request of the same consumer exists (the result is dropped)."""
+        return self._latest_ids.get(request["consumer"], 0) > request["id"]
+
+    def _spin_until(self, done, deadline: float) -> None:
+        """Process events until done() or the deadline (perf_counter time)."""
+        from PySide6.QtCore import QEventLoop
+
+        while not done():
+            remaining_ms = int((deadline - time.perf_counter()) * 1000)
+            if remaining_ms <= 0:
+                return
+            self._app.processEvents(QEventLoop.AllEvents, min(remaining_ms, 5))
+            if not done():
+                time.sleep(min(remaining_ms, 1) / 1000.0)
+
+    def _cache_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        if self.session is None or self.session.data_manager is None:
+            return {}
+        return self.session.get_cache_stats()["caches"]
+
+    def _summary(
+        self, replay_seconds: float, caches: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        delivered = [r for r in self.requests if r["latency_ms"] is not None]
+        superseded = [
+            r for r in self.requests if r["latency_ms"] is None and self._superseded(r)
+        ]
+        hits = sum(1 for r in self.requests if r["cache_hit"])
+
+        by_action = defaultdict(list)
+        for request in delivered:
+            by_action[request["action"]].append(request["latency_ms"])
+
+        return {
+            "config": self.config,
+            "requests": len(self.requests),
+            "delivered": len(delivered),
+            "superseded": len(superseded),
+            "timed_out": len(self.requests) - len(delivered) - len(superseded),
+            "cache_hit_rate": hits / len(self.requests) if self.requests else None,
+            "latency_ms": percentiles(r["latency_ms"] for r in delivered),
+            "latency_ms_by_action": {
+                action: percentiles(values) for action, values in by_action.items()
+            },
+            "replay_seconds": replay_seconds,
+            "caches": caches,
+            "per_request": [
+                {k: v for k, v in r.items() if k != "issued"} for r in self.requests
+            ],
+        }
+
+
+def prime_disk_cache(path: str, events: List[Dict[str, Any]]) -> None:
+    """Decode every replayed channel once so runs share a warm disk cache."""
+    from aurora.data.data_manager import DataManager
+
+    data_manager = DataManager()
+    data_manager.load_file(path)
+    try:
+        loaded = set()
+        for event in events:
+            for channel in event["channels"]:
+                params = event["hr_params"] if channel.lower() == "hr_aurora" else {}
+                key = (channel, json.dumps(params, sort_keys=True, default=str))
+                if key not in loaded:
+                    loaded.add(key)
+                    data_manager.get_trace(path, channel, **params)
+    finally:
+        data_manager.unload_file(path)
+
+
+def run_replay(
+    log_path: str,
+    file_path: Optional[str] = None,
+    overrides: Optional[Dict[str, Sequence[Any]]] = None,
+    use_recorded_config: bool = True,
+    cache_dir: Optional[str] = None,
+    progress=None,
+    **replay_kwargs,
+) -> Dict[str, Any]:
+    """
+    Replay a navigation log once per combination of overridden settings.
+
+    Args:
+        log_path: Navigation log (JSON Lines)
+        file_path: Recording to open (default: the file named in the log)
+        overrides: Replay option (see OVERRIDE_KEYS) -> values to sweep
+        use_recorded_config: Start from the chunk-loading settings in the log
+        cache_dir: Disk cache directory (default: temporary)
+        progress: Optional callable receiving each run summary
+        **replay_kwargs: Passed to NavigationReplay (speed, timeout_sec)
+    """
+    header, events = read_navigation_log(log_path)
+    path = file_path or header["file"]
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Recording not found: {path} (use --file)")
+
+    base_config = {}
+    if use_recorded_config:
+        base_config = {
+            key: value
+            for key, value in header.get("config", {}).items()
+            if key in OVERRIDE_KEYS.values() and value is not None
+        }
+
+    overrides = {k: list(v) for k, v in (overrides or {}).items() if v}
+    names = list(overrides)
+    combinations = list(itertools.product(*(overrides[n] for n in names))) or [()]
+
+    temp_cache = None
+    if cache_dir is None:
+        cache_dir = temp_cache = tempfile.mkdtemp(prefix="aurora_replay_cache_")
+    # Must happen before the disk caches are first used
+    get_config_manager().update_disk_cache_settings(directory=cache_dir)
+
+    report = {
+        "benchmark": "navigation_replay",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment_info(),
+        "log": {
+            "path": os.path.abspath(log_path),
+            "recorded": header.get("recorded"),
+            "file": path,
+            "events": len(events),
+            "recorded_seconds": events[-1]["t"] - events[0]["t"] if events else 0.0,
+            "config": header.get("config", {}),
+        },
+        "runs": [],
+    }
+    try:
+        prime_disk_cache(path, events)
+        for values in combinations:
+            config = dict(base_config)
+            config.update(
+                {OVERRIDE_KEYS[name]: value for name, value in zip(names, values)}
+            )
+            replay = NavigationReplay(path, events, config=config, **replay_kwargs)
+            summary = replay.run()
+            report["runs"].append(summary)
+            if progress is not None:
+                progress(summary)
+    finally:
+        if temp_cache is not None:
+            shutil.rmtree(temp_cache, ignore_errors=True)
+    return report
+
+
+def format_run(summary: Dict[str, Any]) -> str:
+    config = " ".join(f"{k}={v}" for k, v in summary["config"].items()) or "recorded"
+    latency = summary["latency_ms"]
+    tiles = summary["caches"].get("chunk_tiles", {})
+    line = (
+        f"{config}\n"
+        f"  {summary['requests']} requests ({summary['delivered']} delivered, "
+        f"{summary['superseded']} superseded, {summary['timed_out']} timed out)"
+    )
+    if summary["cache_hit_rate"] is not None:
+        line += f", served from cache {summary['cache_hit_rate']:.0%}"
+    if tiles.get("hit_rate") is not None:
+        line += f", tile hit rate {tiles['hit_rate']:.0%}"
+    if latency:
+        line += (
+            f"\n  latency p50 {latency['p50']:.1f} / p95 {latency['p95']:.1f} / "
+            f"max {latency['max']:.1f} ms"
+        )
+    for action, stats in sorted(summary["latency_ms_by_action"].items()):
+        line += f"\n    {action:<12} p50 {stats['p50']:>8.1f} ms  p95 {stats['p95']:>8.1f} ms"
+    return line
+
+
+def _on_off(value: str) -> bool:
+    if value.lower() in ("on", "true", "1", "yes"):
+        return True
+    if value.lower() in ("off", "false", "0", "no"):
+        return False
+    raise argparse.ArgumentTypeError(f"expected on/off, got {value!r}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m aurora.benchmarks.replay",
+        description="Replay a navigation log and report latency and cache hits.",
+    )
+    parser.add_argument("log", help="Navigation log (AURORA_NAV_RECORD)")
+    parser.add_argument("--file", help="Recording to open instead of the logged one")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Playback speed (1 = recorded timing, 0 = wait for each chunk)",
+    )
+    parser.add_argument("--cache-mb", type=int, nargs="+")
+    parser.add_argument("--prefetch", type=_on_off, nargs="+")
+    parser.add_argument("--lod", type=_on_off, nargs="+")
+    parser.add_argument("--throttle-ms", type=int, nargs="+")
+    parser.add_argument("--max-points", type=int, nargs="+")
+    parser.add_argument("--prefetch-comment-windows", type=int, nargs="+")
+    parser.add_argument("--prefetch-scroll-step-sec", type=float, nargs="+")
+    parser.add_argument(
+        "--default-config",
+        action="store_true",
+        help="Start from the current defaults instead of the logged settings",
+    )
+    parser.add_argument("--cache-dir", help="Disk cache directory (default: temp)")
+    parser.add_argument("--timeout-sec", type=float, default=60.0)
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    parser.add_argument("--verbose", action="store_true", help="Keep app logging")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        # Read when the application logger is set up (on first use)
+        os.environ.setdefault("AURORA_LOG_LEVEL", "WARNING")
+        logging.getLogger().setLevel(logging.WARNING)
+
+    overrides = {name: getattr(args, name) for name in OVERRIDE_KEYS}
+    report = run_replay(
+        args.log,
+        file_path=args.file,
+        overrides=overrides,
+        use_recorded_config=not args.default_config,
+        cache_dir=args.cache_dir,
+        progress=lambda summary: print(format_run(summary), flush=True),
+        speed=args.speed,
+        timeout_sec=args.timeout_sec,
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, default=str)
+        print(f"Report written to {args.output}")
+    return 0 if all(run["timed_out"] == 0 for run in report["runs"]) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,303 @@
+"""
+Command line interface for batch processing without a display.
+
+Runs on the Qt-free data core (DataManager, HemodynamicAnalyzer,
+EDFExporter); PySide6 is never imported. Heavy modules are only imported by
+the command that needs them, so the interface starts quickly:
+
+    python -m aurora hr recording.edf --output hr.csv --method dwt
+    python -m aurora intervals recording.adicht --format json
+    python -m aurora export recording.adicht clean.edf --channels ECG FBP --start 60 --end 600
+
+Tables go to stdout unless --output is given; a short summary goes to
+stderr. Application logging goes to the log file only (--verbose also
+prints it). Decoded channels and R-peaks use the same disk caches as the
+application unless --no-cache is given.
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+# Options passed to DataManager.get_trace("hr_aurora") when given
+HR_PARAMS = ("method", "wavelet", "level", "min_rr_sec")
+
+INTERVAL_FIELDS = [
+    "tipo",
+    "evento",
+    "t_baseline",
+    "t_evento",
+    "t_recovery",
+    "t_tilt_down",
+]
+
+
+def _hr_params(args: argparse.Namespace) -> Dict[str, Any]:
+    """HR parameters given on the command line (the rest use the defaults)."""
+    return {
+        key: getattr(args, key) for key in HR_PARAMS if getattr(args, key) is not None
+    }
+
+
+def _open_recording(args: argparse.Namespace):
+    """Create a DataManager and load the recording; returns (manager, path)."""
+    from aurora.data.data_manager import DataManager
+
+    path = os.path.abspath(args.file)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File not found: {args.file}")
+    data_manager = DataManager()
+    data_manager.load_file(path)
+    return data_manager, path
+
+
+def _output_format(args: argparse.Namespace) -> str:
+    if args.format:
+        return args.format
+    if args.output and args.output.lower().endswith(".json"):
+        return "json"
+    return "csv"
+
+
+def _write_table(
+    args: argparse.Namespace, rows: List[Dict[str, Any]], fields: Sequence[str]
+) -> None:
+    """Write rows as CSV or JSON to --output or stdout."""
+    out = (
+        open(args.output, "w", newline="", encoding="utf-8")
+        if args.output
+        else sys.stdout
+    )
+    try:
+        if _output_format(args) == "json":
+            json.dump(rows, out, indent=2, default=str)
+            out.write("\n")
+        else:
+            writer = csv.DictWriter(out, fieldnames=list(fields), extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+def _value(x: float) -> Optional[float]:
+    """Plain float for output; NaN (invalid beat) becomes empty / null."""
+    x = float(x)
+    return None if math.isnan(x) else round(x, 6)
+
+
+def _status(message: str) -> None:
+    print(message, file=sys.stderr, flush=True)
+
+
+# ------------------------------------------------------------------ commands
+
+
+def cmd_hr(args: argparse.Namespace) -> int:
+    """Beat-to-beat HR (hr_aurora) of a recording's ECG."""
+    import numpy as np
+
+    from aurora.core.signal import HRAuroraSignal
+
+    data_manager, path = _open_recording(args)
+    t0 = time.perf_counter()
+    sig = data_manager.get_trace(path, "hr_aurora", **_hr_params(args))
+    seconds = time.perf_counter() - t0
+
+    if isinstance(sig, HRAuroraSignal):
+        beat_time = sig.time_start + sig.r_peaks[:-1] / sig.fs
+        rr = np.diff(sig.r_peaks) / sig.fs
+        rows = [
+            {"time_sec": _value(t), "rr_sec": _value(r), "hr_bpm": _value(hr)}
+            for t, r, hr in zip(beat_time, rr, sig.beat_hr)
+        ]
+        fields = ["time_sec", "rr_sec", "hr_bpm"]
+        valid = sig.beat_hr[~np.isnan(sig.beat_hr)]
+        summary = f"{len(sig.r_peaks)} R-peaks"
+        if len(valid):
+            summary += f", HR mean {valid.mean():.1f} bpm"
+            summary += f" (min {valid.min():.1f}, max {valid.max():.1f})"
+    else:
+        # HR channel provided by the file itself
+        rows = [
+            {"time_sec": _value(t), "hr_bpm": _value(hr)}
+            for t, hr in zip(sig.time, sig.data)
+        ]
+        fields = ["time_sec", "hr_bpm"]
+        summary = f"{len(rows)} HR samples"
+
+    _write_table(args, rows, fields)
+    _status(f"{os.path.basename(path)}: {summary} in {seconds:.2f} s")
+    return 0
+
+
+def cmd_intervals(args: argparse.Namespace) -> int:
+    """Protocol event intervals (Baseline/event/Recovery, tilt) from comments."""
+    data_manager, path = _open_recording(args)
+    intervals = data_manager.get_event_intervals(path, channel_names=args.channels)
+    _write_table(args, intervals, INTERVAL_FIELDS)
+    _status(f"{os.path.basename(path)}: {len(intervals)} interval(s)")
+    return 0
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    """Clean EDF+ export (selected channels, time range, filtered comments)."""
+    from aurora.data.edf_exporter import EDFExporter
+
+    data_manager, path = _open_recording(args)
+    channels = args.channels
+    if channels is None:
+        # Recorded channels; hr_aurora is exported only when asked for
+        channels = [
+            ch
+            for ch in data_manager.get_available_channels(path)
+            if ch.lower() not in ("hr_aurora", "hr_gen")
+        ]
+
+    time_range = None
+    if args.start is not None or args.end is not None:
+        end = args.end
+        if end is None:
+            end = max(data_manager.get_channel_duration(path, ch) for ch in channels)
+        time_range = (args.start or 0.0, end)
+
+    t0 = time.perf_counter()
+    output = EDFExporter(data_manager).export_clean_signals(
+        path,
+        args.output,
+        channels=channels,
+        excluded_comment_ids=set(args.exclude_comments or ()),
+        time_range=time_range,
+        resample_enable=not args.no_resample,
+        target_fs=args.target_fs,
+        patient_id=args.patient_id,
+        overwrite=True,
+        **_hr_params(args),
+    )
+    _status(
+        f"{os.path.basename(path)}: {len(channels)} channel(s) exported to {output} "
+        f"in {time.perf_counter() - t0:.2f} s"
+    )
+    return 0
+
+
+# ---------------------------------------------------------------- arguments
+
+
+def _add_hr_options(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("hr_aurora generation (default: settings)")
+    group.add_argument("--method", help="R-peak detection strategy (e.g. dwt, swt)")
+    group.add_argument("--wavelet", help="Wavelet of wavelet-based methods")
+    group.add_argument("--level", type=int, help="Wavelet decomposition level")
+    group.add_argument("--min-rr-sec", type=float, help="Minimum RR interval")
+
+
+def _add_output_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--output", "-o", help="Output file (default: stdout)")
+    parser.add_argument(
+        "--format",
+        choices=["csv", "json"],
+        help="Output format (default: from the --output extension, else csv)",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="aurora",
+        description="Batch processing of physiological recordings (no display needed).",
+    )
+    parser.add_argument(
+        "--cache-dir", help="Disk cache directory (default: application cache)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Do not use or write disk caches"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Print application logging"
+    )
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    commands.required = True
+
+    hr = commands.add_parser(
+        "hr", help="Beat-to-beat heart rate (hr_aurora) from the ECG"
+    )
+    hr.add_argument("file", help="Recording (.edf, .adicht)")
+    _add_output_options(hr)
+    _add_hr_options(hr)
+    hr.set_defaults(func=cmd_hr)
+
+    intervals = commands.add_parser(
+        "intervals",
+        help="Event intervals (Baseline/event/Recovery, tilt) from comments",
+    )
+    intervals.add_argument("file", help="Recording (.edf, .adicht)")
+    intervals.add_argument(
+        "--channels", nargs="+", help="Channels whose comments are read"
+    )
+    _add_output_options(intervals)
+    intervals.set_defaults(func=cmd_intervals)
+
+    export = commands.add_parser("export", help="Clean EDF+ export")
+    export.add_argument("file", help="Recording (.edf, .adicht)")
+    export.add_argument("output", help="EDF+ file to write")
+    export.add_argument(
+        "--channels", nargs="+", help="Channels (default: all recorded channels)"
+    )
+    export.add_argument("--start", type=float, help="Start time in seconds")
+    export.add_argument("--end", type=float, help="End time in seconds")
+    export.add_argument(
+        "--exclude-comments", type=int, nargs="+", metavar="ID", help="Comment IDs"
+    )
+    export.add_argument("--target-fs", type=float, help="Common sampling rate")
+    export.add_argument(
+        "--no-resample", action="store_true", help="Keep native sampling rates"
+    )
+    export.add_argument("--patient-id", default="AuroraClean")
+    _add_hr_options(export)
+    export.set_defaults(func=cmd_export)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if not args.verbose:
+        # Read when the application logger is set up (on first use)
+        os.environ.setdefault("AURORA_LOG_LEVEL", "WARNING")
+        os.environ.setdefault("AURORA_LOG_CONSOLE", "0")
+        os.environ.setdefault("MNE_LOGGING_LEVEL", "WARNING")
+
+    if args.cache_dir or args.no_cache:
+        from aurora.core.config_manager import get_config_manager
+
+        settings = {}
+        if args.cache_dir:
+            settings["directory"] = args.cache_dir
+        if args.no_cache:
+            settings.update(enabled=False, store_rpeaks=False)
+        # Must happen before the disk caches are first used
+        get_config_manager().update_disk_cache_settings(**settings)
+
+    try:
+        return args.func(args)
+    except BrokenPipeError:
+        # Output closed early (e.g. piped into head); silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError, KeyError, RuntimeError) as e:
+        _status(f"aurora {args.command}: error: {e}")
+        return 1
+    finally:
+        from aurora.core.logging_config import shutdown_logging
+
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
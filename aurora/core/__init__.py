@@ -9,6 +9,9 @@ from .logging_config import (
     shutdown_logging,
 )
 
+# Import tracing spans
+from .tracing import span, traced
+
 # Import config manager
 from .config_manager import get_config_manager
 
@@ -41,28 +41,28 @@ class EMSComment:
         return f"EMSComment(id={self.comment_id}, time={self.time:.2f}s, label='{self.label}' {tag}, text='{self.text}')"
 
 
-from PySide6.QtCore import QObject, Signal
+from aurora.core.events import Event
 from typing import Optional, List
 import bisect
 
 
-class CommentManager(QObject):
+class CommentManager:
     """
     Comment manager implementing CRUD operations with business logic.
     
     Architecture:
     - Implements CRUD operations directly
     - Accesses data through DataManager
-    - Emits change notifications for cache updates
+    - Emits change notifications for cache updates (Qt-free events,
+      connected to by DataManager)
     """
     
     # Change notification signals for DataManager cache updates
-    comment_created = Signal(str, object)  # (file_path, comment)
-    comment_updated = Signal(str, str, dict)  # (file_path, comment_id, updates)
-    comment_deleted = Signal(str, str)  # (file_path, comment_id)
+    comment_created = Event(str, object)  # (file_path, comment)
+    comment_updated = Event(str, str, dict)  # (file_path, comment_id, updates)
+    comment_deleted = Event(str, str)  # (file_path, comment_id)
     
     def __init__(self):
-        super().__init__()
         from aurora.core import get_user_logger
         self.logger = get_user_logger("CommentManager")
         self._data_manager = None  # Will be injected
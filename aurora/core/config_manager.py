@@ -36,6 +36,19 @@ class ConfigManager:
             "min_hr_bpm": 20,
             "max_hr_bpm": 250,
             "max_cache_size": 5,
+            # Segmented R-peak detection for long recordings (0 disables).
+            # Opt-in: thresholds are then computed per segment, not per recording
+            "segment_sec": 0.0,
+            "segment_overlap_sec": 5.0,
+            "detection_workers": 0,  # 0: one per CPU core
+            "detection_executor": "thread",  # "thread" or "process"
+            # Coarse-to-fine detection: decimate, detect, refine at full rate.
+            # Opt-in: peaks move to the raw-ECG maximum near each detection
+            "coarse_decimation": 1,  # 1 disables, e.g. 4 enables
+            "coarse_min_fs": 250.0,  # Never decimate below this rate
+            "coarse_refine_sec": 0.01,
+            # Cached wavelet/filter output reused when only thresholds change
+            "preprocess_cache_mb": 256,
         }
 
         # Analysis Settings -
@@ -48,10 +61,22 @@ class ConfigManager:
 
         # Chunk Loading Settings - Configuration for ChunkLoader
         self.chunk_loading: Dict[str, Any] = {
-            "cache_size": 50,
+            "cache_size_mb": 128,  # Memory bound of the chunk tile cache
             "max_points_per_plot": 5000,
             "throttle_delay_ms": 50,
             "enable_downsampling": True,
+            "enable_lod_pyramid": True,  # Min/max pyramid for zoomed-out windows
+            "prefetch_enabled": True,  # Load neighbouring windows in background
+            "prefetch_comment_windows": 4,  # Windows centred on nearest comments
+            "prefetch_scroll_step_sec": 5.0,  # Matches the plot wheel step
+        }
+
+        # Disk Cache Settings - Decoded channels persisted across sessions
+        self.disk_cache: Dict[str, Any] = {
+            "enabled": True,
+            "directory": "",  # Empty: <application root>/.aurora_cache
+            "max_size_mb": 2048,
+            "store_rpeaks": True,  # Keep detected/edited R-peaks under <dir>/rpeaks
         }
 
         # UI Limits -
@@ -73,8 +98,13 @@ class ConfigManager:
 
         # Session-specific settings that get copied to each session
         self.session_defaults: Dict[str, Any] = {
-            "chunk_cache_size": self.chunk_loading["cache_size"],
+            "chunk_cache_mb": self.chunk_loading["cache_size_mb"],
             "max_points_per_plot": self.chunk_loading["max_points_per_plot"],
+            "enable_lod_pyramid": self.chunk_loading["enable_lod_pyramid"],
+            "throttle_delay_ms": self.chunk_loading["throttle_delay_ms"],
+            "prefetch_enabled": self.chunk_loading["prefetch_enabled"],
+            "prefetch_comment_windows": self.chunk_loading["prefetch_comment_windows"],
+            "prefetch_scroll_step_sec": self.chunk_loading["prefetch_scroll_step_sec"],
         }
 
         # Peak Detection Parameters
@@ -172,6 +202,9 @@ class ConfigManagerSystem:
         if "peak_detection_params" in data:
             self.config.peak_detection_params.update(data["peak_detection_params"])
 
+        if "disk_cache" in data:
+            self.config.disk_cache.update(data["disk_cache"])
+
     def save_config(self) -> bool:
         """Save current configuration to JSON."""
         try:
@@ -281,6 +314,14 @@ class ConfigManagerSystem:
                 "high_cutoff": 40.0,
             },
             "simple_threshold": {**base_defaults, "threshold_std_multiplier": 2.0},
+            "pan_tompkins": {
+                "min_distance_sec": 0.2,  # Refractory period
+                "low_cutoff": 5.0,
+                "high_cutoff": 15.0,
+                "integration_sec": 0.15,
+                "t_wave_sec": 0.36,  # T-wave rejection window after a QRS
+                "learning_sec": 2.0,  # Threshold initialisation period
+            },
             "neurokit2": {**base_defaults, "correct_artifacts": False},
         }
 
@@ -324,6 +365,15 @@ class ConfigManagerSystem:
         self.config.chunk_loading.update(kwargs)
         self.logger.debug(f"Updated chunk loading settings: {kwargs}")
 
+    def get_disk_cache_settings(self) -> Dict[str, Any]:
+        """Get on-disk channel cache settings."""
+        return self.config.disk_cache.copy()
+
+    def update_disk_cache_settings(self, **kwargs):
+        """Update on-disk channel cache settings (read when the caches are created)."""
+        self.config.disk_cache.update(kwargs)
+        self.logger.debug(f"Updated disk cache settings: {kwargs}")
+
     def get_session_defaults(self) -> Dict[str, Any]:
         """Get default settings for new sessions."""
         return self.config.session_defaults.copy()
@@ -0,0 +1,88 @@
+"""
+Qt-free change notifications for the data core.
+
+DataManager and CommentManager declare their notifications as Event class
+attributes, with the same connect/disconnect/emit interface as a Qt Signal,
+so they work without PySide6 (scripts, the command line, servers without a
+display). Slots are called synchronously in the emitting thread. Bound
+methods are referenced weakly, so, as with Qt, connecting an object does not
+keep it alive and its slots go away with it.
+
+The GUI uses Qt adapters (e.g. aurora.data.qt_data_manager.QtDataManager)
+that redeclare the same names as Qt Signals; a subclass attribute takes
+precedence over the Event, so the core code emits Qt signals there and
+receivers get queued delivery across threads as usual:
+
+    class DataManager:
+        data_updated = Event(str, dict)  # file_path, metadata_dict
+
+    class QtDataManager(QObject, DataManager):
+        data_updated = Signal(str, dict)
+"""
+
+import threading
+import weakref
+from typing import Any, Callable, List, Optional
+
+
+class BoundEvent:
+    """The connected slots of one Event on one instance."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._slots: List[Callable[[], Optional[Callable[..., Any]]]] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _ref(slot: Callable[..., Any]) -> Callable[[], Optional[Callable[..., Any]]]:
+        if hasattr(slot, "__self__") and hasattr(slot, "__func__"):
+            return weakref.WeakMethod(slot)
+        return lambda: slot
+
+    def connect(self, slot: Callable[..., Any]) -> None:
+        with self._lock:
+            self._slots.append(self._ref(slot))
+
+    def disconnect(self, slot: Optional[Callable[..., Any]] = None) -> None:
+        """Disconnect one slot, or all slots if none is given."""
+        with self._lock:
+            if slot is None:
+                self._slots.clear()
+                return
+            for i, ref in enumerate(self._slots):
+                if ref() == slot:
+                    del self._slots[i]
+                    return
+        # Same exception type as disconnecting an unconnected Qt slot
+        raise RuntimeError(f"Slot is not connected to {self.name}")
+
+    def emit(self, *args: Any) -> None:
+        with self._lock:
+            slots = [ref() for ref in self._slots]
+            if None in slots:
+                self._slots = [ref for ref in self._slots if ref() is not None]
+        for slot in slots:
+            if slot is not None:
+                slot(*args)
+
+
+class Event:
+    """
+    Notification declared on a class, like a Qt Signal.
+
+    Args:
+        *types: Argument types (documentation only, mirrors the Qt Signal)
+    """
+
+    def __init__(self, *types: type):
+        self.types = types
+        self.name = ""
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        # Stored on the instance, which shadows this (non-data) descriptor
+        return instance.__dict__.setdefault(self.name, BoundEvent(self.name))
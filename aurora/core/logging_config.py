@@ -3,11 +3,19 @@ Unified logging configuration for AuroraWave.
 
 Provides rotating file handlers with configurable limits, user session tracking,
 and consistent formatting across all modules.
+
+Handlers run on a background thread: loggers only put records on a queue
+(QueueHandler) and a QueueListener formats and writes them, so logging at
+DEBUG does not block the GUI thread on disk I/O. Use lazy %-style arguments
+(logger.debug("Loaded %s in %.2fs", name, t)) on hot paths so the message is
+also formatted on that thread. AURORA_LOG_ASYNC=0 writes synchronously.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from pathlib import Path
 from typing import Optional, Dict
@@ -99,6 +107,12 @@ class AuroraLoggerConfig:
         """Get log level from environment variable or config."""
         return os.getenv('AURORA_LOG_LEVEL', cls.DEFAULT_CONFIG['log_level']).upper()
     
+    @classmethod
+    def should_log_async(cls) -> bool:
+        """Check if handlers should run on the background logging thread."""
+        env_async = os.getenv('AURORA_LOG_ASYNC', '').lower()
+        return env_async not in ('false', '0', 'no')
+    
     @classmethod
     def should_output_console(cls) -> bool:
         """Check if console output should be enabled."""
@@ -122,6 +136,21 @@ class AuroraLoggerConfig:
         config_dir.mkdir(parents=True, exist_ok=True)
         return config_dir
     
+    @classmethod
+    def get_cache_directory(cls) -> Path:
+        """
+        Get the on-disk cache directory path.
+        
+        Uses AURORA_CACHE_DIR when set, otherwise .aurora_cache/ in the
+        application root.
+        """
+        if env_dir := os.getenv('AURORA_CACHE_DIR'):
+            cache_dir = Path(env_dir)
+        else:
+            cache_dir = cls._get_application_root() / ".aurora_cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return cache_dir
+    
     @classmethod
     def generate_log_filename(cls) -> str:
         """
@@ -254,6 +283,29 @@ class UserContextFilter(logging.Filter):
         return True
 
 
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves message formatting to the listener thread.
+    
+    The standard QueueHandler merges msg and args before enqueueing. Here a
+    record is enqueued as is when its message is a string and its args are
+    immutable scalars; records with other args (which could change before the listener formats them)
+    or with exception info are prepared eagerly as usual.
+    """
+    
+    _IMMUTABLE_ARGS = (str, int, float, bool, type(None))
+    
+    def prepare(self, record):
+        args = record.args
+        if record.exc_info or not isinstance(record.msg, str) or (
+            args and not all(isinstance(a, self._IMMUTABLE_ARGS) for a in (
+                args.values() if isinstance(args, dict) else args
+            ))
+        ):
+            return super().prepare(record)
+        return record
+
+
 class PerformanceLoggerMixin:
     """Mixin for adding performance logging to operations."""
     
@@ -323,6 +375,9 @@ class UserSession:
 _logger_instance = None
 _current_session = None
 
+# Background thread running the file/console handlers (None when synchronous)
+_queue_listener = None
+
 
 def initialize_logging(user_id: str = None) -> UserSession:
     """
@@ -436,6 +491,7 @@ def _setup_global_logger():
     root_logger.setLevel(log_level)
     
     # Clear any existing handlers to avoid duplicates
+    _stop_queue_listener()
     root_logger.handlers.clear()
     
     # Setup rotating file handler with descriptive filename
@@ -481,9 +537,50 @@ def _setup_global_logger():
         # Add console handler to root logger
         root_logger.addHandler(console_handler)
     
+    if AuroraLoggerConfig.should_log_async():
+        _start_queue_listener(root_logger)
+    
     return root_logger
 
 
+def _start_queue_listener(root_logger: logging.Logger):
+    """Move the root handlers behind a queue served by a background thread."""
+    global _queue_listener
+    
+    handlers = list(root_logger.handlers)
+    if not handlers:
+        return
+    
+    log_queue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+    
+    root_logger.handlers.clear()
+    root_logger.addHandler(DeferredQueueHandler(log_queue))
+    
+    # Flush queued records at interpreter exit (the listener thread is a daemon)
+    atexit.register(_stop_queue_listener)
+
+
+def _stop_queue_listener():
+    """Write all queued records, stop the logging thread, log synchronously again."""
+    global _queue_listener
+    
+    listener, _queue_listener = _queue_listener, None
+    if listener is None:
+        return
+    listener.stop()
+    
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, DeferredQueueHandler):
+            root_logger.removeHandler(handler)
+    for handler in listener.handlers:
+        root_logger.addHandler(handler)
+
+
 def shutdown_logging():
     """Shutdown logging system and log session summary."""
     global _current_session
@@ -497,5 +594,6 @@ def shutdown_logging():
             f"actions: {_current_session.actions_count}"
         )
     
-    # Shutdown all handlers
+    # Write queued records, then shutdown all handlers
+    _stop_queue_listener()
     logging.shutdown()
\ No newline at end of file
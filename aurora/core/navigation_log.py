@@ -0,0 +1,194 @@
+"""
+Recording of viewer navigation for replay (see aurora.benchmarks.replay).
+
+While recording is enabled, every chunk request a visualization tab sends to
+its ChunkLoader is appended to a JSON Lines log, labelled with the user
+action that caused it (slider, spinbox, previous/next, comment jump,
+chunk-size or HR parameter change). The first line is a header describing
+the recording and the session configuration; channels and HR parameters are
+only written when they change:
+
+    {"format": "aurora-navigation", "version": 1, "file": "...", ...}
+    {"t": 0.0, "action": "initial", "consumer": "ViewerTab", "start": 0.0,
+     "duration": 60.0, "channels": ["ECG", "FBP"], "hr_params": {}}
+    {"t": 2.481, "action": "slider", "consumer": "ViewerTab", "start": 312.0,
+     "duration": 60.0}
+
+Recording is off by default. Setting AURORA_NAV_RECORD enables it:
+
+    AURORA_NAV_RECORD=1          logs/navigation/<time>_<file>.jsonl
+    AURORA_NAV_RECORD=<dir>      <dir>/<time>_<file>.jsonl
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+NAV_RECORD_ENV = "AURORA_NAV_RECORD"
+LOG_FORMAT = "aurora-navigation"
+LOG_VERSION = 1
+
+# Session configuration keys that affect chunk loading, kept in the header
+RECORDED_CONFIG_KEYS = (
+    "default_chunk_size",
+    "chunk_cache_mb",
+    "max_points_per_plot",
+    "enable_lod_pyramid",
+    "throttle_delay_ms",
+    "prefetch_enabled",
+    "prefetch_comment_windows",
+    "prefetch_scroll_step_sec",
+)
+
+
+class NavigationRecorder:
+    """
+    Appends navigation events of one session to a JSON Lines file.
+
+    Args:
+        path: Log file (created, or truncated if it exists)
+        header: Recording metadata written as the first line
+    """
+
+    def __init__(self, path: Path, header: Dict[str, Any]):
+        self.path = Path(path)
+        self.logger = logging.getLogger("aurora.core.NavigationRecorder")
+        self.events = 0
+        self._origin = time.perf_counter()
+        self._last: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Line buffered: the log stays usable if the application crashes
+        self._file = open(self.path, "w", encoding="utf-8", buffering=1)
+        self._write(
+            {
+                "format": LOG_FORMAT,
+                "version": LOG_VERSION,
+                "recorded": datetime.now().isoformat(timespec="seconds"),
+                **header,
+            }
+        )
+        self.logger.info(f"Recording navigation to {self.path}")
+
+    def record(
+        self,
+        action: str,
+        start_sec: float,
+        duration_sec: float,
+        channels: List[str],
+        hr_params: Optional[Dict[str, Any]] = None,
+        consumer: str = "tab",
+    ) -> None:
+        """Append one chunk request and the action that caused it."""
+        event = {
+            "t": round(time.perf_counter() - self._origin, 4),
+            "action": action,
+            "consumer": consumer,
+            "start": float(start_sec),
+            "duration": float(duration_sec),
+        }
+        channels = list(channels)
+        hr_params = dict(hr_params or {})
+        with self._lock:
+            if self._file is None:
+                return
+            last = self._last.setdefault(consumer, {})
+            if last.get("channels") != channels:
+                event["channels"] = last["channels"] = channels
+            if last.get("hr_params") != hr_params:
+                event["hr_params"] = last["hr_params"] = hr_params
+            self._write(event)
+            self.events += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+        self.logger.info(f"Recorded {self.events} navigation events to {self.path}")
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        try:
+            self._file.write(json.dumps(record, default=str) + "\n")
+        except OSError as e:
+            self.logger.warning(f"Navigation recording stopped: {e}")
+            self._file.close()
+            self._file = None
+
+
+def read_navigation_log(path: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Read a navigation log.
+
+    Returns:
+        (header, events); channels and hr_params are filled in on every event
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line for line in f if line.strip()]
+    if not lines:
+        raise ValueError(f"Empty navigation log: {path}")
+
+    header = json.loads(lines[0])
+    if header.get("format") != LOG_FORMAT:
+        raise ValueError(f"Not a navigation log: {path}")
+
+    events = []
+    state: Dict[str, Dict[str, Any]] = {}
+    for line in lines[1:]:
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            break  # Truncated last line of an interrupted recording
+        last = state.setdefault(event.get("consumer", "tab"), {})
+        for key, default in (("channels", []), ("hr_params", {})):
+            if key in event:
+                last[key] = event[key]
+            event[key] = last.get(key, default)
+        events.append(event)
+    return header, events
+
+
+def start_navigation_recording(session) -> Optional[NavigationRecorder]:
+    """Create a recorder for a loaded session if AURORA_NAV_RECORD is set."""
+    value = os.getenv(NAV_RECORD_ENV, "").strip()
+    if not value or value.lower() in ("0", "false", "no"):
+        return None
+
+    if value.lower() in ("1", "true", "yes"):
+        from aurora.core.logging_config import AuroraLoggerConfig
+
+        directory = AuroraLoggerConfig.get_log_directory() / "navigation"
+    else:
+        directory = Path(value)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = directory / f"{timestamp}_{session.display_name}.jsonl"
+    try:
+        duration = max(
+            session.data_manager.get_channel_duration(session.file_path, channel)
+            for channel in session.selected_channels
+        )
+    except Exception:
+        duration = None
+
+    header = {
+        "file": session.file_path,
+        "file_name": os.path.basename(session.file_path),
+        "duration_sec": duration,
+        "channels": list(session.selected_channels),
+        "config": {key: session.get_config(key) for key in RECORDED_CONFIG_KEYS},
+    }
+    try:
+        return NavigationRecorder(path, header)
+    except OSError as e:
+        logging.getLogger("aurora.core.NavigationRecorder").warning(
+            f"Navigation recording disabled: {e}"
+        )
+        return None
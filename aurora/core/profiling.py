@@ -0,0 +1,214 @@
+"""
+Automatic cProfile capture of slow operations.
+
+While profiling is enabled, every instrumented operation (a tracing span or
+@traced function, see aurora.core.tracing) runs under cProfile. When one
+takes longer than the threshold, its profile is saved under the log
+directory, next to a JSON file with the operation's name, duration and
+parameters:
+
+    logs/profiles/<time>_<operation>_<ms>ms.prof
+    logs/profiles/<time>_<operation>_<ms>ms.json
+
+Profiles open with `python -m pstats <file>` or snakeviz. One operation is
+profiled at a time in the whole process: nested spans are part of its
+profile, and operations starting on other threads meanwhile are not
+profiled. On Python 3.12+ cProfile is process-wide (sys.monitoring), so a
+profile also contains what other threads ran during the operation; the JSON
+file records this as "all_threads". cProfile slows Python code down
+noticeably, so this is a diagnostic mode:
+
+    AURORA_PROFILE=1              operations over 100 ms
+    AURORA_PROFILE=500            operations over 500 ms
+    AURORA_PROFILE_OPS=get_trace,EDFExporter
+                                  only operations whose name contains one
+                                  of these (default: all)
+"""
+
+import cProfile
+import json
+import logging
+import os
+import re
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from aurora.core import tracing
+
+PROFILE_ENV = "AURORA_PROFILE"
+PROFILE_OPS_ENV = "AURORA_PROFILE_OPS"
+DEFAULT_THRESHOLD_MS = 100
+DEFAULT_MAX_CAPTURES = 50
+# cProfile uses sys.monitoring from 3.12 on and then sees every thread
+PROFILES_ALL_THREADS = sys.version_info >= (3, 12)
+
+
+class SlowOperationProfiler:
+    """
+    Profiles instrumented operations and keeps the profiles of slow ones.
+
+    Args:
+        directory: Where profiles are written
+        threshold_ms: Minimum duration of a saved profile
+        operations: Substrings selecting the profiled operations (None: all)
+        max_captures: Profiles saved per process; later slow operations are
+                      only counted
+
+    Operations that start while another one is being profiled are counted in
+    `overlapped` and run unprofiled.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        threshold_ms: float = DEFAULT_THRESHOLD_MS,
+        operations: Optional[Sequence[str]] = None,
+        max_captures: int = DEFAULT_MAX_CAPTURES,
+    ):
+        self.directory = Path(directory)
+        self.threshold_ms = float(threshold_ms)
+        self.operations = tuple(operations) if operations else None
+        self.max_captures = max_captures
+        self.captures = 0
+        self.skipped = 0
+        self.overlapped = 0
+        self.logger = logging.getLogger("aurora.core.SlowOperationProfiler")
+        self._lock = threading.Lock()
+        self._active_thread: Optional[int] = None  # Thread being profiled
+
+    def start(self, name: str) -> Optional[cProfile.Profile]:
+        """Start profiling an operation; None if it is not profiled."""
+        if self.operations and not any(op in name for op in self.operations):
+            return None
+        thread = threading.get_ident()
+        with self._lock:
+            if self._active_thread is not None:
+                if self._active_thread != thread:
+                    self.overlapped += 1
+                return None  # Nested in, or concurrent with, a profiled operation
+            self._active_thread = thread
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler (e.g. a debugger's) is active
+            with self._lock:
+                self._active_thread = None
+            return None
+        return profile
+
+    def finish(
+        self,
+        profile: cProfile.Profile,
+        name: str,
+        duration_ns: int,
+        params: Dict[str, Any],
+    ) -> Optional[Path]:
+        """Stop profiling; saves the profile if the operation was slow."""
+        profile.disable()
+        with self._lock:
+            self._active_thread = None
+
+        duration_ms = duration_ns / 1e6
+        if duration_ms < self.threshold_ms:
+            return None
+        with self._lock:
+            if self.captures >= self.max_captures:
+                self.skipped += 1
+                return None
+            self.captures += 1
+
+        timestamp = datetime.now()
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", name)
+        stem = (
+            f"{timestamp.strftime('%Y%m%d_%H%M%S_%f')}_{safe_name}_{duration_ms:.0f}ms"
+        )
+        prof_path = self.directory / f"{stem}.prof"
+        metadata = {
+            "operation": name,
+            "duration_ms": duration_ms,
+            "threshold_ms": self.threshold_ms,
+            "params": params,
+            "thread": threading.current_thread().name,
+            "all_threads": PROFILES_ALL_THREADS,
+            "timestamp": timestamp.isoformat(timespec="milliseconds"),
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            profile.dump_stats(str(prof_path))
+            with open(prof_path.with_suffix(".json"), "w", encoding="utf-8") as f:
+                json.dump(metadata, f, indent=2, default=str)
+        except OSError as e:
+            self.logger.warning(f"Could not save profile of {name}: {e}")
+            return None
+
+        self.logger.warning(
+            f"SLOW: {name} took {duration_ms:.0f} ms, profile saved to {prof_path}"
+        )
+        return prof_path
+
+
+def is_profiling_enabled() -> bool:
+    return tracing._profiler is not None
+
+
+def enable_profiling(
+    threshold_ms: float = DEFAULT_THRESHOLD_MS,
+    directory: Optional[Path] = None,
+    operations: Optional[Sequence[str]] = None,
+    max_captures: int = DEFAULT_MAX_CAPTURES,
+) -> SlowOperationProfiler:
+    """
+    Start profiling instrumented operations (replacing any active profiler).
+
+    Args:
+        threshold_ms: Minimum duration of a saved profile
+        directory: Output directory; None uses <log directory>/profiles
+        operations: Substrings selecting the profiled operations (None: all)
+        max_captures: Profiles saved per process
+    """
+    if directory is None:
+        from aurora.core.logging_config import AuroraLoggerConfig
+
+        directory = AuroraLoggerConfig.get_log_directory() / "profiles"
+    profiler = SlowOperationProfiler(directory, threshold_ms, operations, max_captures)
+    tracing.set_profiler(profiler)
+    profiler.logger.info(
+        f"Profiling operations over {profiler.threshold_ms:.0f} ms into {directory}"
+    )
+    return profiler
+
+
+def disable_profiling() -> None:
+    tracing.set_profiler(None)
+
+
+def enable_profiling_from_env() -> Optional[SlowOperationProfiler]:
+    """Enable profiling if AURORA_PROFILE is set (1 or a threshold in ms)."""
+    logger = logging.getLogger("aurora.core.SlowOperationProfiler")
+    value = os.getenv(PROFILE_ENV, "").strip().lower()
+    if not value or value in ("0", "false", "no"):
+        return None
+    if value in ("1", "true", "yes"):
+        threshold_ms = DEFAULT_THRESHOLD_MS
+    else:
+        try:
+            threshold_ms = float(value)
+        except ValueError:
+            logger.warning(f"Ignoring {PROFILE_ENV}={value!r}: expected 1 or ms")
+            return None
+
+    operations = [
+        op.strip() for op in os.getenv(PROFILE_OPS_ENV, "").split(",") if op.strip()
+    ]
+    try:
+        return enable_profiling(threshold_ms, operations=operations or None)
+    except OSError as e:
+        logger.warning(f"Profiling disabled, no log directory: {e}")
+        return None
@@ -11,7 +11,8 @@ from pathlib import Path
 from PySide6.QtCore import QObject, Signal
 
 from aurora.core.config_manager import get_config_manager
-from aurora.data.data_manager import DataManager
+from aurora.core.navigation_log import start_navigation_recording
+from aurora.data.qt_data_manager import QtDataManager
 
 
 class Session(QObject):
@@ -49,7 +50,7 @@ class Session(QObject):
         # Exclusive components
         self.logger.debug(f"Creating DataManager instance...")
         try:
-            self.data_manager = DataManager()
+            self.data_manager = QtDataManager()
             self.logger.debug(f"DataManager created successfully")
         except Exception as e:
             self.logger.error(f"Failed to create DataManager: {e}", exc_info=True)
@@ -58,6 +59,9 @@ class Session(QObject):
         # Initialize ChunkLoader (will be created after successful file load)
         self.chunk_loader = None
 
+        # Navigation log for replay (AURORA_NAV_RECORD), created with ChunkLoader
+        self.navigation_recorder = None
+
         # Get processed config (defaults + JSON override if exists)
         self.logger.debug(f"Loading default configuration...")
         try:
@@ -81,53 +85,53 @@ class Session(QObject):
 
     def load_file(self,selected_channels: List[str] = None,config_file_path: Optional[str] = None) -> bool:
         
-        self.logger.info(f"=== SESSION LOAD_FILE STARTED ===")
-        self.logger.info(f"Session: {self.session_id}")
-        self.logger.info(f"File: {self.file_path}")
-        self.logger.debug(f"Selected channels requested: {selected_channels}")
-        self.logger.debug(f"Config file path: {config_file_path}")
+        self.logger.info("=== SESSION LOAD_FILE STARTED ===")
+        self.logger.info("Session: %s", self.session_id)
+        self.logger.info("File: %s", self.file_path)
+        self.logger.debug("Selected channels requested: %s", selected_channels)
+        self.logger.debug("Config file path: %s", config_file_path)
 
         try:
             self.last_accessed = datetime.now()
 
             # Verify file exists
-            self.logger.debug(f"Checking file existence...")
+            self.logger.debug("Checking file existence...")
             if not os.path.exists(self.file_path):
                 error_msg = f"File not found: {self.file_path}"
                 self.logger.error(error_msg)
                 raise FileNotFoundError(error_msg)
 
-            self.logger.info(
-                f"File exists - proceeding with DataManager.load_file()..."
-            )
+            self.logger.info("File exists - proceeding with DataManager.load_file()...")
 
             # Load file with DataManager
             try:
                 self.logger.debug(
-                    f"Calling data_manager.load_file({self.file_path})..."
+                    "Calling data_manager.load_file(%s)...", self.file_path
                 )
                 load_result = self.data_manager.load_file(self.file_path)
                 self.logger.info(
-                    f"data_manager.load_file() completed with result: {load_result}"
+                    "data_manager.load_file() completed with result: %s", load_result
                 )
             except Exception as e:
                 self.logger.error(
-                    f"Exception in data_manager.load_file(): {e}", exc_info=True
+                    "Exception in data_manager.load_file(): %s", e, exc_info=True
                 )
                 raise
 
             # Get available channels
-            self.logger.debug(f"Getting available channels...")
+            self.logger.debug("Getting available channels...")
             try:
                 available_channels = self.data_manager.get_available_channels(
                     self.file_path
                 )
                 self.logger.info(
-                    f"Available channels: {available_channels} (count: {len(available_channels) if available_channels else 0})"
+                    "Available channels: %s (count: %s)",
+                    available_channels,
+                    len(available_channels) if available_channels else 0,
                 )
             except Exception as e:
                 self.logger.error(
-                    f"Exception getting available channels: {e}", exc_info=True
+                    "Exception getting available channels: %s", e, exc_info=True
                 )
                 raise
 
@@ -137,7 +141,7 @@ class Session(QObject):
                 raise ValueError(error_msg)
 
             # Emit channels signal
-            self.logger.debug(f"Emitting channels_available signal...")
+            self.logger.debug("Emitting channels_available signal...")
             self.channels_available.emit(available_channels)
 
             # Channel selection logic: use config file or show dialog
@@ -145,7 +149,7 @@ class Session(QObject):
                 if config_file_path:
                     # Load channels from provided config file using static method
                     self.logger.info(
-                        f"Loading channels from config file: {config_file_path}"
+                        "Loading channels from config file: %s", config_file_path
                     )
                     try:
                         from aurora.core.config_manager import (
@@ -163,20 +167,22 @@ class Session(QObject):
                             ]
                             if valid_channels:
                                 self.logger.info(
-                                    f"Using {len(valid_channels)} channels from config file: {valid_channels}"
+                                    "Using %s channels from config file: %s",
+                                    len(valid_channels),
+                                    valid_channels,
                                 )
                                 selected_channels = valid_channels
                             else:
                                 self.logger.warning(
-                                    f"No valid channels found in config file, showing dialog"
+                                    "No valid channels found in config file, showing dialog"
                                 )
                         else:
                             self.logger.warning(
-                                f"No channels defined in config file, showing dialog"
+                                "No channels defined in config file, showing dialog"
                             )
 
                     except Exception as e:
-                        self.logger.error(f"Error loading config file: {e}")
+                        self.logger.error("Error loading config file: %s", e)
                         self.logger.info("Falling back to channel selection dialog")
 
                 # If no config file or config loading failed, show channel selection dialog
@@ -199,18 +205,21 @@ class Session(QObject):
                             return False
 
                         self.logger.info(
-                            f"User selected {len(selected_by_user)} channels: {selected_by_user}"
+                            "User selected %s channels: %s",
+                            len(selected_by_user),
+                            selected_by_user,
                         )
                         selected_channels = selected_by_user
 
                     except ImportError as e:
                         self.logger.warning(
-                            f"Could not import ChannelSelectionDialog: {e}"
+                            "Could not import ChannelSelectionDialog: %s", e
                         )
                         selected_channels = available_channels
                     except Exception as e:
                         self.logger.error(
-                            f"Error showing channel selection dialog: {e}",
+                            "Error showing channel selection dialog: %s",
+                            e,
                             exc_info=True,
                         )
                         selected_channels = available_channels
@@ -219,34 +228,37 @@ class Session(QObject):
             self.selected_channels = selected_channels
 
             self.config["visible_channels"] = self.selected_channels.copy()
-            self.logger.debug(f"Final selected channels: {self.selected_channels}")
+            self.logger.debug("Final selected channels: %s", self.selected_channels)
 
             # Initialize ChunkLoader now that file is loaded
-            self.logger.info(f"=== ATTEMPTING TO CREATE CHUNKLOADER ===")
+            self.logger.info("=== ATTEMPTING TO CREATE CHUNKLOADER ===")
             try:
                 from aurora.processing.chunk_loader import ChunkLoader
-                self.logger.info(f"ChunkLoader import successful")
+                self.logger.info("ChunkLoader import successful")
 
                 self.chunk_loader = ChunkLoader(self)
-                self.logger.info(f"ChunkLoader created successfully: {self.chunk_loader}")
+                self.logger.info("ChunkLoader created successfully: %s", self.chunk_loader)
             except Exception as e:
-                self.logger.error(f"Failed to create ChunkLoader: {e}")
+                self.logger.error("Failed to create ChunkLoader: %s", e)
                 import traceback
-                self.logger.error(f"ChunkLoader creation traceback:\n{traceback.format_exc()}")
+                self.logger.error("ChunkLoader creation traceback:\n%s", traceback.format_exc())
                 # Don't fail the entire session load if ChunkLoader fails
                 self.chunk_loader = None
 
+            if self.chunk_loader is not None and self.navigation_recorder is None:
+                self.navigation_recorder = start_navigation_recording(self)
+
             # Mark as loaded and emit ready signal
             self.is_loaded = True
-            self.logger.debug(f"Emitting session_ready signal...")
+            self.logger.debug("Emitting session_ready signal...")
             self.session_ready.emit()
 
-            self.logger.info(f"=== SESSION LOAD_FILE SUCCESS ===")
+            self.logger.info("=== SESSION LOAD_FILE SUCCESS ===")
             return True
 
         except Exception as e:
             error_msg = f"Failed to load session: {e}"
-            self.logger.error(f"=== SESSION LOAD_FILE FAILED ===")
+            self.logger.error("=== SESSION LOAD_FILE FAILED ===")
             self.logger.error(error_msg, exc_info=True)
             self.load_failed.emit(error_msg)
             return False
@@ -258,6 +270,10 @@ class Session(QObject):
                 self.chunk_loader.cleanup()
             self.chunk_loader = None
 
+            if self.navigation_recorder is not None:
+                self.navigation_recorder.close()
+                self.navigation_recorder = None
+
             # Clear DataManager cache for this file
             if self.data_manager and self.file_path:
                 self.data_manager.unload_file(self.file_path)
@@ -278,6 +294,28 @@ class Session(QObject):
             "channels_count": len(self.selected_channels),
             "creation_time": self.creation_time.isoformat(),
             "last_accessed": self.last_accessed.isoformat(),
+            "memory": self.get_cache_stats(),
+        }
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Memory held by this session's caches.
+
+        Returns:
+            Dict with "caches" (name -> entries, bytes, hits, misses, evictions,
+            ...) from DataManager and ChunkLoader, "total_bytes" (resident) and
+            "mapped_bytes" (memory-mapped from the disk cache)
+        """
+        caches = {}
+        if self.data_manager is not None:
+            caches.update(self.data_manager.get_cache_stats(self.file_path))
+        if self.chunk_loader is not None:
+            caches.update(self.chunk_loader.get_cache_stats())
+
+        return {
+            "caches": caches,
+            "total_bytes": sum(c.get("bytes", 0) for c in caches.values()),
+            "mapped_bytes": sum(c.get("mapped_bytes", 0) for c in caches.values()),
         }
 
     def get_config(self, key: str, default=None) -> Any:
@@ -42,20 +42,32 @@ class Signal:
     def time(self) -> np.ndarray:
         return self._time
 
+    def get_range(self, start_idx: int, stop_idx: int) -> np.ndarray:
+        """
+        Return samples [start_idx, stop_idx) without copying the full signal.
+        """
+        return self._data[max(0, int(start_idx)) : int(stop_idx)]
+
+    def get_time_range(self, start_idx: int, stop_idx: int) -> np.ndarray:
+        """
+        Return the time axis for samples [start_idx, stop_idx).
+        """
+        return self._time[max(0, int(start_idx)) : int(stop_idx)]
+
     def to_csv(self, filepath: str):
         """
         Export the signal (time, data) to a CSV file.
         """
-        arr = np.column_stack((self._time, self._data))
+        arr = np.column_stack((self.time, self.data))
         np.savetxt(filepath, arr, delimiter=",", header="time,data", comments="")
 
     def __len__(self):
         return len(self._data)
 
     def __str__(self):
-        n = len(self._data)
-        dur = (self._time[-1] - self._time[0]) if n > 1 else 0
-        preview = np.round(self._data[: min(10, n)], 3)
+        n = len(self)
+        dur = (n - 1) / self.fs if n > 1 else 0
+        preview = np.round(self.get_range(0, min(10, n)), 3)
         return (
             f"Signal '{self.name}': {n} samples, {dur:.2f}s, fs={self.fs}Hz\n"
             f"First data pts: {preview}"
@@ -66,6 +78,13 @@ class HRAuroraSignal(Signal):
     """
     Specialized Signal for derived HR: integrates R-peak detection
     and incremental HR updates.
+
+    HR is piecewise constant between consecutive R-peaks, so it is stored as a
+    beat series: r_peaks (ECG sample indices) and beat_hr, where beat_hr[i] is
+    the HR between r_peaks[i] and r_peaks[i + 1] (NaN if outside the validation
+    limits). Dense samples at the ECG rate are only materialized for the slice
+    requested through get_range(); data and time build the full-length arrays
+    on every access and are kept for backward compatibility.
     """
 
     def __init__(
@@ -76,10 +95,80 @@ class HRAuroraSignal(Signal):
         units: str,
         fs: float,
     ):
-        super().__init__(name=name, data=ecg_data, time=ecg_time, units=units, fs=fs)
+        # Only the length and time origin of the ECG are needed
+        super().__init__(
+            name=name,
+            data=np.array([], dtype=np.float32),
+            time=np.array([]),
+            units=units,
+            fs=fs,
+        )
+        self.n_samples = len(ecg_data)
+        self.time_start = float(ecg_time[0]) if len(ecg_time) else 0.0
         self.r_peaks = np.array([], dtype=int)
+        self.beat_hr = np.array([], dtype=np.float32)
         self.config_manager = get_config_manager()
 
+    @classmethod
+    def from_peaks(
+        cls,
+        name: str,
+        r_peaks: np.ndarray,
+        n_samples: int,
+        fs: float,
+        time_start: float = 0.0,
+        units: str = "bpm",
+    ) -> "HRAuroraSignal":
+        """Build the HR signal of an ECG from known R-peaks (no detection)."""
+        sig = cls(name=name, ecg_data=[], ecg_time=[], units=units, fs=fs)
+        sig.n_samples = int(n_samples)
+        sig.time_start = float(time_start)
+        sig.r_peaks = np.sort(np.asarray(r_peaks, dtype=int))
+        sig._generate_full_hr()
+        return sig
+
+    @property
+    def data(self) -> np.ndarray:
+        """Dense HR at the ECG rate (materialized on each access)."""
+        return self.get_range(0, self.n_samples)
+
+    @property
+    def time(self) -> np.ndarray:
+        """Time axis at the ECG rate (materialized on each access)."""
+        return self.get_time_range(0, self.n_samples)
+
+    def get_range(self, start_idx: int, stop_idx: int) -> np.ndarray:
+        """
+        Materialize dense HR samples [start_idx, stop_idx).
+
+        Only the beats overlapping the slice are located (searchsorted on
+        r_peaks) and expanded; samples before the first or after the last
+        R-peak are NaN.
+        """
+        start = max(0, int(start_idx))
+        stop = min(self.n_samples, int(stop_idx))
+        out = np.full(max(0, stop - start), np.nan, dtype=np.float32)
+        if start >= stop or len(self.r_peaks) < 2:
+            return out
+
+        # Beats i in [first, last) cover [r_peaks[i], r_peaks[i + 1])
+        first = max(0, np.searchsorted(self.r_peaks, start, side="right") - 1)
+        last = min(len(self.beat_hr), np.searchsorted(self.r_peaks, stop, side="left"))
+        if first >= last:
+            return out
+
+        bounds = np.clip(self.r_peaks[first : last + 1], start, stop) - start
+        out[bounds[0] : bounds[-1]] = np.repeat(
+            self.beat_hr[first:last], np.diff(bounds)
+        )
+        return out
+
+    def get_time_range(self, start_idx: int, stop_idx: int) -> np.ndarray:
+        """Time axis for samples [start_idx, stop_idx)."""
+        start = max(0, int(start_idx))
+        stop = min(self.n_samples, int(stop_idx))
+        return self.time_start + np.arange(start, max(start, stop)) / self.fs
+
     def set_r_peaks(self, ECG: Signal, **kargs):
         # Local import to avoid circular dependency
         from aurora.processing.ecg_analyzer import ECGAnalyzer
@@ -90,104 +179,136 @@ class HRAuroraSignal(Signal):
 
     def _generate_full_hr(self):
         """
-        Fill HR values between each pair of R-peaks using the current list of peaks.
-        Only fills intervals between consecutive peaks.
+        Compute the HR of every beat from the current list of peaks.
+        Only intervals between consecutive peaks have a value.
         """
-        if len(self.r_peaks) < 2:
-            self._data[:] = np.nan
-            return
-
-        hr_data = np.full_like(self._data, np.nan, dtype=np.float32)
-        for i in range(len(self.r_peaks) - 1):
-            start = int(self.r_peaks[i])
-            end = int(self.r_peaks[i + 1])
-            rr = (end - start) / self.fs
-            if rr <= 0:
-                continue
-            hr = 60.0 / rr
-            min_hr, max_hr = self.config_manager.get_hr_validation_limits()
-            if hr < min_hr or hr > max_hr:
-                hr = np.nan
-            if start < end:
-                hr_data[start:end] = hr
-        self._data = hr_data
         self.units = "bpm"
+        self.beat_hr = self._beat_hr_values(self.r_peaks[:-1], self.r_peaks[1:])
 
-    def add_peak(self, new_peak: int):
+    def _beat_hr_values(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
         """
-        Insert a new R-peak, update only the affected segments.
-        No duplicates allowed. Keeps r_peaks sorted.
+        HR (bpm) of the beats [starts[i], ends[i]) in one vectorized pass.
+        Empty intervals and values outside the validation limits are NaN.
         """
-        new_peak = int(new_peak)
-        if new_peak in self.r_peaks:
-            return
+        rr = (np.asarray(ends) - np.asarray(starts)) / self.fs
+        min_hr, max_hr = self.config_manager.get_hr_validation_limits()
+        with np.errstate(divide="ignore"):
+            hr = np.where(rr > 0, 60.0 / np.where(rr > 0, rr, 1.0), np.nan)
+        hr[(hr < min_hr) | (hr > max_hr)] = np.nan
+        return hr.astype(np.float32)
+
+    def apply_peak_edits(self, adds=(), deletes=(), moves=()):
+        """
+        Apply a batch of R-peak edits and recompute only the touched beats.
+
+        Indices in deletes and moves refer to r_peaks before the edit. The
+        surviving peaks and the sorted new positions are merged in one pass;
+        beats whose two bounding peaks are unchanged and still adjacent keep
+        their HR value.
+
+        Args:
+            adds: Sample indices of new peaks (existing positions are ignored)
+            deletes: Indices into r_peaks of peaks to remove
+            moves: (peak index, new sample index) pairs; a peak that is
+                   also deleted is only deleted
+
+        Returns:
+            tuple | None: Sample range (start, stop) whose HR may have changed,
+            or None if nothing changed
+        """
+        n = len(self.r_peaks)
+        keep = np.ones(n, dtype=bool)
+        new_positions = [int(p) for p in adds]
+        changed = []
+
+        for i in deletes:
+            i = int(i)
+            if 0 <= i < n and keep[i]:
+                keep[i] = False
+                changed.append(int(self.r_peaks[i]))
+        for i, new_index in moves:
+            i = int(i)
+            if 0 <= i < n and keep[i]:
+                keep[i] = False
+                changed.append(int(self.r_peaks[i]))
+                new_positions.append(int(new_index))
+
+        survivors = self.r_peaks[keep]
+        old_index = np.flatnonzero(keep)
+
+        # New positions not already occupied by a surviving peak
+        added = np.unique(np.asarray(new_positions, dtype=self.r_peaks.dtype))
+        slots = np.searchsorted(survivors, added)
+        occupied = slots < len(survivors)
+        occupied[occupied] = survivors[slots[occupied]] == added[occupied]
+        added = added[~occupied]
+        slots = slots[~occupied]
+        changed.extend(added.tolist())
+
+        if not changed:
+            return None
+
+        peaks = np.insert(survivors, slots, added)
+        origin = np.insert(old_index, slots, -1)
+
+        # A beat is untouched if both peaks survived and were already adjacent
+        beat_hr = np.empty(max(0, len(peaks) - 1), dtype=np.float32)
+        if len(beat_hr):
+            left = origin[:-1]
+            untouched = (left >= 0) & (origin[1:] == left + 1)
+            beat_hr[untouched] = self.beat_hr[left[untouched]]
+            touched = np.flatnonzero(~untouched)
+            beat_hr[touched] = self._beat_hr_values(peaks[touched], peaks[touched + 1])
 
-        # Insert and keep sorted
-        self.r_peaks = np.sort(np.append(self.r_peaks, new_peak))
+        self.r_peaks = peaks
+        self.beat_hr = beat_hr
+        self.units = "bpm"
 
-        # Find the position where it was inserted
-        i = np.searchsorted(self.r_peaks, new_peak)
+        # Changed beats extend to the neighbouring peaks of every edit
+        lo = np.searchsorted(peaks, min(changed), side="left") - 1
+        hi = np.searchsorted(peaks, max(changed), side="right")
+        start = int(peaks[lo]) if lo >= 0 else 0
+        stop = int(peaks[hi]) if hi < len(peaks) else self.n_samples
+        return start, stop
 
-        # Update the two adjacent segments (before and after the new peak)
-        if i > 0:
-            self._update_hr_segment(i - 1)
-        if i < len(self.r_peaks) - 1:
-            self._update_hr_segment(i)
+    def add_peak(self, new_peak: int):
+        """
+        Insert a new R-peak, update only the affected segments.
+        No duplicates allowed. Keeps r_peaks sorted.
+        """
+        self.apply_peak_edits(adds=[new_peak])
 
     def update_peak(self, i: int, new_index: int):
         """
         Modify an existing R-peak and update affected HR segments only.
         """
-        if not (0 <= i < len(self.r_peaks)):
-            return
-        self.r_peaks[i] = int(new_index)
-        self.r_peaks = np.sort(self.r_peaks)
-        # Update segments around the modified peak
-        if i > 0:
-            self._update_hr_segment(i - 1)
-        if i < len(self.r_peaks) - 1:
-            self._update_hr_segment(i)
-
-    def _update_hr_segment(self, i: int):
-        """
-        Recompute HR for interval between r_peaks[i] and r_peaks[i+1].
-        """
-        start = int(self.r_peaks[i])
-        end = int(self.r_peaks[i + 1])
-        rr = (end - start) / self.fs
-        if rr <= 0 or start >= end:
-            self._data[start:end] = np.nan
-            return
-        hr = 60.0 / rr
-        min_hr, max_hr = self.config_manager.get_hr_validation_limits()
-        if hr < min_hr or hr > max_hr:
-            hr = np.nan
-        self._data[start:end] = hr
+        self.apply_peak_edits(moves=[(i, new_index)])
 
     def delete_peak(self, peak_idx: int):
         """
         Remove the R-peak at the given index and update only affected HR segments.
         """
-        if not (0 <= peak_idx < len(self.r_peaks)):
-            return
-        self.r_peaks = np.delete(self.r_peaks, peak_idx)
-        # Update both neighboring segments if possible
-        if peak_idx > 0 and peak_idx < len(self.r_peaks):
-            self._update_hr_segment(peak_idx - 1)
-        if peak_idx < len(self.r_peaks) - 1:
-            self._update_hr_segment(peak_idx)
+        self.apply_peak_edits(deletes=[peak_idx])
 
     def get_hr_signal(self):
         if len(self.r_peaks) < 2:
             return None
         return Signal(
             name=f"{self.name}_HRgen",
-            data=self._data.copy(),
-            time=self._time.copy(),
+            data=self.data,
+            time=self.time,
             units="bpm",
             fs=self.fs,
         )
 
+    def __len__(self):
+        return self.n_samples
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the beat series."""
+        return self.r_peaks.nbytes + self.beat_hr.nbytes
+
 
 # Alias retrocompatibilidad
 HR_Gen_Signal = HRAuroraSignal
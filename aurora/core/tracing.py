@@ -0,0 +1,340 @@
+"""
+Lightweight tracing spans with Chrome trace / Perfetto export.
+
+Hot paths are wrapped in spans:
+
+    from aurora.core.tracing import span, traced
+
+    with span("ChunkLoader.request_chunk", channels=3) as sp:
+        ...
+        sp.set(cache_hit=True)
+
+    @traced("ECGAnalyzer.detect_rr_peaks")
+    def detect_rr_peaks(...):
+        ...
+
+Tracing is off by default: span() then returns a shared no-op object and
+traced functions only pay two global lookups. Setting AURORA_TRACE enables it
+for the whole process:
+
+    AURORA_TRACE=1              trace written to logs/aurora_trace_<time>.json
+    AURORA_TRACE=/tmp/run.json  trace written to that path
+
+The file is written at interpreter exit (or by disable_tracing/write_trace)
+in the Chrome trace event format, which chrome://tracing and
+https://ui.perfetto.dev open directly. Spans from worker threads appear on
+their own tracks.
+
+The same spans are the operations profiled by aurora.core.profiling
+(AURORA_PROFILE), which works with or without tracing.
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+TRACE_ENV = "AURORA_TRACE"
+DEFAULT_MAX_EVENTS = 1_000_000
+
+
+class Tracer:
+    """
+    Collects complete ("X") and instant ("i") trace events in memory.
+
+    Events are appended without locking (list.append is atomic) and capped at
+    max_events; later events are counted as dropped.
+    """
+
+    def __init__(
+        self, path: Optional[Path] = None, max_events: int = DEFAULT_MAX_EVENTS
+    ):
+        self.path = Path(path) if path else None
+        self.max_events = int(max_events)
+        self.events: List[Dict[str, Any]] = []
+        self.dropped = 0
+        self.pid = os.getpid()
+        self._origin_ns = time.perf_counter_ns()
+        self._thread_names: Dict[int, str] = {}
+
+    def add(
+        self,
+        name: str,
+        category: str,
+        start_ns: int,
+        end_ns: Optional[int] = None,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a span [start_ns, end_ns) or, without end_ns, an instant event."""
+        if len(self.events) >= self.max_events:
+            self.dropped += 1
+            return
+
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X" if end_ns is not None else "i",
+            "ts": (start_ns - self._origin_ns) / 1e3,
+            "pid": self.pid,
+            "tid": tid,
+        }
+        if end_ns is not None:
+            event["dur"] = (end_ns - start_ns) / 1e3
+        else:
+            event["s"] = "t"
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Trace in the Chrome trace event (JSON object) format."""
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self.pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in list(self._thread_names.items())
+        ]
+        return {
+            "traceEvents": metadata + list(self.events),
+            "displayTimeUnit": "ms",
+            "otherData": {"application": "AuroraWave", "dropped_events": self.dropped},
+        }
+
+    def write(self, path: Optional[Path] = None) -> Optional[Path]:
+        """Write the trace as JSON; returns the path written, or None on failure."""
+        path = Path(path) if path else self.path
+        if path is None:
+            return None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, default=str)
+        except OSError as e:
+            logging.getLogger("aurora.core.Tracer").warning(
+                f"Could not write trace to {path}: {e}"
+            )
+            return None
+        return path
+
+
+class _Span:
+    """Active span; records itself on exit (and hands over to the profiler)."""
+
+    __slots__ = (
+        "tracer",
+        "profiler",
+        "capture",
+        "name",
+        "category",
+        "args",
+        "start_ns",
+    )
+
+    def __init__(
+        self,
+        tracer: Optional[Tracer],
+        name: str,
+        category: str,
+        args: Dict,
+        profiler=None,
+    ):
+        self.tracer = tracer
+        self.profiler = profiler
+        self.capture = None
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def set(self, **args) -> None:
+        """Attach arguments known only after the span started."""
+        self.args.update(args)
+
+    def __enter__(self) -> "_Span":
+        if self.profiler is not None:
+            self.capture = self.profiler.start(self.name)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        if self.capture is not None:
+            self.profiler.finish(
+                self.capture, self.name, end_ns - self.start_ns, self.args
+            )
+        if self.tracer is not None:
+            self.tracer.add(self.name, self.category, self.start_ns, end_ns, self.args)
+        return False
+
+
+class _NullSpan:
+    """Shared span used while tracing is disabled."""
+
+    __slots__ = ()
+
+    def set(self, **args) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+# Active tracer; None while tracing is disabled
+_tracer: Optional[Tracer] = None
+
+# Slow-operation profiler (aurora.core.profiling); None while disabled
+_profiler = None
+
+
+def span(name: str, category: str = "aurora", **args):
+    """
+    Context manager timing a block as one trace event.
+
+    Args:
+        name: Event name (e.g. "DataManager.load_file")
+        category: Event category, used for filtering in the trace viewer
+        **args: Values shown with the event (keep them small and JSON-friendly)
+    """
+    tracer = _tracer
+    profiler = _profiler
+    if tracer is None and profiler is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, category, args, profiler)
+
+
+def traced(name: Optional[str] = None, category: str = "aurora") -> Callable:
+    """Decorator wrapping every call of a function in a span (default: qualname)."""
+
+    def decorate(func: Callable) -> Callable:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            profiler = _profiler
+            if tracer is None and profiler is None:
+                return func(*args, **kwargs)
+            # Call arguments are kept with profiles, not in the trace
+            params = _call_params(func, args, kwargs) if profiler is not None else {}
+            with _Span(tracer, label, category, params, profiler):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def _call_params(func: Callable, args, kwargs) -> Dict[str, Any]:
+    """Short reprs of a call's arguments (without self)."""
+    try:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+    except (TypeError, ValueError):
+        return {}
+    params = {}
+    for key, value in bound.arguments.items():
+        if key in ("self", "cls"):
+            continue
+        text = repr(value)
+        params[key] = text if len(text) <= 200 else text[:197] + "..."
+    return params
+
+
+def instant(name: str, category: str = "aurora", **args) -> None:
+    """Record a zero-duration event (e.g. a cache eviction)."""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.add(name, category, time.perf_counter_ns(), None, args)
+
+
+def is_tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def enable_tracing(
+    path: Optional[Path] = None, max_events: int = DEFAULT_MAX_EVENTS
+) -> Tracer:
+    """
+    Start collecting spans (replacing any active tracer).
+
+    Args:
+        path: Trace file written at exit; None uses the log directory
+        max_events: Maximum number of events kept in memory
+    """
+    global _tracer
+    if path is None:
+        from aurora.core.logging_config import AuroraLoggerConfig
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = AuroraLoggerConfig.get_log_directory() / f"aurora_trace_{timestamp}.json"
+    _tracer = Tracer(path, max_events)
+    return _tracer
+
+
+def disable_tracing(write: bool = True) -> Optional[Path]:
+    """Stop tracing; writes the collected trace unless write is False."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is None or not write:
+        return None
+    return tracer.write()
+
+
+def set_profiler(profiler) -> None:
+    """
+    Install the profiler run around spans (None removes it).
+
+    The profiler provides start(name) -> capture or None, and
+    finish(capture, name, duration_ns, args).
+    """
+    global _profiler
+    _profiler = profiler
+
+
+def write_trace(path: Optional[Path] = None) -> Optional[Path]:
+    """Write the events collected so far without stopping the tracer."""
+    tracer = _tracer
+    return tracer.write(path) if tracer is not None else None
+
+
+def _init_from_env() -> None:
+    if os.getenv("AURORA_PROFILE", "").strip():
+        from aurora.core.profiling import enable_profiling_from_env
+
+        enable_profiling_from_env()
+
+    value = os.getenv(TRACE_ENV, "").strip()
+    if not value or value.lower() in ("0", "false", "no"):
+        return
+    path = None if value.lower() in ("1", "true", "yes") else Path(value)
+    try:
+        enable_tracing(path)
+    except OSError as e:
+        logging.getLogger("aurora.core.Tracer").warning(
+            f"Tracing disabled, no trace directory: {e}"
+        )
+        return
+    atexit.register(disable_tracing)
+
+
+_init_from_env()
@@ -0,0 +1,377 @@
+"""
+Event-loop stall watchdog for the GUI thread.
+
+A heartbeat QTimer on the main thread records when the Qt event loop last ran.
+A sampler thread checks the heartbeat; once it is late by more than the
+threshold, the main thread's Python stack is captured (and sampled again
+while the stall lasts). When the loop resumes, the stall is logged with its
+duration and the active operation:
+
+    operation  outermost aurora function on the stack (usually the Qt slot,
+               e.g. MainWindow._execute_export)
+    location   innermost aurora function (where the time was spent)
+
+Stalls are aggregated per operation; the report is logged and written to
+logs/aurora_stalls_<time>.json when the watchdog stops.
+
+The watchdog is off by default. Setting AURORA_WATCHDOG enables it from
+aurora/main.py:
+
+    AURORA_WATCHDOG=1    stalls longer than 200 ms
+    AURORA_WATCHDOG=500  stalls longer than 500 ms
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+WATCHDOG_ENV = "AURORA_WATCHDOG"
+DEFAULT_THRESHOLD_MS = 200
+
+# Frames from these files count as aurora code when naming the operation
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_IGNORED_FILES = {
+    os.path.join(_PACKAGE_DIR, "main.py"),
+    os.path.abspath(__file__),
+}
+
+
+def _aurora_functions(frame) -> List[str]:
+    """Qualified names of the aurora functions on a stack, outermost first."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        filename = os.path.abspath(code.co_filename)
+        if filename.startswith(_PACKAGE_DIR) and filename not in _IGNORED_FILES:
+            name = getattr(code, "co_qualname", code.co_name)
+            if not names or names[-1] != name:
+                names.append(name)
+        frame = frame.f_back
+    names.reverse()
+    return names
+
+
+class StallWatchdog:
+    """
+    Detects GUI event-loop stalls and records where the main thread was.
+
+    Args:
+        threshold_ms: Minimum stall reported
+        report_path: JSON report written by stop() (None: log only)
+        max_samples: Stack samples kept per stall
+        max_stalls: Individual stalls kept for the report (aggregates are
+                    always complete)
+    """
+
+    def __init__(
+        self,
+        threshold_ms: int = DEFAULT_THRESHOLD_MS,
+        report_path: Optional[Path] = None,
+        max_samples: int = 20,
+        max_stalls: int = 500,
+    ):
+        self.threshold_ms = int(threshold_ms)
+        self.report_path = Path(report_path) if report_path else None
+        self.max_samples = max_samples
+        self.max_stalls = max_stalls
+        self.logger = logging.getLogger("aurora.core.StallWatchdog")
+
+        # Heartbeat every quarter threshold; the sampler polls at the same rate
+        self.interval_ms = max(10, self.threshold_ms // 4)
+        self._limit = (self.threshold_ms + self.interval_ms) / 1000.0
+
+        self.stalls: List[Dict[str, Any]] = []
+        self.summary: Dict[str, Dict[str, Any]] = {}
+        self.started_at: Optional[datetime] = None
+
+        self._lock = threading.Lock()
+        self._last_beat = time.monotonic()
+        self._current: Optional[Dict[str, Any]] = None
+        self._main_ident: Optional[int] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._timer = None
+
+    # ------------------------------------------------------------ lifecycle
+
+    def start(self) -> None:
+        """Start the heartbeat and sampler; call from the GUI thread."""
+        from PySide6.QtCore import QTimer
+
+        if self._thread is not None:
+            return
+        self._main_ident = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self.started_at = datetime.now()
+
+        self._timer = QTimer()
+        self._timer.setInterval(self.interval_ms)
+        self._timer.timeout.connect(self._beat)
+        self._timer.start()
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="aurora-stall-watchdog", daemon=True
+        )
+        self._thread.start()
+        self.logger.info(
+            f"Stall watchdog started (threshold {self.threshold_ms} ms, "
+            f"heartbeat {self.interval_ms} ms)"
+        )
+
+    def stop(self, write: bool = True) -> Dict[str, Any]:
+        """Stop watching, log the stall report and write it; returns the report."""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+        with self._lock:
+            stall, self._current = self._current, None
+        if stall is not None:
+            stall["duration_ms"] = (time.monotonic() - self._last_beat) * 1e3
+            self._finish(stall)
+
+        report = self.report()
+        self._log_report(report)
+        if write and self.report_path is not None:
+            self._write_report(report)
+        return report
+
+    # ------------------------------------------------------------- watching
+
+    def _beat(self) -> None:
+        """Heartbeat on the GUI thread; closes the stall in progress, if any."""
+        now = time.monotonic()
+        with self._lock:
+            gap = now - self._last_beat
+            self._last_beat = now
+            stall, self._current = self._current, None
+
+        if stall is not None:
+            stall["duration_ms"] = (gap * 1e3) - self.interval_ms
+            self._finish(stall)
+
+    def _run(self) -> None:
+        poll = self.interval_ms / 1000.0
+        while not self._stop_event.wait(poll):
+            now = time.monotonic()
+            with self._lock:
+                late = now - self._last_beat
+                stall = self._current
+                if late < self._limit:
+                    continue
+                if stall is None:
+                    stall = {
+                        "started": datetime.now().isoformat(timespec="milliseconds"),
+                        "samples": [],
+                        "last_sample": 0.0,
+                    }
+                    self._current = stall
+                elif (
+                    len(stall["samples"]) >= self.max_samples
+                    or now - stall["last_sample"] < self.threshold_ms / 1000.0
+                ):
+                    continue
+                stall["last_sample"] = now
+
+            sample = self._sample()
+            if sample is None:
+                continue
+            with self._lock:
+                if self._current is not stall:
+                    continue  # Loop resumed while sampling
+                first = not stall["samples"]
+                stall["samples"].append(sample)
+            if first:
+                self.logger.warning(
+                    f"Event loop blocked for {late * 1e3:.0f} ms in "
+                    f"{sample['operation']} ({sample['location']}), "
+                    f"main thread stack:\n{''.join(sample['stack'])}"
+                )
+
+    def _sample(self) -> Optional[Dict[str, Any]]:
+        frame = sys._current_frames().get(self._main_ident)
+        if frame is None:
+            return None
+        functions = _aurora_functions(frame)
+        return {
+            "operation": functions[0] if functions else "<outside aurora>",
+            "location": functions[-1] if functions else "<outside aurora>",
+            "stack": traceback.format_stack(frame),
+        }
+
+    def _finish(self, stall: Dict[str, Any]) -> None:
+        samples = stall.pop("samples")
+        stall.pop("last_sample", None)
+        if not samples:
+            # Shorter than one sampler poll past the threshold: nothing captured
+            return
+
+        operation = samples[0]["operation"]
+        locations = Counter(s["location"] for s in samples)
+        stall.update(
+            operation=operation,
+            locations=dict(locations),
+            stack=samples[0]["stack"],
+        )
+
+        with self._lock:
+            if len(self.stalls) < self.max_stalls:
+                self.stalls.append(stall)
+            entry = self.summary.setdefault(
+                operation,
+                {
+                    "operation": operation,
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "locations": Counter(),
+                    "stack": stall["stack"],
+                },
+            )
+            entry["count"] += 1
+            entry["total_ms"] += stall["duration_ms"]
+            if stall["duration_ms"] > entry["max_ms"]:
+                entry["max_ms"] = stall["duration_ms"]
+                entry["stack"] = stall["stack"]
+            entry["locations"].update(locations)
+
+        self.logger.warning(
+            f"Event loop stall of {stall['duration_ms']:.0f} ms in {operation} "
+            f"({locations.most_common(1)[0][0]})"
+        )
+
+    # ------------------------------------------------------------- reporting
+
+    def report(self) -> Dict[str, Any]:
+        """Stalls aggregated per operation, longest total first."""
+        with self._lock:
+            operations = sorted(
+                (
+                    dict(entry, locations=dict(entry["locations"].most_common()))
+                    for entry in self.summary.values()
+                ),
+                key=lambda entry: entry["total_ms"],
+                reverse=True,
+            )
+            stalls = list(self.stalls)
+        return {
+            "started": (
+                self.started_at.isoformat(timespec="seconds")
+                if self.started_at
+                else None
+            ),
+            "threshold_ms": self.threshold_ms,
+            "stall_count": sum(entry["count"] for entry in operations),
+            "total_ms": sum(entry["total_ms"] for entry in operations),
+            "operations": operations,
+            "stalls": stalls,
+        }
+
+    def _log_report(self, report: Dict[str, Any]) -> None:
+        if not report["stall_count"]:
+            self.logger.info(f"No event loop stalls over {self.threshold_ms} ms")
+            return
+        lines = [
+            f"{report['stall_count']} event loop stall(s) over "
+            f"{self.threshold_ms} ms, {report['total_ms'] / 1e3:.1f} s in total:"
+        ]
+        for entry in report["operations"][:10]:
+            location = next(iter(entry["locations"]), "")
+            lines.append(
+                f"  {entry['operation']:<50} {entry['count']:>4}x "
+                f"total {entry['total_ms']:>9.0f} ms  max {entry['max_ms']:>8.0f} ms"
+                f"  ({location})"
+            )
+        self.logger.warning("\n".join(lines))
+
+    def _write_report(self, report: Dict[str, Any]) -> Optional[Path]:
+        try:
+            self.report_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.report_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, default=str)
+        except OSError as e:
+            self.logger.warning(
+                f"Could not write stall report to {self.report_path}: {e}"
+            )
+            return None
+        self.logger.info(f"Stall report written to {self.report_path}")
+        return self.report_path
+
+
+# Active watchdog; None while disabled
+_watchdog: Optional[StallWatchdog] = None
+
+
+def get_watchdog() -> Optional[StallWatchdog]:
+    return _watchdog
+
+
+def start_watchdog(
+    threshold_ms: int = DEFAULT_THRESHOLD_MS, report_path: Optional[Path] = None
+) -> StallWatchdog:
+    """
+    Start watching the event loop of the calling (GUI) thread.
+
+    Args:
+        threshold_ms: Minimum stall reported
+        report_path: Report file written at stop; None uses the log directory
+    """
+    global _watchdog
+    if _watchdog is not None:
+        _watchdog.stop(write=False)
+    if report_path is None:
+        from aurora.core.logging_config import AuroraLoggerConfig
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_path = (
+            AuroraLoggerConfig.get_log_directory() / f"aurora_stalls_{timestamp}.json"
+        )
+    _watchdog = StallWatchdog(threshold_ms, report_path)
+    _watchdog.start()
+    return _watchdog
+
+
+def stop_watchdog(write: bool = True) -> Optional[Dict[str, Any]]:
+    """Stop the watchdog and write its report; returns the report, if any."""
+    global _watchdog
+    watchdog, _watchdog = _watchdog, None
+    if watchdog is None:
+        return None
+    return watchdog.stop(write=write)
+
+
+def start_watchdog_from_env() -> Optional[StallWatchdog]:
+    """Start the watchdog if AURORA_WATCHDOG is set (1 or a threshold in ms)."""
+    value = os.getenv(WATCHDOG_ENV, "").strip().lower()
+    if not value or value in ("0", "false", "no"):
+        return None
+    if value in ("1", "true", "yes"):
+        threshold_ms = DEFAULT_THRESHOLD_MS
+    else:
+        try:
+            threshold_ms = int(value)
+        except ValueError:
+            logging.getLogger("aurora.core.StallWatchdog").warning(
+                f"Ignoring {WATCHDOG_ENV}={value!r}: expected 1 or milliseconds"
+            )
+            return None
+    try:
+        return start_watchdog(threshold_ms)
+    except OSError as e:
+        logging.getLogger("aurora.core.StallWatchdog").warning(
+            f"Stall watchdog disabled, no log directory: {e}"
+        )
+        return None
@@ -17,10 +17,7 @@ import logging
 from typing import List, Dict, Any, Optional
 
 
-from aurora.core.signal import (
-    Signal,
-    HR_Gen_Signal,
-)  # HR_Gen_Signal es alias retro; clase real HRAuroraSignal
+from aurora.core.signal import Signal
 from aurora.core.comments import EMSComment
 from aurora.data.base_loader import BaseLoader
 
@@ -37,6 +34,7 @@ class AditchLoader(BaseLoader):
         self.file_data = None
         self.metadata = {}
         self.comments = []
+        self._record_layouts = {}  # (channel, gap_length) -> record layout
         self.logger = logging.getLogger("aurora.data.AditchLoader")
 
     def load(self, path: str):
@@ -51,9 +49,11 @@ class AditchLoader(BaseLoader):
         self.logger.info(f"Loading .adicht file: {path}")
         self.path = path
         self.file_data = adi.read_file(path)
+        self._record_layouts = {}
         self.metadata = {
             "channels": [ch.name for ch in self.file_data.channels],
             "fs": {ch.name: int(round(ch.fs[0])) for ch in self.file_data.channels},
+            "units": {ch.name: ch.units for ch in self.file_data.channels},
             "n_records": self.file_data.n_records,
         }
 
@@ -114,29 +114,12 @@ class AditchLoader(BaseLoader):
         if upper in ("HR_GEN", "HR_AURORA") and "ECG" in self.metadata["channels"]:
             self.logger.info(f"Generating HR from ECG with parameters: {kwargs}")
             raw_sig = self.get_full_trace("ECG", gap_length)
-            wavelet = kwargs.get("wavelet", "haar")
-            swt_level = kwargs.get("swt_level", 4)
-            min_rr_sec = kwargs.get("min_rr_sec", 0.6)
-            hr_sig = HR_Gen_Signal(
-                name="hr_aurora",
-                ecg_data=raw_sig.data,
-                ecg_time=raw_sig.time,
-                units="bpm",
-                fs=raw_sig.fs,
-            )
-            hr_sig.set_r_peaks(
-                raw_sig, wavelet=wavelet, swt_level=swt_level, min_rr_sec=min_rr_sec
-            )
-            hr_sig.MarkerData = raw_sig.MarkerData
-            if "hr_aurora" not in [c.lower() for c in self.metadata.get("channels")]:
-                self.metadata.get("channels").append("hr_aurora")
+            hr_sig = self.derive_hr_signal(raw_sig, **kwargs)
             self.logger.debug(f"Current channels: {self.metadata.get('channels')}")
             return hr_sig
 
         # Regular channel loading
-        ch = next((c for c in self.file_data.channels if c.name == channel), None)
-        if ch is None:
-            raise ValueError(f"Channel '{channel}' not found in file.")
+        ch = self._get_channel(channel)
 
         # Concatenate all records
         fs = self.metadata["fs"][channel]
@@ -165,3 +148,89 @@ class AditchLoader(BaseLoader):
 
         self.logger.debug(f"Loaded signal '{channel}': {len(core)} samples at {fs}Hz")
         return sig
+
+    def _get_channel(self, channel: str):
+        """Return the adi channel object for a channel name."""
+        ch = next((c for c in self.file_data.channels if c.name == channel), None)
+        if ch is None:
+            raise ValueError(f"Channel '{channel}' not found in file.")
+        return ch
+
+    def _get_record_layout(self, channel: str, gap_length: int = 3):
+        """
+        Return where each record lives in the concatenated trace of get_full_trace().
+
+        Returns:
+            Tuple (layout, total) where layout is a list of
+            (record_id, offset, n_samples) and total is the concatenated length
+            (records plus zero gaps, before trimming the first and last second).
+        """
+        key = (channel, gap_length)
+        if key in self._record_layouts:
+            return self._record_layouts[key]
+
+        ch = self._get_channel(channel)
+        fs = self.metadata["fs"][channel]
+        total_records = self.metadata["n_records"]
+
+        layout = []
+        offset = 0
+        for rec_id in range(1, total_records + 1):
+            n_samples = int(ch.n_samples[rec_id - 1])
+            if n_samples <= 0:
+                continue
+            layout.append((rec_id, offset, n_samples))
+            offset += n_samples
+            if rec_id < total_records:
+                offset += gap_length * fs
+
+        self._record_layouts[key] = (layout, offset)
+        return layout, offset
+
+    def get_n_samples(self, channel: str, gap_length: int = 3) -> int:
+        """Return the number of core samples of a channel without decoding it."""
+        fs = self.metadata["fs"][channel]
+        _, total = self._get_record_layout(channel, gap_length)
+        return max(0, total - 2 * fs)
+
+    def read_range(
+        self, channel: str, start_sec: float, end_sec: float, gap_length: int = 3
+    ) -> np.ndarray:
+        """
+        Return core samples of a channel in [start_sec, end_sec), reading only the
+        records that overlap the window.
+
+        Matches get_full_trace(channel).data[int(start_sec*fs):int(end_sec*fs)],
+        including the zero gaps inserted between records.
+        """
+        ch = self._get_channel(channel)
+        fs = self.metadata["fs"][channel]
+        layout, total = self._get_record_layout(channel, gap_length)
+
+        core_len = max(0, total - 2 * fs)
+        start_idx = max(0, int(start_sec * fs))
+        end_idx = min(core_len, int(end_sec * fs))
+        if start_idx >= end_idx:
+            return np.array([])
+
+        # Core sample 0 is concatenated sample fs (first second is trimmed)
+        lo = fs + start_idx
+        hi = fs + end_idx
+        out = np.zeros(hi - lo)
+
+        for rec_id, offset, n_samples in layout:
+            a = max(lo, offset)
+            b = min(hi, offset + n_samples)
+            if a >= b:
+                continue
+            # adi sample indices are 1-based and stop_sample is inclusive
+            data = ch.get_data(
+                rec_id, start_sample=a - offset + 1, stop_sample=b - offset
+            )
+            if data is not None:
+                out[a - lo : b - lo] = data
+
+        self.logger.debug(
+            f"Read range '{channel}' [{start_sec:.2f}, {end_sec:.2f}]s: {len(out)} samples"
+        )
+        return out
@@ -4,12 +4,21 @@ Copied from Pyside for aurora structure.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import Any, List, Dict
+
+import numpy as np
+
+from aurora.core.config_manager import get_config_manager
+from aurora.core.signal import HRAuroraSignal, Signal
 
 
 class BaseLoader(ABC):
     """Abstract base class for data file loaders."""
-    
+
+    # Whether decoded channels may be persisted in the on-disk channel cache.
+    # Loaders that already memory-map their source data should set this False.
+    cacheable = True
+
     @abstractmethod
     def load(self, path: str):
         """Initialize loader and parse necessary file metadata."""
@@ -19,13 +28,75 @@ class BaseLoader(ABC):
     def get_metadata(self) -> Dict:
         """Return basic metadata about the file (channels, duration, fs, etc)."""
         pass
-        
+
     @abstractmethod
     def get_full_trace(self):
         """Return the complete signal (Signal or ECGSignal object)."""
         pass
 
+    @abstractmethod
+    def read_range(self, channel: str, start_sec: float, end_sec: float) -> np.ndarray:
+        """
+        Return the samples of a channel between start_sec and end_sec.
+
+        Must only decode the requested window, using the same time origin and
+        sample layout as get_full_trace(). Out-of-range requests are clamped and
+        may return an empty array.
+        """
+        pass
+
+    def get_n_samples(self, channel: str) -> int:
+        """Return the number of samples get_full_trace() would produce for a channel."""
+        return len(self.get_full_trace(channel))
+
     @abstractmethod
     def get_all_comments(self) -> List:
         """Return all EMS-style comments from the file."""
-        pass
\ No newline at end of file
+        pass
+
+    @staticmethod
+    def hr_detection_params(**kwargs) -> Dict[str, Any]:
+        """
+        Map hr_aurora parameters to ECGAnalyzer.detect_rr_peaks arguments.
+
+        method, wavelet, level (or its alias swt_level) and min_rr_sec are
+        taken from kwargs, falling back to the HR generation settings.
+        """
+        settings = get_config_manager().get_hr_generation_settings()
+        level = kwargs.get("level")
+        if level is None:
+            level = kwargs.get("swt_level")
+        return {
+            "method": kwargs.get("method") or settings.get("default_method", "dwt"),
+            "wavelet": kwargs.get("wavelet", settings["wavelet"]),
+            "level": settings["level"] if level is None else level,
+            "min_distance_sec": kwargs.get("min_rr_sec", settings["min_rr_sec"]),
+        }
+
+    def derive_hr_signal(self, ecg_signal: Signal, **kwargs) -> HRAuroraSignal:
+        """
+        Derive hr_aurora from an already loaded ECG Signal.
+
+        Only runs R-peak detection (no file access), so callers can read the
+        ECG under their I/O lock and detect outside it.
+
+        Args:
+            ecg_signal: Full ECG trace
+            **kwargs: hr_aurora parameters (see hr_detection_params)
+        """
+        hr_signal = HRAuroraSignal(
+            name="hr_aurora",
+            ecg_data=ecg_signal.data,
+            ecg_time=ecg_signal.time,
+            units="bpm",
+            fs=ecg_signal.fs,
+        )
+        hr_signal.set_r_peaks(ecg_signal, **self.hr_detection_params(**kwargs))
+        hr_signal.MarkerData = ecg_signal.MarkerData
+
+        # Expose hr_aurora as a channel of the file (retain compatibility)
+        metadata = self.get_metadata()
+        if "hr_aurora" not in [c.lower() for c in metadata["channels"]]:
+            metadata["channels"].append("hr_aurora")
+            metadata.setdefault("fs", {})["hr_aurora"] = hr_signal.fs
+        return hr_signal
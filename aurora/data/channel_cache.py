@@ -0,0 +1,350 @@
+"""
+Persistent on-disk cache of decoded channels.
+
+Decoded traces are stored as .npy files under <cache_root>/<fingerprint>/, where
+the fingerprint is derived from the source file path, size and modification
+time. Later opens of the same, unmodified recording memory-map the stored
+arrays instead of decoding them again. The cache is bounded by size and evicts
+the least recently used channel files first.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from aurora.core.config_manager import get_config_manager
+from aurora.core.logging_config import AuroraLoggerConfig
+from aurora.core.signal import Signal
+
+
+class ChannelDiskCache:
+    """
+    Size-bounded LRU cache of decoded channel arrays keyed by file fingerprint.
+
+    Layout:
+        <root>/<fingerprint>/meta.json      source info and per-channel metadata
+        <root>/<fingerprint>/<channel>.npy  decoded samples (memory-mapped on read)
+        <root>/<fingerprint>/<name>.npz     auxiliary arrays (e.g. LOD pyramids)
+
+    Least-recently-used order is tracked through the modification time of the
+    cached files, which is refreshed on every hit.
+    """
+
+    META_FILE = "meta.json"
+
+    def __init__(self, root: Path, max_size_bytes: int, enabled: bool = True):
+        self.root = Path(root)
+        self.max_size_bytes = int(max_size_bytes)
+        self.enabled = enabled
+        self.logger = logging.getLogger("aurora.data.ChannelDiskCache")
+        self._fingerprints: Dict[str, Tuple[int, int, str]] = {}
+        # (fingerprint, channel) -> (memmap, info) for maps opened this session
+        self._open_maps: Dict[Tuple[str, str], Tuple[np.ndarray, dict]] = {}
+
+    # ------------------------------------------------------------ public API
+
+    def load(self, path: str, channel: str) -> Optional[Signal]:
+        """
+        Return the cached Signal for a channel, or None on a miss.
+
+        The data array is a read-only memory map; the time axis is rebuilt from
+        the stored first timestamp and sampling frequency.
+        """
+        hit = self.load_array(path, channel)
+        if hit is None:
+            return None
+
+        data, info = hit
+        fs = info["fs"]
+        time = info["time_start"] + np.arange(len(data)) / fs
+        sig = Signal(name=channel, data=data, time=time, units=info["units"], fs=fs)
+        return sig
+
+    def load_array(self, path: str, channel: str) -> Optional[Tuple[np.ndarray, dict]]:
+        """Return (memory-mapped data, channel info) for a cached channel, or None."""
+        if not self.enabled:
+            return None
+
+        entry_dir = self._entry_dir(path)
+        if entry_dir is None:
+            return None
+
+        map_key = (entry_dir.name, channel)
+        if map_key in self._open_maps:
+            return self._open_maps[map_key]
+
+        info = self._read_meta(entry_dir).get("channels", {}).get(channel)
+        if info is None:
+            return None
+
+        npy_path = entry_dir / info["file"]
+        try:
+            data = np.load(npy_path, mmap_mode="r")
+            os.utime(npy_path)  # Mark as recently used
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Discarding unreadable cache file {npy_path}: {e}")
+            self._drop_channel(entry_dir, channel)
+            return None
+
+        self.logger.debug(f"Disk cache hit: {channel} ({len(data)} samples)")
+        self._open_maps[map_key] = (data, info)
+        return data, info
+
+    def store(self, path: str, channel: str, signal: Signal) -> None:
+        """Persist a decoded channel and enforce the size limit."""
+        if not self.enabled or len(signal.data) == 0:
+            return
+
+        entry_dir = self._entry_dir(path, create=True)
+        if entry_dir is None:
+            return
+
+        file_name = self._channel_file_name(channel)
+        npy_path = entry_dir / file_name
+        tmp_path = entry_dir / f"{file_name}.tmp"
+
+        try:
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.asarray(signal.data))
+            os.replace(tmp_path, npy_path)
+
+            meta = self._read_meta(entry_dir)
+            meta["source"] = os.path.abspath(path)
+            meta.setdefault("channels", {})[channel] = {
+                "file": file_name,
+                "fs": float(signal.fs),
+                "units": signal.units,
+                "time_start": float(signal.time[0]) if len(signal.time) else 0.0,
+            }
+            self._write_meta(entry_dir, meta)
+        except OSError as e:
+            self.logger.warning(f"Could not write disk cache for {channel}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        self.logger.debug(f"Disk cache stored: {channel} -> {npy_path}")
+        self.enforce_size_limit()
+
+    def load_aux(self, path: str, name: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Return auxiliary arrays stored for a file (e.g. LOD pyramids), or None.
+
+        Auxiliary entries share the fingerprint, size limit and LRU eviction of
+        decoded channels.
+        """
+        if not self.enabled:
+            return None
+
+        entry_dir = self._entry_dir(path)
+        if entry_dir is None:
+            return None
+
+        file_name = self._read_meta(entry_dir).get("aux", {}).get(name)
+        if file_name is None:
+            return None
+
+        npz_path = entry_dir / file_name
+        try:
+            with np.load(npz_path) as npz:
+                arrays = {key: npz[key] for key in npz.files}
+            os.utime(npz_path)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Discarding unreadable cache file {npz_path}: {e}")
+            return None
+        return arrays
+
+    def store_aux(self, path: str, name: str, **arrays: np.ndarray) -> None:
+        """Persist auxiliary arrays for a file under the given name."""
+        if not self.enabled:
+            return
+
+        entry_dir = self._entry_dir(path, create=True)
+        if entry_dir is None:
+            return
+
+        file_name = self._channel_file_name(name)[: -len(".npy")] + ".npz"
+        npz_path = entry_dir / file_name
+        tmp_path = entry_dir / f"{file_name}.tmp"
+
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, npz_path)
+
+            meta = self._read_meta(entry_dir)
+            meta["source"] = os.path.abspath(path)
+            meta.setdefault("aux", {})[name] = file_name
+            self._write_meta(entry_dir, meta)
+        except OSError as e:
+            self.logger.warning(f"Could not write disk cache entry {name}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        self.enforce_size_limit()
+
+    def enforce_size_limit(self) -> int:
+        """
+        Evict least recently used channel files until the cache fits its limit.
+
+        Returns:
+            int: Number of channel files removed
+        """
+        files = []
+        total = 0
+        for npy_path in self.root.glob("*/*.np[yz]"):
+            try:
+                st = npy_path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, npy_path))
+            total += st.st_size
+
+        if total <= self.max_size_bytes:
+            return 0
+
+        files.sort()
+        removed = 0
+        for _, size, npy_path in files:
+            if total <= self.max_size_bytes:
+                break
+            entry_dir = npy_path.parent
+            self._forget_maps(entry_dir.name)
+            meta = self._read_meta(entry_dir)
+            channels = meta.get("channels", {})
+            aux = meta.get("aux", {})
+            for name, info in list(channels.items()):
+                if info.get("file") == npy_path.name:
+                    del channels[name]
+            for name, file_name in list(aux.items()):
+                if file_name == npy_path.name:
+                    del aux[name]
+            try:
+                npy_path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+            if channels or aux:
+                self._write_meta(entry_dir, meta)
+            else:
+                self._remove_entry_dir(entry_dir)
+
+        self.logger.info(
+            f"Disk cache cleanup removed {removed} files, {total / 1e6:.1f} MB remain"
+        )
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        for entry_dir in self.root.glob("*"):
+            if entry_dir.is_dir():
+                self._remove_entry_dir(entry_dir)
+        self._fingerprints.clear()
+        self._open_maps.clear()
+
+    # -------------------------------------------------------------- helpers
+
+    def fingerprint(self, path: str) -> Optional[str]:
+        """Hash of absolute path, size and mtime; None if the file cannot be read."""
+        abs_path = os.path.abspath(path)
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            return None
+
+        cached = self._fingerprints.get(abs_path)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+
+        key = f"{abs_path}|{st.st_size}|{st.st_mtime_ns}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+        self._fingerprints[abs_path] = (st.st_size, st.st_mtime_ns, digest)
+        return digest
+
+    def _entry_dir(self, path: str, create: bool = False) -> Optional[Path]:
+        digest = self.fingerprint(path)
+        if digest is None:
+            return None
+        entry_dir = self.root / digest
+        if create:
+            try:
+                entry_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                self.logger.warning(f"Could not create disk cache directory: {e}")
+                return None
+        elif not entry_dir.is_dir():
+            return None
+        return entry_dir
+
+    @staticmethod
+    def _channel_file_name(channel: str) -> str:
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", channel)
+        suffix = hashlib.sha1(channel.encode("utf-8")).hexdigest()[:8]
+        return f"{safe}_{suffix}.npy"
+
+    def _read_meta(self, entry_dir: Path) -> Dict[str, Any]:
+        meta_path = entry_dir / self.META_FILE
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_meta(self, entry_dir: Path, meta: Dict[str, Any]) -> None:
+        meta_path = entry_dir / self.META_FILE
+        tmp_path = entry_dir / f"{self.META_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, meta_path)
+
+    def _forget_maps(self, digest: str) -> None:
+        for key in [k for k in self._open_maps if k[0] == digest]:
+            del self._open_maps[key]
+
+    def _drop_channel(self, entry_dir: Path, channel: str) -> None:
+        self._open_maps.pop((entry_dir.name, channel), None)
+        meta = self._read_meta(entry_dir)
+        info = meta.get("channels", {}).pop(channel, None)
+        if info is None:
+            return
+        (entry_dir / info["file"]).unlink(missing_ok=True)
+        try:
+            self._write_meta(entry_dir, meta)
+        except OSError:
+            pass
+
+    def _remove_entry_dir(self, entry_dir: Path) -> None:
+        for child in entry_dir.iterdir():
+            try:
+                child.unlink()
+            except OSError:
+                pass
+        try:
+            entry_dir.rmdir()
+        except OSError:
+            pass
+
+
+# Global instance
+_channel_disk_cache = None
+
+
+def get_channel_disk_cache() -> ChannelDiskCache:
+    """Get global on-disk channel cache configured from ConfigManager."""
+    global _channel_disk_cache
+    if _channel_disk_cache is None:
+        settings = get_config_manager().get_disk_cache_settings()
+        root = settings.get("directory") or AuroraLoggerConfig.get_cache_directory()
+        _channel_disk_cache = ChannelDiskCache(
+            root=Path(root),
+            max_size_bytes=int(settings["max_size_mb"]) * 1024 * 1024,
+            enabled=bool(settings["enabled"]),
+        )
+    return _channel_disk_cache
@@ -5,6 +5,10 @@ This module provides centralized data management capabilities for physiological
 It handles caching, signal extraction, and metadata management with support
 for multiple file formats and parameterized signal generation.
 
+It does not depend on Qt: change notifications are aurora.core.events.Event
+objects. The application uses QtDataManager (aurora.data.qt_data_manager),
+which emits the same notifications as Qt signals.
+
 Classes:
     DataManager: Main data management class with file loading, caching and signal extraction
 
@@ -16,22 +20,62 @@ Example:
 """
 
 import os
+import sys
+import mmap
 import bisect
+import hashlib
+import threading
+import time
+import numpy as np
 from collections import deque
+from concurrent.futures import Future
 from typing import Dict, Any, List, Optional, Tuple, Union, TYPE_CHECKING
 from pathlib import Path
-from PySide6.QtCore import QObject, Signal as QtSignal
 from aurora.core import get_user_logger, get_current_session
 from aurora.core.config_manager import get_config_manager
+from aurora.core.events import Event
+from aurora.core.logging_config import PerformanceLoggerMixin
+from aurora.core.tracing import span, traced
 from aurora.core.comments import get_comment_manager, EMSComment
+from aurora.core.signal import HRAuroraSignal
 from aurora.data.aditch_loader import AditchLoader
+from aurora.data.channel_cache import get_channel_disk_cache
 from aurora.data.edf_loader import EDFLoader
+from aurora.data.rpeak_store import canonical_hr_params, get_rpeak_store
 
 if TYPE_CHECKING:
     from aurora.core.signal import Signal
 
 
-class DataManager(QObject):
+def _is_memory_mapped(array: np.ndarray) -> bool:
+    """True if an array (or the array it views) is backed by a file mapping."""
+    while array is not None:
+        if isinstance(array, (np.memmap, mmap.mmap)):
+            return True
+        array = getattr(array, "base", None)
+    return False
+
+
+def signal_nbytes(sig: "Signal") -> Tuple[int, int]:
+    """
+    Memory held by a cached signal as (resident bytes, memory-mapped bytes).
+
+    hr_aurora keeps only its beat series (dense HR is materialized per request);
+    file channels hold data and time arrays, either decoded in RAM or mapped
+    from the on-disk channel cache.
+    """
+    if isinstance(sig, HRAuroraSignal):
+        return sig.nbytes, 0
+    resident = mapped = 0
+    for array in (sig._data, sig._time):
+        if _is_memory_mapped(array):
+            mapped += array.nbytes
+        else:
+            resident += array.nbytes
+    return resident, mapped
+
+
+class DataManager(PerformanceLoggerMixin):
     """
     Centralized data management for physiological signal files.
 
@@ -47,7 +91,7 @@ class DataManager(QObject):
         session: Current user session
         config_manager: Configuration manager instance
 
-    Signals:
+    Events (Qt signals in QtDataManager):
         data_updated: Emitted when data is loaded/updated (file_path, metadata_dict)
         metadata_changed: Emitted when metadata changes (file_path, metadata_dict)
 
@@ -58,15 +102,19 @@ class DataManager(QObject):
     >>> hr = dm.get_trace("/path/to/data.adicht", "hr_aurora", wavelet="db4", level=5)  # (formerly HR_gen)
     """
 
-    # Comment change notification signals
-    comments_changed = QtSignal(str)  # (file_path)
-    comment_added = QtSignal(str, object)  # (file_path, comment)
-    comment_updated = QtSignal(str, object)  # (file_path, comment)
-    comment_removed = QtSignal(str, str)  # (file_path, comment_id)
+    # Comment change notifications
+    comments_changed = Event(str)  # (file_path)
+    comment_added = Event(str, object)  # (file_path, comment)
+    comment_updated = Event(str, object)  # (file_path, comment)
+    comment_removed = Event(str, str)  # (file_path, comment_id)
 
-    # Qt Signals for data change notifications
-    data_updated = QtSignal(str, dict)  # file_path, metadata_dict
-    metadata_changed = QtSignal(str, dict)  # file_path, metadata_dict
+    # Data change notifications
+    data_updated = Event(str, dict)  # file_path, metadata_dict
+    metadata_changed = Event(str, dict)  # file_path, metadata_dict
+    hr_peaks_changed = Event(str)  # file_path (R-peaks of hr_aurora edited)
+
+    # In-memory caches reported by get_cache_stats
+    CACHE_NAMES = ("signal_cache", "hr_cache", "time_cache", "intervals_cache")
 
     def __init__(self) -> None:
         """
@@ -85,6 +133,12 @@ class DataManager(QObject):
         self.logger = get_user_logger(self.__class__.__name__)
         self.session = get_current_session()
         self.config_manager = get_config_manager()
+        self.disk_cache = get_channel_disk_cache()
+        self.rpeak_store = get_rpeak_store()
+        # Serializes loader access between the UI thread and background workers
+        self._io_lock = threading.RLock()
+        # Guards hr_cache / hr_cache_keys, used from the UI thread and workers
+        self._hr_cache_lock = threading.RLock()
 
         # Time range cache for performance optimization during navigation
         self._time_cache = (
@@ -92,6 +146,13 @@ class DataManager(QObject):
         )  # path -> {'start_time', 'end_time', 'comments', 'cache_version'}
         self._cache_version = 0  # Incremented when comments change
 
+        # Hit/miss/eviction counters of the in-memory caches (see get_cache_stats)
+        self._cache_counters: Dict[str, Dict[str, int]] = {
+            name: {"hits": 0, "misses": 0, "evictions": 0} for name in self.CACHE_NAMES
+        }
+        # Counters are bumped from ChunkLoader workers as well as the UI thread
+        self._stats_lock = threading.Lock()
+
         # Subscribe to CommentManager change notifications
         comment_manager = get_comment_manager()
         comment_manager.set_data_manager(self)  # Inject dependency
@@ -124,9 +185,10 @@ class DataManager(QObject):
         if path in self._files:
             return
 
-        loader = self._loader_registry[ext]()
-        loader.load(path)
-        max_hr_cache = self.config_manager.get_hr_cache_size()
+        t0 = time.perf_counter()
+        with span("DataManager.load_file", file=os.path.basename(path)):
+            loader = self._loader_registry[ext]()
+            loader.load(path)
 
         # Load comments directly from loader
         loaded_comments = loader.get_all_comments()
@@ -139,8 +201,10 @@ class DataManager(QObject):
             "metadata": loader.get_metadata(),
             "comments": loaded_comments,  # Sorted by time for binary search
             "id_to_comment": id_to_comment_map,  # Fast ID → Comment lookup
-            "hr_cache": {},  # dict: key (config tuple) -> Signal
-            "hr_cache_keys": deque(maxlen=max_hr_cache),  # order of keys for eviction
+            "hr_cache": {},  # dict: key (canonical config tuple) -> Signal
+            "hr_cache_keys": deque(),  # LRU order of hr_cache keys for eviction
+            "hr_pending": {},  # hr_cache key -> Future of a generation in progress
+            "ecg_hash": None,  # ECG content hash for the R-peak store
             "intervals_cache": None,  # Cache for extracted intervals
             "intervals_cache_key": None,  # Key for cache invalidation
         }
@@ -152,7 +216,7 @@ class DataManager(QObject):
                 for c in self._files[path]["metadata"]["channels"]
                 if c.lower() == "hr_aurora"
             )
-            sig = loader.get_full_trace(original_name)
+            sig = self._load_channel(path, original_name)
             self._files[path]["signal_cache"]["hr_aurora"] = sig
         elif "hr_gen" in meta_ch:
             original_name = next(
@@ -160,13 +224,21 @@ class DataManager(QObject):
                 for c in self._files[path]["metadata"]["channels"]
                 if c.lower() == "hr_gen"
             )
-            sig = loader.get_full_trace(original_name)
+            sig = self._load_channel(path, original_name)
             self._files[path]["signal_cache"]["hr_aurora"] = sig
 
+        self.log_operation(
+            "load_file",
+            time.perf_counter() - t0,
+            file=os.path.basename(path),
+            channel_count=len(self._files[path]["metadata"].get("channels", [])),
+        )
+
         # Emit data_updated signal with metadata for ChunkLoader
-        self.logger.debug(f"Emitting data_updated signal for: {path}")
+        self.logger.debug("Emitting data_updated signal for: %s", path)
         self.data_updated.emit(path, self._files[path]["metadata"])
 
+    @traced("DataManager.get_trace")
     def get_trace(self, path: str, channel: str, **kwargs) -> "Signal":
         """
                 Get a signal trace with optional parameterized generation.
@@ -180,6 +252,7 @@ class DataManager(QObject):
                     path: Absolute path to the loaded signal file
                     channel: Name of the signal channel to retrieve
                     **kwargs: Optional parameters for signal generation (used for hr_aurora / HR_gen)
+                        - method (str): R-peak detection strategy (default: "dwt")
                         - wavelet (str): Wavelet type for HR generation (default: "haar")
                         - level (int): Decomposition level (default: 4)
                         - min_rr_sec (float): Minimum RR interval in seconds (default: 0.6)
@@ -213,23 +286,43 @@ class DataManager(QObject):
         # Special handling for hr_aurora (parameterized)
         if channel.lower() == "hr_aurora":
             # Create a unique, hashable key from configuration
-            key = tuple(sorted(kwargs.items()))
+            key = self._hr_key(**kwargs)
             hr_cache = entry["hr_cache"]
-            hr_keys = entry["hr_cache_keys"]
 
             # If version for this config exists, return it
-            if key in hr_cache:
-                return hr_cache[key]
-
-            # Otherwise, generate, cache and manage eviction
-            sig = entry["loader"].get_full_trace(channel, **kwargs)
-            hr_cache[key] = sig
-            hr_keys.append(key)
-            # Enforce cache size
-            max_hr_cache = self.config_manager.get_hr_cache_size()
-            while len(hr_keys) > max_hr_cache:
-                old_key = hr_keys.popleft()
-                hr_cache.pop(old_key, None)
+            with self._hr_cache_lock:
+                sig = hr_cache.get(key)
+                if sig is not None:
+                    self._remember_hr(entry, key, sig)
+            if sig is not None:
+                self._count_cache("hr_cache", "hits")
+                return sig
+            self._count_cache("hr_cache", "misses")
+
+            # Otherwise load stored peaks or generate, then cache. The first
+            # caller generates; concurrent callers for the same key wait for it
+            with self._hr_cache_lock:
+                sig = hr_cache.get(key)
+                pending = entry["hr_pending"].get(key)
+                owner = sig is None and pending is None
+                if owner:
+                    pending = entry["hr_pending"][key] = Future()
+            if sig is not None:
+                return sig
+            if not owner:
+                return pending.result()
+
+            try:
+                sig = self._generate_hr(path, channel, **kwargs)
+            except BaseException as e:
+                with self._hr_cache_lock:
+                    del entry["hr_pending"][key]
+                pending.set_exception(e)
+                raise
+            with self._hr_cache_lock:
+                self._remember_hr(entry, key, sig)
+                del entry["hr_pending"][key]
+            pending.set_result(sig)
 
             # If config is default, update canonical hr_aurora in signal_cache
             if self._is_default_hr_config(**kwargs):
@@ -240,11 +333,12 @@ class DataManager(QObject):
                 ):
                     entry["metadata"]["channels"].append("hr_aurora")
                     self.logger.info(
-                        f"hr_aurora added to metadata from {path} file [default config]"
+                        "hr_aurora added to metadata from %s file [default config]",
+                        path,
                     )
                     # Emit metadata_changed signal when hr_aurora is added
                     self.logger.debug(
-                        f"Emitting metadata_changed signal for hr_aurora: {path}"
+                        "Emitting metadata_changed signal for hr_aurora: %s", path
                     )
                     self.metadata_changed.emit(path, entry["metadata"])
 
@@ -252,15 +346,316 @@ class DataManager(QObject):
 
         # Any other channel: load and cache if not already present
         if channel not in cache:
-            sig = entry["loader"].get_full_trace(channel)
-            cache[channel] = sig
+            self._count_cache("signal_cache", "misses")
+            cache[channel] = self._load_channel(path, channel)
+        else:
+            self._count_cache("signal_cache", "hits")
         return cache[channel]
 
+    def _generate_hr(self, path: str, channel: str, **kwargs) -> "Signal":
+        """
+        Build hr_aurora from stored R-peaks, or detect them and store them.
+
+        Only the ECG read holds the loader lock; detection runs outside it so
+        chunk workers keep reading other channels meanwhile.
+        """
+        entry = self._files[path]
+        loader = entry["loader"]
+        params = canonical_hr_params(**kwargs)
+        sig = self._load_stored_hr(path, params)
+        if sig is not None:
+            return sig
+
+        ecg_channel = self._find_ecg_channel(entry)
+        with span("DataManager.generate_hr", method=params["method"]):
+            if ecg_channel is None:
+                # Loader-specific fallback (e.g. an HR channel in the file)
+                with self._io_lock:
+                    sig = loader.get_full_trace(channel, **kwargs)
+            else:
+                ecg = self._load_channel(path, ecg_channel)
+                sig = loader.derive_hr_signal(ecg, **kwargs)
+        if isinstance(sig, HRAuroraSignal):
+            self._store_hr_peaks(path, params, sig, edited=False)
+        return sig
+
+    def _load_channel(self, path: str, channel: str) -> "Signal":
+        """
+        Decode a file channel, reusing the on-disk channel cache when possible.
+
+        A cache hit memory-maps the previously decoded samples; a miss decodes
+        through the loader and persists the result for later sessions.
+        """
+        entry = self._files[path]
+        loader = entry["loader"]
+        with self._io_lock, span("DataManager.load_channel", channel=channel) as sp:
+            if not getattr(loader, "cacheable", False):
+                return loader.get_full_trace(channel)
+
+            sig = self.disk_cache.load(path, channel)
+            sp.set(disk_cache_hit=sig is not None)
+            if sig is not None:
+                # Loaders attach file comments as marker data; keep that contract
+                sig.MarkerData = entry["comments"]
+                return sig
+
+            sig = loader.get_full_trace(channel)
+            self.disk_cache.store(path, channel, sig)
+            return sig
+
+    @staticmethod
+    def _hr_key(**kwargs) -> tuple:
+        """Hashable hr_cache key; equivalent parameter spellings share one key."""
+        return tuple(canonical_hr_params(**kwargs).items())
+
+    def _remember_hr(self, entry: Dict[str, Any], key: tuple, sig: "Signal") -> None:
+        """Insert or refresh an hr_cache entry, evicting least recently used ones."""
+        max_hr_cache = self.config_manager.get_hr_cache_size()
+        with self._hr_cache_lock:
+            hr_keys = entry["hr_cache_keys"]
+            if key in hr_keys:
+                hr_keys.remove(key)
+            hr_keys.append(key)
+            entry["hr_cache"][key] = sig
+
+            while len(hr_keys) > max_hr_cache:
+                old_key = hr_keys.popleft()
+                entry["hr_cache"].pop(old_key, None)
+                self._count_cache("hr_cache", "evictions")
+                self.logger.debug("Evicted hr_aurora %s from memory", old_key)
+
+    def _find_ecg_channel(self, entry: Dict[str, Any]) -> Optional[str]:
+        """Name of the ECG channel hr_aurora is derived from, if any."""
+        channels = entry["metadata"].get("channels", [])
+        for name in channels:
+            if name.upper() in ("ECG", "EKG"):
+                return name
+        for name in channels:
+            if "ECG" in name.upper() or "EKG" in name.upper():
+                return name
+        return None
+
+    def _ecg_fingerprint(self, path: str) -> Optional[str]:
+        """
+        Content hash of the ECG of a file (sampling rate, length and samples).
+
+        Computed once per loaded file by streaming the channel in blocks, so the
+        full ECG is never materialized just for hashing.
+        """
+        entry = self._files[path]
+        if entry["ecg_hash"] is not None:
+            return entry["ecg_hash"]
+
+        channel = self._find_ecg_channel(entry)
+        if channel is None:
+            return None
+
+        block = 1 << 20
+        try:
+            fs = entry["metadata"]["fs"][channel]
+            n_samples = self.get_n_samples(path, channel)
+            digest = hashlib.sha1(f"{float(fs)}|{n_samples}".encode("utf-8"))
+            for start in range(0, n_samples, block):
+                samples = self.read_samples(
+                    path, channel, start, min(n_samples, start + block)
+                )
+                samples = np.ascontiguousarray(samples, dtype=np.float64)
+                digest.update(memoryview(samples).cast("B"))
+        except Exception as e:
+            self.logger.warning("Could not hash ECG of %s: %s", path, e)
+            return None
+
+        entry["ecg_hash"] = digest.hexdigest()[:24]
+        return entry["ecg_hash"]
+
+    def _load_stored_hr(
+        self, path: str, params: Dict[str, Any]
+    ) -> Optional[HRAuroraSignal]:
+        """Rebuild hr_aurora from stored R-peaks, or None if none match."""
+        if not self.rpeak_store.enabled:
+            return None
+        ecg_hash = self._ecg_fingerprint(path)
+        if ecg_hash is None:
+            return None
+        stored = self.rpeak_store.load(ecg_hash, params)
+        if stored is None:
+            return None
+
+        entry = self._files[path]
+        sig = HRAuroraSignal.from_peaks(
+            "hr_aurora",
+            stored["peaks"],
+            n_samples=stored["n_samples"],
+            fs=stored["fs"],
+            time_start=stored["time_start"],
+        )
+        sig.MarkerData = entry["comments"]
+        # Same metadata update the loaders do when they generate hr_aurora
+        if not any(c.lower() == "hr_aurora" for c in entry["metadata"]["channels"]):
+            entry["metadata"]["channels"].append("hr_aurora")
+        self.logger.info(
+            "hr_aurora restored from %s stored R-peaks%s",
+            len(sig.r_peaks),
+            " (edited)" if stored["edited"] else "",
+        )
+        return sig
+
+    def _store_hr_peaks(
+        self, path: str, params: Dict[str, Any], sig: HRAuroraSignal, edited: bool
+    ) -> bool:
+        ecg_hash = self._ecg_fingerprint(path) if self.rpeak_store.enabled else None
+        if ecg_hash is None:
+            return False
+        self.rpeak_store.save(
+            ecg_hash,
+            params,
+            sig.r_peaks,
+            n_samples=len(sig),
+            fs=sig.fs,
+            time_start=sig.time_start,
+            edited=edited,
+        )
+        return True
+
+    def save_hr_peaks(self, path: str, **kwargs) -> bool:
+        """
+        Persist the current R-peaks of a cached hr_aurora as manually edited.
+
+        Call after editing peaks on the signal returned by get_trace (add_peak,
+        delete_peak, ...); later sessions then load the corrected peaks.
+        Emits hr_peaks_changed so views drop their cached hr_aurora tiles.
+
+        Returns:
+            bool: True if the peaks were written to the R-peak store
+        """
+        sig = self._files[path]["hr_cache"].get(self._hr_key(**kwargs))
+        if not isinstance(sig, HRAuroraSignal):
+            return False
+        saved = self._store_hr_peaks(
+            path, canonical_hr_params(**kwargs), sig, edited=True
+        )
+        self.hr_peaks_changed.emit(path)
+        return saved
+
+    def apply_hr_peak_edits(
+        self, path: str, adds=(), deletes=(), moves=(), **kwargs
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Apply a batch of R-peak corrections to hr_aurora and persist them.
+
+        See HRAuroraSignal.apply_peak_edits for the edit format.
+
+        Returns:
+            Sample range whose HR changed, or None if nothing changed
+        """
+        sig = self.get_trace(path, "hr_aurora", **kwargs)
+        if not isinstance(sig, HRAuroraSignal):
+            raise ValueError("hr_aurora of this file has no editable R-peaks")
+        changed = sig.apply_peak_edits(adds=adds, deletes=deletes, moves=moves)
+        if changed is not None:
+            self.save_hr_peaks(path, **kwargs)
+        return changed
+
+    def peek_trace(self, path: str, channel: str, **kwargs) -> Optional["Signal"]:
+        """
+        Get a trace only if it is already in memory; never loads or generates.
+
+        hr_aurora (or HR_gen) is looked up in the parameterized cache by kwargs.
+        """
+        entry = self._files.get(path)
+        if entry is None:
+            return None
+        if channel.lower() in ("hr_gen", "hr_aurora"):
+            return entry["hr_cache"].get(self._hr_key(**kwargs))
+        return entry["signal_cache"].get(channel)
+
+    def read_range(
+        self, path: str, channel: str, start_sec: float, end_sec: float
+    ) -> np.ndarray:
+        """
+        Get the samples of a raw channel within a time window.
+
+        Slices the cached full trace when one is already in memory; otherwise asks
+        the loader to decode only the requested window, so navigation never forces
+        the whole channel into signal_cache.
+
+        Args:
+            path: Absolute path to the loaded signal file
+            channel: Name of a file channel (derived hr_aurora must use get_trace)
+            start_sec: Window start in seconds
+            end_sec: Window end in seconds
+
+        Returns:
+            np.ndarray: Samples in [start_sec, end_sec), possibly empty
+        """
+        entry = self._files[path]
+        cache = entry["signal_cache"]
+
+        if channel in cache:
+            sig = cache[channel]
+            start_idx = max(0, int(start_sec * sig.fs))
+            end_idx = int(end_sec * sig.fs)
+            return sig.get_range(start_idx, end_idx)
+
+        # Previously decoded channel on disk: slice the memory map
+        loader = entry["loader"]
+        with self._io_lock:
+            if getattr(loader, "cacheable", False):
+                hit = self.disk_cache.load_array(path, channel)
+                if hit is not None:
+                    data, info = hit
+                    start_idx = max(0, int(start_sec * info["fs"]))
+                    end_idx = int(end_sec * info["fs"])
+                    return np.asarray(data[start_idx:end_idx])
+
+            return loader.read_range(channel, start_sec, end_sec)
+
+    def read_samples(
+        self, path: str, channel: str, start_idx: int, stop_idx: int
+    ) -> np.ndarray:
+        """
+        Get samples [start_idx, stop_idx) of a raw channel (see read_range).
+        """
+        fs = self._files[path]["metadata"]["fs"][channel]
+        # Half-sample offsets make int(sec * fs) land exactly on the indices
+        return self.read_range(
+            path, channel, (start_idx + 0.5) / fs, (stop_idx + 0.5) / fs
+        )
+
+    def get_n_samples(self, path: str, channel: str) -> int:
+        """Get the number of samples of a raw channel without decoding it."""
+        entry = self._files[path]
+        if channel in entry["signal_cache"]:
+            return len(entry["signal_cache"][channel])
+        with self._io_lock:
+            return entry["loader"].get_n_samples(channel)
+
+    def get_channel_duration(self, path: str, channel: str, **kwargs) -> float:
+        """
+        Get the duration in seconds of a channel, without decoding raw channels.
+
+        Derived hr_aurora channels are resolved through get_trace (with kwargs).
+        """
+        entry = self._files[path]
+        if (
+            channel.lower() in ("hr_gen", "hr_aurora")
+            or channel in entry["signal_cache"]
+        ):
+            sig = self.get_trace(path, channel, **kwargs)
+            n = len(sig)
+            if n < 2:
+                return 0.0
+            return float(sig.get_time_range(n - 1, n)[0] - sig.get_time_range(0, 1)[0])
+
+        fs = entry["metadata"]["fs"][channel]
+        n_samples = self.get_n_samples(path, channel)
+        return (n_samples - 1) / fs if n_samples > 1 else 0.0
+
     def promote_hr_as_main(self, path, hr_sig, **kwargs):
         """
         Promote a parameterized hr_aurora as the canonical hr_aurora in signal_cache.
         """
-        key = tuple(sorted(kwargs.items()))
+        key = self._hr_key(**kwargs)
         entry = self._files[path]
         # Save as canonical
         entry["signal_cache"]["hr_aurora"] = hr_sig
@@ -269,14 +664,14 @@ class DataManager(QObject):
             entry["metadata"]["channels"].append("hr_aurora")
             # Emit metadata_changed signal when hr_aurora is promoted
             self.logger.debug(
-                f"Emitting metadata_changed signal for promoted hr_aurora: {path}"
+                "Emitting metadata_changed signal for promoted hr_aurora: %s", path
             )
             self.metadata_changed.emit(path, entry["metadata"])
         # Update hr_cache and keys if not already present
-        if key not in entry["hr_cache"]:
-            entry["hr_cache"][key] = hr_sig
-            entry["hr_cache_keys"].append(key)
-        self.logger.info(f"Promoted hr_aurora with config {key} as main (canonical)")
+        with self._hr_cache_lock:
+            if key not in entry["hr_cache"]:
+                self._remember_hr(entry, key, hr_sig)
+        self.logger.info("Promoted hr_aurora with config %s as main (canonical)", key)
 
     def _is_default_hr_config(self, **kwargs):
         """
@@ -342,6 +737,7 @@ class DataManager(QObject):
                 and start_time >= cache_entry["start_time"]
                 and end_time <= cache_entry["end_time"]
             ):
+                self._count_cache("time_cache", "hits")
                 # Filter cached comments to exact range
                 return [
                     c
@@ -350,6 +746,7 @@ class DataManager(QObject):
                 ]
 
         # Cache miss - perform binary search and cache larger range
+        self._count_cache("time_cache", "misses")
         times = [c.time for c in comments]
         start_idx = bisect.bisect_left(times, start_time)
         end_idx = bisect.bisect_right(times, end_time)
@@ -422,7 +819,8 @@ class DataManager(QObject):
         # Add available hr_aurora configurations with descriptive names
         if any(ch.lower() == "ecg" for ch in base_channels):
             entry = self._files[path]
-            hr_cache = entry.get("hr_cache", {})
+            with self._hr_cache_lock:
+                hr_cache = dict(entry.get("hr_cache", {}))
 
             if hr_cache:
                 # Add each cached HR configuration with descriptive name
@@ -464,23 +862,20 @@ class DataManager(QObject):
         """
         Update or add a hr_aurora version to the parameterized cache.
         """
-        key = tuple(sorted(kwargs.items()))
+        key = self._hr_key(**kwargs)
         entry = self._files[path]
-        entry["hr_cache"][key] = hr_sig
+        self._remember_hr(entry, key, hr_sig)
 
         if not any(c.lower() == "hr_aurora" for c in entry["metadata"]["channels"]):
             entry["metadata"]["channels"].append("hr_aurora")
-            self.logger.info(f"hr_aurora added to metadata from {path} file")
+            self.logger.info("hr_aurora added to metadata from %s file", path)
             # Emit metadata_changed signal when hr_aurora is added to cache
             self.logger.debug(
-                f"Emitting metadata_changed signal for cached hr_aurora: {path}"
+                "Emitting metadata_changed signal for cached hr_aurora: %s", path
             )
             self.metadata_changed.emit(path, entry["metadata"])
 
-        if key in entry["hr_cache_keys"]:
-            entry["hr_cache_keys"].remove(key)
-        entry["hr_cache_keys"].append(key)
-        self.logger.info(f"Updating HR_cache with key {key}")
+        self.logger.info("Updating HR_cache with key %s", key)
 
     def get_event_intervals(self, path, channel_names=None, **hr_params):
         """
@@ -519,12 +914,16 @@ class DataManager(QObject):
             entry["intervals_cache"] is not None
             and entry["intervals_cache_key"] == cache_key
         ):
-            self.logger.debug(f"Using cached intervals for {os.path.basename(path)}")
+            self._count_cache("intervals_cache", "hits")
+            self.logger.debug("Using cached intervals for %s", os.path.basename(path))
             return entry["intervals_cache"]
+        self._count_cache("intervals_cache", "misses")
 
         # Extract intervals and cache them
         self.logger.debug(
-            f"Extracting intervals for {os.path.basename(path)} with channels {channel_names}"
+            "Extracting intervals for %s with channels %s",
+            os.path.basename(path),
+            channel_names,
         )
         signals = []
         for ch in channel_names:
@@ -537,26 +936,87 @@ class DataManager(QObject):
         intervals = extract_event_intervals(signals)
 
         # Cache the results
+        if entry["intervals_cache"] is not None:
+            self._count_cache("intervals_cache", "evictions")
         entry["intervals_cache"] = intervals
         entry["intervals_cache_key"] = cache_key
 
         self.logger.debug(
-            f"Cached {len(intervals)} intervals for {os.path.basename(path)}"
+            "Cached %s intervals for %s", len(intervals), os.path.basename(path)
         )
         return intervals
 
     def clear_intervals_cache(self, path):
         """Clear intervals cache for a specific file."""
         if path in self._files:
+            if self._files[path]["intervals_cache"] is not None:
+                self._count_cache("intervals_cache", "evictions")
             self._files[path]["intervals_cache"] = None
             self._files[path]["intervals_cache_key"] = None
-            self.logger.debug(f"Cleared intervals cache for {os.path.basename(path)}")
+            self.logger.debug("Cleared intervals cache for %s", os.path.basename(path))
 
     def clear_all_intervals_cache(self):
         """Clear intervals cache for all files."""
         for path in self._files:
             self.clear_intervals_cache(path)
 
+    ####### Cache Statistics ######
+
+    def _count_cache(self, name: str, event: str) -> None:
+        with self._stats_lock:
+            self._cache_counters[name][event] += 1
+
+    def get_cache_stats(self, path: str = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Sizes and counters of the in-memory caches.
+
+        Args:
+            path: Restrict sizes to one file (None = all loaded files)
+
+        Returns:
+            Dict per cache name (see CACHE_NAMES) with entries, bytes (held in
+            RAM), mapped_bytes (memory-mapped from disk, paged in on demand),
+            hits, misses and evictions. Counters cover all files.
+        """
+        paths = [path] if path is not None else list(self._files)
+        entries = [self._files[p] for p in paths if p in self._files]
+        with self._stats_lock:
+            stats = {
+                name: dict(
+                    entries=0, bytes=0, mapped_bytes=0, **self._cache_counters[name]
+                )
+                for name in self.CACHE_NAMES
+            }
+
+        for entry in entries:
+            # The default hr_aurora is also kept in signal_cache; count it once
+            with self._hr_cache_lock:
+                hr_ids = {id(sig) for sig in entry["hr_cache"].values()}
+            for name in ("signal_cache", "hr_cache"):
+                for sig in list(entry[name].values()):
+                    stats[name]["entries"] += 1
+                    if name == "signal_cache" and id(sig) in hr_ids:
+                        continue
+                    resident, mapped = signal_nbytes(sig)
+                    stats[name]["bytes"] += resident
+                    stats[name]["mapped_bytes"] += mapped
+
+            intervals = entry["intervals_cache"]
+            if intervals is not None:
+                stats["intervals_cache"]["entries"] += 1
+                stats["intervals_cache"]["bytes"] += sys.getsizeof(intervals) + sum(
+                    sys.getsizeof(item) for item in intervals
+                )
+
+        for p in paths:
+            cached = self._time_cache.get(p)
+            if cached is not None:
+                # Comments are shared with the file entry; only the list is owned
+                stats["time_cache"]["entries"] += 1
+                stats["time_cache"]["bytes"] += sys.getsizeof(cached["comments"])
+
+        return stats
+
     ####### Comments Signal Response ######
 
     def _invalidate_time_cache(self, file_path: str = None):
@@ -564,11 +1024,12 @@ class DataManager(QObject):
         self._cache_version += 1
         if file_path and file_path in self._time_cache:
             del self._time_cache[file_path]
+            self._count_cache("time_cache", "evictions")
 
     def _update_comment_cache_create(self, file_path: str, comment):
         """Update cache after comment creation by CommentManager"""
         if file_path not in self._files:
-            self.logger.error(f"File {file_path} not loaded")
+            self.logger.error("File %s not loaded", file_path)
             return
 
         # Insert in sorted position for O(log n) binary search later
@@ -588,7 +1049,7 @@ class DataManager(QObject):
         self.comments_changed.emit(file_path)
 
         self.logger.debug(
-            f"Cache updated: comment {comment.comment_id} added at {comment.time:.2f}s"
+            "Cache updated: comment %s added at %.2fs", comment.comment_id, comment.time
         )
 
     def _update_comment_cache_update(
@@ -596,7 +1057,7 @@ class DataManager(QObject):
     ):
         """Update cache after comment update by CommentManager"""
         if file_path not in self._files:
-            self.logger.error(f"File {file_path} not loaded")
+            self.logger.error("File %s not loaded", file_path)
             return
 
         target_id_str = str(comment_id)
@@ -606,7 +1067,7 @@ class DataManager(QObject):
         comment = id_to_comment.get(target_id_str)
         if not comment:
             self.logger.warning(
-                f"Comment '{target_id_str}' not found in cache for update"
+                "Comment '%s' not found in cache for update", target_id_str
             )
             return
 
@@ -627,7 +1088,10 @@ class DataManager(QObject):
             comments.insert(insert_pos, comment)
 
             self.logger.debug(
-                f"Comment {comment_id} repositioned from {comment_index} to {insert_pos}"
+                "Comment %s repositioned from %s to %s",
+                comment_id,
+                comment_index,
+                insert_pos,
             )
 
         # Update other fields
@@ -643,12 +1107,12 @@ class DataManager(QObject):
         self.comment_updated.emit(file_path, comment)
         self.comments_changed.emit(file_path)
 
-        self.logger.debug(f"Cache updated: comment {comment_id} modified")
+        self.logger.debug("Cache updated: comment %s modified", comment_id)
 
     def _update_comment_cache_delete(self, file_path: str, comment_id: str):
         """Update cache after comment deletion by CommentManager"""
         if file_path not in self._files:
-            self.logger.error(f"File {file_path} not loaded")
+            self.logger.error("File %s not loaded", file_path)
             return
 
         target_id_str = str(comment_id)
@@ -659,7 +1123,7 @@ class DataManager(QObject):
 
         if not comment:
             self.logger.warning(
-                f"Comment '{target_id_str}' not found in cache for deletion"
+                "Comment '%s' not found in cache for deletion", target_id_str
             )
             return
 
@@ -675,4 +1139,4 @@ class DataManager(QObject):
         self.comment_removed.emit(file_path, comment_id)
         self.comments_changed.emit(file_path)
 
-        self.logger.debug(f"Cache updated: comment {comment_id} removed")
+        self.logger.debug("Cache updated: comment %s removed", comment_id)
@@ -13,16 +13,19 @@ from typing import List, Dict, Any, Optional, Union, Set
 from pathlib import Path
 import datetime as dt
 import logging
+import time
 
 from aurora.core.signal import (
     Signal,
     HR_Gen_Signal,
 )  # HR_Gen_Signal alias retro (hr_aurora)
 from aurora.core.comments import EMSComment
+from aurora.core.logging_config import PerformanceLoggerMixin
+from aurora.core.tracing import span, traced
 from aurora.data.data_manager import DataManager
 
 
-class EDFExporter:
+class EDFExporter(PerformanceLoggerMixin):
     """
     Robust EDF+ exporter with support for signal cleaning and comment filtering.
 
@@ -89,6 +92,7 @@ class EDFExporter:
             "unknown": (0, 0),
         }
 
+    @traced("EDFExporter.export_clean_signals")
     def export_clean_signals(
         self,
         file_path: str,
@@ -124,6 +128,7 @@ class EDFExporter:
         """
         try:
             self.logger.info(f"Starting EDF+ export: {file_path} -> {output_path}")
+            t0 = time.perf_counter()
 
             # 1. Validate inputs
             loaded_files = self.data_manager.list_loaded_files()
@@ -141,29 +146,40 @@ class EDFExporter:
             )
 
             # 3. Load signal data
-            signal_data, channel_info = self._load_signals(
-                file_path, export_channels, time_range, **hr_params
-            )
+            with span("EDFExporter.load_signals", channels=len(export_channels)):
+                signal_data, channel_info = self._load_signals(
+                    file_path, export_channels, time_range, **hr_params
+                )
 
             # 4. Handle resampling
             if resample_enable:
-                signal_data, channel_info = self._resample_signals(
-                    signal_data, channel_info, target_fs
-                )
+                with span("EDFExporter.resample_signals"):
+                    signal_data, channel_info = self._resample_signals(
+                        signal_data, channel_info, target_fs
+                    )
 
             # 5. Create MNE Raw object
-            raw = self._create_mne_raw(
-                signal_data, channel_info, patient_id, recording_info
-            )
+            with span("EDFExporter.create_mne_raw"):
+                raw = self._create_mne_raw(
+                    signal_data, channel_info, patient_id, recording_info
+                )
 
             # 6. Add filtered annotations
-            self._add_filtered_annotations(
-                raw, file_path, excluded_comment_ids, time_range
-            )
+            with span("EDFExporter.add_annotations"):
+                self._add_filtered_annotations(
+                    raw, file_path, excluded_comment_ids, time_range
+                )
 
             # 7. Export to EDF+
-            self._export_raw_to_edf(raw, output_path, overwrite)
-
+            with span("EDFExporter.write_edf"):
+                self._export_raw_to_edf(raw, output_path, overwrite)
+
+            self.log_operation(
+                "export_clean_signals",
+                time.perf_counter() - t0,
+                channel_count=len(signal_data),
+                output=Path(output_path).name,
+            )
             self.logger.info(f"EDF+ export completed: {output_path}")
             return output_path
 
@@ -218,35 +234,41 @@ class EDFExporter:
 
         for channel_name in channels:
             try:
-                # Load full signal
                 if channel_name.upper() in ("HR_GEN", "HR_AURORA"):
+                    # Derived signal: generated over the full ECG
                     signal = self.data_manager.get_trace(
                         file_path, channel_name, **hr_params
                     )
+                    if signal is None:
+                        self.logger.warning(f"Could not load signal: {channel_name}")
+                        continue
+                    if time_range is not None:
+                        signal = self._apply_time_range(
+                            file_path, channel_name, time_range, signal
+                        )
+                elif time_range is not None:
+                    # Raw channel: decode only the exported window
+                    signal = self._apply_time_range(file_path, channel_name, time_range)
                 else:
                     signal = self.data_manager.get_trace(file_path, channel_name)
-
-                if signal is None:
-                    self.logger.warning(f"Could not load signal: {channel_name}")
-                    continue
-
-                # Apply time range if specified
-                if time_range is not None:
-                    signal = self._apply_time_range(signal, time_range)
+                    if signal is None:
+                        self.logger.warning(f"Could not load signal: {channel_name}")
+                        continue
 
                 # Normalize units for consistent mapping
                 normalized_units = self._normalize_units(signal.units)
 
-                signal_data[channel_name] = signal.data
+                data = signal.data
+                signal_data[channel_name] = data
                 channel_info[channel_name] = {
                     "fs": signal.fs,
                     "units": normalized_units,
                     "name": signal.name,
-                    "length": len(signal.data),
+                    "length": len(data),
                 }
 
                 self.logger.debug(
-                    f"Loaded {channel_name}: {len(signal.data)} samples, fs={signal.fs}, units={normalized_units}"
+                    f"Loaded {channel_name}: {len(data)} samples, fs={signal.fs}, units={normalized_units}"
                 )
 
             except Exception as e:
@@ -258,45 +280,63 @@ class EDFExporter:
 
         return signal_data, channel_info
 
-    def _apply_time_range(self, signal: Signal, time_range: tuple) -> Signal:
+    def _apply_time_range(
+        self,
+        file_path: str,
+        channel_name: str,
+        time_range: tuple,
+        signal: Optional[Signal] = None,
+    ) -> Signal:
         """
-        Extract time range from signal.
+        Extract time range for a channel.
+
+        Raw channels are read through DataManager.read_range so only the exported
+        window is decoded. Derived signals (hr_aurora) are passed in and sliced.
 
         Args:
-            signal: Input signal
+            file_path: Source file path
+            channel_name: Channel to extract
             time_range: Tuple (start_sec, end_sec)
+            signal: Already materialized signal to slice (derived channels)
 
         Returns:
             Signal with extracted time range
         """
         start_sec, end_sec = time_range
+        start_sec = max(0.0, start_sec)
+
+        if signal is not None:
+            fs = signal.fs
+            units = signal.units
+            name = signal.name
+            marker_data = signal.MarkerData
+            extracted_data = signal.get_range(int(start_sec * fs), int(end_sec * fs))
+        else:
+            metadata = self.data_manager.get_metadata(file_path)
+            fs = metadata["fs"][channel_name]
+            units = metadata.get("units", {}).get(channel_name, "unknown")
+            name = channel_name
+            marker_data = self.data_manager.get_comments(file_path)
+            extracted_data = self.data_manager.read_range(
+                file_path, channel_name, start_sec, end_sec
+            )
 
-        # Convert time to sample indices
-        start_idx = int(start_sec * signal.fs)
-        end_idx = int(end_sec * signal.fs)
-
-        # Clamp indices
-        start_idx = max(0, start_idx)
-        end_idx = min(len(signal.data), end_idx)
-
-        if start_idx >= end_idx:
+        if len(extracted_data) == 0:
             raise ValueError(f"Invalid time range: {time_range}")
 
-        # Extract data and time
-        extracted_data = signal.data[start_idx:end_idx]
-        extracted_time = np.arange(len(extracted_data)) / signal.fs + start_sec
+        extracted_time = np.arange(len(extracted_data)) / fs + start_sec
 
         # Create new signal
         new_signal = Signal(
-            name=signal.name,
+            name=name,
             data=extracted_data,
             time=extracted_time,
-            units=signal.units,
-            fs=signal.fs,
+            units=units,
+            fs=fs,
         )
 
         # Copy marker data
-        new_signal.MarkerData = signal.MarkerData
+        new_signal.MarkerData = marker_data
 
         return new_signal
 
@@ -4,11 +4,6 @@ Supports loading of EDF/EDF+ files with annotations and signal data.
 """
 
 import numpy as np
-
-try:
-    import mne  # Heavy dependency; keep for EDF support
-except ImportError as _mne_err:  # Provide deferred error inside methods
-    mne = None  # type: ignore
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import logging
@@ -19,23 +14,30 @@ from aurora.core.signal import (
 )  # HR_Gen_Signal is a backward-compatible alias (HRAuroraSignal)
 from aurora.core.comments import EMSComment
 from aurora.data.base_loader import BaseLoader
+from aurora.data.edf_reader import EDFReader
 
 
 class EDFLoader(BaseLoader):
     """
-    Loader for EDF/EDF+ files using MNE-Python.
+    Loader for EDF/EDF+ files using the native memory-mapped EDFReader.
 
     Features:
-    - Load signal data from EDF/EDF+ files
+    - Load signal data from EDF/EDF+ files without decoding it up front
+    - Each channel exposed at its native sampling rate
     - Extract annotations as comments
     - Support for multiple channel types (ECG, EEG, EMG, etc.)
-    - Automatic unit conversion
+    - Physical units taken from the EDF header
     - hr_aurora (formerly HR_gen) derivation from ECG when available
     """
 
+    # int16 records are already memory-mapped; a decoded copy on disk would
+    # double the footprint without saving any decoding work
+    cacheable = False
+
     def __init__(self):
         self.path: Optional[str] = None
-        self.raw_data: Optional["mne.io.BaseRaw"] = None  # type: ignore
+        self.reader: Optional[EDFReader] = None
+        self._channel_index: Dict[str, int] = {}  # channel name -> EDF signal index
         self.metadata: Dict[str, Any] = {}
         self.comments: List[EMSComment] = []
         self.logger = logging.getLogger(f"aurora.data.{self.__class__.__name__}")
@@ -51,25 +53,35 @@ class EDFLoader(BaseLoader):
             self.path = path
             self.logger.info(f"Loading EDF+ file: {path}")
 
-            if mne is None:
-                raise ImportError(
-                    "mne is required for EDF loading. Ensure it's installed (kept in project requirements)."
-                ) from _mne_err  # type: ignore
-            # Load using MNE with preload=False for memory efficiency
-            self.raw_data = mne.io.read_raw_edf(path, preload=False, verbose=False)
+            # Header only; data records stay memory-mapped until requested
+            self.reader = EDFReader(path)
+
+            # Unique channel names (duplicated EDF labels get a numeric suffix)
+            self._channel_index = {}
+            for idx in self.reader.signal_indices:
+                name = self.reader.labels[idx]
+                suffix = 1
+                while name in self._channel_index:
+                    name = f"{self.reader.labels[idx]}-{suffix}"
+                    suffix += 1
+                self._channel_index[name] = idx
 
-            # Extract basic metadata
-            info = self.raw_data.info
+            channels = list(self._channel_index.keys())
             self.metadata = {
-                "channels": info["ch_names"],
-                "fs": {ch_name: info["sfreq"] for ch_name in info["ch_names"]},
-                "n_records": len(self.raw_data.times),
-                "duration": (
-                    self.raw_data.times[-1] if len(self.raw_data.times) > 0 else 0.0
-                ),
-                "subject_info": info.get("subject_info", {}),
-                "meas_date": info.get("meas_date"),
-                "description": info.get("description", ""),
+                "channels": channels,
+                "fs": {
+                    name: self.reader.get_fs(idx)
+                    for name, idx in self._channel_index.items()
+                },
+                "n_records": self.reader.n_records,
+                "duration": self.reader.duration,
+                "subject_info": self.reader.get_subject_info(),
+                "meas_date": self.reader.start_datetime,
+                "description": self.reader.recording_id,
+                "units": {
+                    name: self.reader.units[idx] or "unknown"
+                    for name, idx in self._channel_index.items()
+                },
             }
 
             # Extract annotations as comments
@@ -89,13 +101,8 @@ class EDFLoader(BaseLoader):
         """Extract annotations from EDF+ file as EMSComment objects."""
         self.comments = []
 
-        if self.raw_data.annotations is None:
-            return
-
-        annotations = self.raw_data.annotations
-
         for i, (onset, duration, description) in enumerate(
-            zip(annotations.onset, annotations.duration, annotations.description)
+            self.reader.read_annotations()
         ):
             comment = EMSComment(
                 text=description,
@@ -141,22 +148,17 @@ class EDFLoader(BaseLoader):
                 f"Available channels: {self.metadata['channels']}"
             )
 
-        # Load data for specific channel ONLY
-        channel_idx = self.metadata["channels"].index(channel)
-
-        # Get data for specific channel without loading entire file
-        # This is much more memory and performance efficient
-        data = self.raw_data.get_data(picks=[channel_idx], start=0, stop=None)[
-            0
-        ]  # Shape: (1, n_samples) -> (n_samples,)
+        # Scale the memory-mapped samples of this channel only
+        channel_idx = self._channel_index[channel]
+        data = self.reader.read_physical(
+            channel_idx, 0, self.reader.get_n_samples(channel_idx)
+        )
         fs = self.metadata["fs"][channel]
 
         # Create time array
         time = np.arange(len(data)) / fs
 
-        # Get channel info for units
-        ch_info = self.raw_data.info["chs"][channel_idx]
-        units = self._get_channel_units(ch_info)
+        units = self.metadata["units"][channel]
 
         # Create Signal object
         signal = Signal(name=channel, data=data, time=time, units=units, fs=fs)
@@ -168,6 +170,38 @@ class EDFLoader(BaseLoader):
 
         return signal
 
+    def get_n_samples(self, channel: str) -> int:
+        """Return the number of samples of a channel without reading its data."""
+        if channel not in self._channel_index:
+            raise ValueError(f"Channel '{channel}' not found in EDF+ file.")
+        return self.reader.get_n_samples(self._channel_index[channel])
+
+    def read_range(self, channel: str, start_sec: float, end_sec: float) -> np.ndarray:
+        """
+        Return samples of a channel in [start_sec, end_sec) without loading the full trace.
+
+        Args:
+            channel: Channel name to extract
+            start_sec: Window start in seconds
+            end_sec: Window end in seconds
+
+        Returns:
+            1D array of samples (empty if the window is out of range)
+        """
+        if channel not in self._channel_index:
+            raise ValueError(
+                f"Channel '{channel}' not found in EDF+ file. "
+                f"Available channels: {self.metadata['channels']}"
+            )
+
+        channel_idx = self._channel_index[channel]
+        fs = self.metadata["fs"][channel]
+
+        # Only the data records overlapping the window are touched and scaled
+        return self.reader.read_physical(
+            channel_idx, int(start_sec * fs), int(end_sec * fs)
+        )
+
     def _has_ecg_channel(self) -> bool:
         """Check if file contains ECG channel for HR derivation."""
         ecg_patterns = ["ECG", "EKG", "ecg", "ekg"]
@@ -186,7 +220,8 @@ class EDFLoader(BaseLoader):
         Derive HR signal (hr_aurora, historical alias HR_gen) from ECG using HRAuroraSignal.
 
                 Args:
-                    **kwargs: Parameters for HR derivation (wavelet, swt_level, min_rr_sec)
+                    **kwargs: Parameters for HR derivation (method, wavelet, level
+                        or swt_level, min_rr_sec; see BaseLoader.hr_detection_params)
 
                 Returns:
                     HR_Gen_Signal object with derived HR data
@@ -195,83 +230,23 @@ class EDFLoader(BaseLoader):
         if not ecg_channel:
             raise ValueError("No ECG channel found for HR derivation")
 
-        # Load ECG signal
+        # Load ECG signal, then detect R-peaks and derive HR
         ecg_signal = self.get_full_trace(ecg_channel)
-
-        # Extract HR parameters
-        wavelet = kwargs.get("wavelet", "haar")
-        swt_level = kwargs.get("swt_level", 4)
-        min_rr_sec = kwargs.get("min_rr_sec", 0.6)
-
-        # Create HR_Gen_Signal
-        hr_signal = HR_Gen_Signal(
-            name="hr_aurora",
-            ecg_data=ecg_signal.data,
-            ecg_time=ecg_signal.time,
-            units="bpm",
-            fs=ecg_signal.fs,
-        )
-
-        # Set R-peaks and derive HR
-        hr_signal.set_r_peaks(
-            ecg_signal, wavelet=wavelet, swt_level=swt_level, min_rr_sec=min_rr_sec
-        )
-
-        # Copy marker data
-        hr_signal.MarkerData = ecg_signal.MarkerData
-
-        # Update metadata to include hr_aurora channel (retain compatibility)
-        if "hr_aurora" not in [c.lower() for c in self.metadata["channels"]]:
-            self.metadata["channels"].append("hr_aurora")
-            self.metadata["fs"]["hr_aurora"] = hr_signal.fs
+        hr_signal = self.derive_hr_signal(ecg_signal, **kwargs)
 
         self.logger.info(
-            f"Derived HR signal from ECG using wavelet='{wavelet}', "
-            f"swt_level={swt_level}, min_rr_sec={min_rr_sec}"
+            f"Derived HR signal from ECG using {self.hr_detection_params(**kwargs)}"
         )
 
         return hr_signal
 
-    def _get_channel_units(self, ch_info: Dict[str, Any]) -> str:
-        """
-        Extract channel units from MNE channel info.
-
-        Args:
-            ch_info: Channel information dictionary from MNE
-
-        Returns:
-            Unit string (V, mV, µV, etc.)
-        """
-        # MNE unit constants to string mapping
-        unit_mapping = {
-            mne.io.constants.FIFF.FIFF_UNIT_V: "V",
-            mne.io.constants.FIFF.FIFF_UNIT_T: "T",  # Tesla for MEG
-            0: "unknown",  # Default for unknown units
-        }
-
-        # Get base unit
-        base_unit = ch_info.get("unit", 0)
-        unit_mul = ch_info.get("unit_mul", 0)
-
-        base_str = unit_mapping.get(base_unit, "unknown")
-
-        # Apply multiplier to get proper unit
-        if base_str == "V" and unit_mul != 0:
-            if unit_mul == -3:
-                return "mV"
-            elif unit_mul == -6:
-                return "µV"
-            elif unit_mul == -9:
-                return "nV"
-
-        return base_str
-
     def cleanup(self) -> None:
         """Clean up resources when loader is no longer needed."""
         try:
-            if self.raw_data is not None:
-                self.raw_data.close()
-                self.raw_data = None
+            if self.reader is not None:
+                self.reader.close()
+                self.reader = None
+            self._channel_index.clear()
 
             self.metadata.clear()
             self.comments.clear()
@@ -0,0 +1,280 @@
+"""
+Native EDF/EDF+ reader for Aurora.
+Parses the EDF header and memory-maps the int16 data records, so opening a file
+costs only the header read and samples are scaled to physical units on demand.
+"""
+
+import datetime as dt
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class EDFReader:
+    """
+    Memory-mapped reader for EDF and EDF+ (continuous or discontinuous) files.
+
+    Features:
+    - Header parsing without reading any sample data
+    - int16 data records exposed through np.memmap (no resident copy)
+    - Each channel at its native sampling rate (no resampling to a common rate)
+    - Digital-to-physical scaling applied only to the requested slice
+    - EDF+ annotations (TALs) parsed from the "EDF Annotations" signal
+
+    Discontinuous EDF+D recordings are read as if records were contiguous.
+    """
+
+    ANNOTATION_LABEL = "EDF Annotations"
+
+    def __init__(self, path: str):
+        self.path = path
+        self.logger = logging.getLogger(f"aurora.data.{self.__class__.__name__}")
+
+        # Header fields
+        self.patient_id: str = ""
+        self.recording_id: str = ""
+        self.start_datetime: Optional[dt.datetime] = None
+        self.header_bytes: int = 0
+        self.reserved: str = ""
+        self.n_records: int = 0
+        self.record_duration: float = 0.0
+
+        # Per-signal fields (all signals, annotation signals included)
+        self.labels: List[str] = []
+        self.units: List[str] = []
+        self.samples_per_record: np.ndarray = np.array([], dtype=np.int64)
+        self._gain: np.ndarray = np.array([])
+        self._offset: np.ndarray = np.array([])
+        self._record_offsets: np.ndarray = np.array([], dtype=np.int64)
+        self._record_samples: int = 0
+
+        self._records: Optional[np.memmap] = None
+
+        self._read_header()
+        self._map_records()
+
+    # ---------------------------------------------------------------- header
+
+    def _read_header(self) -> None:
+        """Parse the fixed and per-signal parts of the EDF header."""
+        with open(self.path, "rb") as f:
+            fixed = f.read(256)
+            if len(fixed) < 256:
+                raise ValueError(f"File too short to be EDF: {self.path}")
+
+            version = fixed[0:8].decode("ascii", "replace").strip()
+            if version != "0":
+                raise ValueError(f"Unsupported EDF version '{version}' (BDF?)")
+
+            self.patient_id = _ascii(fixed[8:88])
+            self.recording_id = _ascii(fixed[88:168])
+            self.start_datetime = _parse_start(
+                _ascii(fixed[168:176]), _ascii(fixed[176:184])
+            )
+            self.header_bytes = int(_ascii(fixed[184:192]))
+            self.reserved = _ascii(fixed[192:236])
+            self.n_records = int(_ascii(fixed[236:244]))
+            self.record_duration = float(_ascii(fixed[244:252]))
+            ns = int(_ascii(fixed[252:256]))
+
+            block = f.read(ns * 256)
+            if len(block) < ns * 256:
+                raise ValueError(f"Truncated EDF signal header: {self.path}")
+
+        def field(start: int, width: int) -> List[str]:
+            base = start * ns
+            return [
+                _ascii(block[base + i * width : base + (i + 1) * width])
+                for i in range(ns)
+            ]
+
+        # Field widths per signal: 16, 80, 8, 8, 8, 8, 8, 80, 8, 32 bytes
+        self.labels = field(0, 16)
+        self.units = field(16 + 80, 8)
+        phys_min = np.array([float(v) for v in field(16 + 80 + 8, 8)])
+        phys_max = np.array([float(v) for v in field(16 + 80 + 16, 8)])
+        dig_min = np.array([float(v) for v in field(16 + 80 + 24, 8)])
+        dig_max = np.array([float(v) for v in field(16 + 80 + 32, 8)])
+        self.samples_per_record = np.array(
+            [int(v) for v in field(16 + 80 + 40 + 80, 8)], dtype=np.int64
+        )
+
+        dig_range = dig_max - dig_min
+        phys_range = phys_max - phys_min
+        valid = dig_range != 0
+        self._gain = np.where(valid, phys_range / np.where(valid, dig_range, 1), 1.0)
+        self._offset = phys_min - dig_min * self._gain
+
+        self._record_offsets = np.concatenate(
+            ([0], np.cumsum(self.samples_per_record)[:-1])
+        ).astype(np.int64)
+        self._record_samples = int(self.samples_per_record.sum())
+
+    def _map_records(self) -> None:
+        """Memory-map the data records as a (n_records, samples_per_record) int16 array."""
+        record_bytes = self._record_samples * 2
+        available = max(0, os.path.getsize(self.path) - self.header_bytes)
+        complete_records = available // record_bytes if record_bytes else 0
+
+        # n_records may be -1 (unknown) or larger than the file (truncated recording)
+        if self.n_records < 0 or self.n_records > complete_records:
+            if self.n_records >= 0:
+                self.logger.warning(
+                    f"EDF header declares {self.n_records} records but file holds "
+                    f"{complete_records}; using the complete ones"
+                )
+            self.n_records = int(complete_records)
+
+        if self.n_records == 0:
+            self._records = np.zeros((0, self._record_samples), dtype="<i2")
+            return
+
+        self._records = np.memmap(
+            self.path,
+            dtype="<i2",
+            mode="r",
+            offset=self.header_bytes,
+            shape=(self.n_records, self._record_samples),
+        )
+
+    # --------------------------------------------------------------- signals
+
+    @property
+    def signal_indices(self) -> List[int]:
+        """Indices of data signals (annotation signals excluded)."""
+        return [
+            i for i, label in enumerate(self.labels) if label != self.ANNOTATION_LABEL
+        ]
+
+    @property
+    def duration(self) -> float:
+        """Recording duration in seconds."""
+        return self.n_records * self.record_duration
+
+    def get_fs(self, index: int) -> float:
+        """Native sampling frequency of a signal."""
+        if self.record_duration <= 0:
+            return float(self.samples_per_record[index])
+        return float(self.samples_per_record[index]) / self.record_duration
+
+    def get_n_samples(self, index: int) -> int:
+        """Total number of samples of a signal."""
+        return int(self.samples_per_record[index]) * self.n_records
+
+    def read_digital(self, index: int, start: int, stop: int) -> np.ndarray:
+        """
+        Read raw int16 samples [start, stop) of a signal.
+
+        Only the data records overlapping the range are touched.
+        """
+        spr = int(self.samples_per_record[index])
+        start = max(0, int(start))
+        stop = min(self.get_n_samples(index), int(stop))
+        if start >= stop or spr == 0:
+            return np.array([], dtype=np.int16)
+
+        first_record = start // spr
+        last_record = (stop - 1) // spr + 1
+        col = int(self._record_offsets[index])
+
+        block = self._records[first_record:last_record, col : col + spr].reshape(-1)
+        base = first_record * spr
+        return np.asarray(block[start - base : stop - base])
+
+    def read_physical(
+        self, index: int, start: int, stop: int, dtype=np.float64
+    ) -> np.ndarray:
+        """Read samples [start, stop) of a signal scaled to physical units."""
+        digital = self.read_digital(index, start, stop)
+        physical = digital.astype(dtype)
+        physical *= dtype(self._gain[index])
+        physical += dtype(self._offset[index])
+        return physical
+
+    # ----------------------------------------------------------- annotations
+
+    def read_annotations(self) -> List[Tuple[float, float, str]]:
+        """
+        Parse EDF+ annotations from every "EDF Annotations" signal.
+
+        Returns:
+            List of (onset_sec, duration_sec, text), sorted by onset. Time-keeping
+            TALs (records start stamps without text) are skipped.
+        """
+        annotations = []
+        for index, label in enumerate(self.labels):
+            if label != self.ANNOTATION_LABEL:
+                continue
+            raw = self.read_digital(index, 0, self.get_n_samples(index))
+            annotations.extend(_parse_tals(raw.astype("<i2").tobytes()))
+
+        annotations.sort(key=lambda a: a[0])
+        return annotations
+
+    def get_subject_info(self) -> Dict[str, Any]:
+        """Return subject info from the EDF+ patient field (code, sex, birthdate, name)."""
+        parts = self.patient_id.split(" ")
+        if not self.reserved.startswith("EDF+") or len(parts) < 4:
+            return {}
+        code, sex, birthdate, name = parts[:4]
+        info = {}
+        if code != "X":
+            info["his_id"] = code
+        if sex in ("M", "F"):
+            info["sex"] = sex
+        if birthdate != "X":
+            info["birthday"] = birthdate
+        if name != "X":
+            info["name"] = name.replace("_", " ")
+        return info
+
+    def close(self) -> None:
+        """Release the memory map."""
+        if isinstance(self._records, np.memmap) and self._records._mmap is not None:
+            self._records._mmap.close()
+        self._records = None
+
+
+def _ascii(raw: bytes) -> str:
+    """Decode a space-padded ASCII header field."""
+    return raw.decode("latin-1").strip()
+
+
+def _parse_start(date_str: str, time_str: str) -> Optional[dt.datetime]:
+    """Parse EDF startdate (dd.mm.yy) and starttime (hh.mm.ss) into a UTC datetime."""
+    try:
+        day, month, year = (int(v) for v in date_str.split("."))
+        hour, minute, second = (int(v) for v in time_str.split("."))
+    except ValueError:
+        return None
+    # EDF spec: years 85-99 are 1985-1999, 00-84 are 2000-2084
+    year += 1900 if year >= 85 else 2000
+    try:
+        return dt.datetime(
+            year, month, day, hour, minute, second, tzinfo=dt.timezone.utc
+        )
+    except ValueError:
+        return None
+
+
+def _parse_tals(raw: bytes) -> List[Tuple[float, float, str]]:
+    """
+    Parse Time-stamped Annotation Lists: "+onset[\\x15duration]\\x14text\\x14...\\x00".
+    """
+    annotations = []
+    for tal in raw.split(b"\x00"):
+        if not tal:
+            continue
+        parts = tal.split(b"\x14")
+        stamp = parts[0].split(b"\x15")
+        try:
+            onset = float(stamp[0])
+            duration = float(stamp[1]) if len(stamp) > 1 and stamp[1] else 0.0
+        except ValueError:
+            continue
+        for text in parts[1:]:
+            if text:
+                annotations.append((onset, duration, text.decode("utf-8", "replace")))
+    return annotations
@@ -0,0 +1,32 @@
+"""
+Qt adapter of the DataManager.
+
+DataManager (aurora.data.data_manager) has no Qt dependency and notifies
+changes through aurora.core.events.Event. QtDataManager declares the same
+notifications as Qt signals, so the GUI can connect widgets to them and
+receive the ones emitted from ChunkLoader workers (e.g. metadata_changed
+when hr_aurora is generated) as queued calls on the GUI thread.
+"""
+
+from PySide6.QtCore import QObject, Signal as QtSignal
+
+from aurora.data.data_manager import DataManager
+
+
+class QtDataManager(QObject, DataManager):
+    """DataManager whose change notifications are Qt signals."""
+
+    # Comment change notification signals
+    comments_changed = QtSignal(str)  # (file_path)
+    comment_added = QtSignal(str, object)  # (file_path, comment)
+    comment_updated = QtSignal(str, object)  # (file_path, comment)
+    comment_removed = QtSignal(str, str)  # (file_path, comment_id)
+
+    # Qt Signals for data change notifications
+    data_updated = QtSignal(str, dict)  # file_path, metadata_dict
+    metadata_changed = QtSignal(str, dict)  # file_path, metadata_dict
+    hr_peaks_changed = QtSignal(str)  # file_path
+
+    def __init__(self) -> None:
+        # QObject.__init__ also runs DataManager.__init__ (cooperative init)
+        super().__init__()
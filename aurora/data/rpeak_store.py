@@ -0,0 +1,210 @@
+"""
+Persistent store of detected and reviewed R-peaks.
+
+Peaks are stored per ECG content hash, detection strategy and canonical HR
+parameters (including the detection settings that change the peaks), so
+reopening a recording (or another copy of the same data) loads the peaks
+instead of running detection again. Manual corrections are saved
+under the same key and flagged as edited. Unlike the decoded-channel cache,
+entries are never evicted: reviewed peaks are user work. Automatically
+detected peaks are additionally keyed by the detector version of their
+strategy (PeakDetectionStrategy.version), so they are recomputed when a
+strategy changes; edited peaks are kept across detector versions.
+
+Layout:
+    <root>/<ecg hash>/<strategy>_<params hash>.npz
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from aurora.core.config_manager import get_config_manager
+from aurora.core.logging_config import AuroraLoggerConfig
+
+
+def canonical_hr_params(**kwargs) -> Dict[str, Any]:
+    """
+    Normalize hr_aurora parameters so equivalent configurations compare equal.
+
+    "swt_level" and "level" are unified as "level", and missing detection
+    method, wavelet, level and min_rr_sec are filled from the HR defaults, as
+    BaseLoader.hr_detection_params does. The hr_generation settings that also
+    change the detected peaks are added when their mode is enabled:
+    segment_sec and segment_overlap_sec (segmented detection), and
+    coarse_decimation, coarse_min_fs and coarse_refine_sec (coarse-to-fine).
+    Disabled modes add nothing, so keys saved before they existed still match.
+    """
+    settings = get_config_manager().get_hr_generation_settings()
+    params = dict(kwargs)
+    swt_level = params.pop("swt_level", None)
+    if params.get("level") is None and swt_level is not None:
+        params["level"] = swt_level
+    if not params.get("method"):
+        params["method"] = settings.get("default_method", "dwt")
+    if params.get("level") is None:
+        params["level"] = settings["level"]
+    params.setdefault("wavelet", settings["wavelet"])
+    params.setdefault("min_rr_sec", settings["min_rr_sec"])
+
+    # Effective settings, resolved the way ECGAnalyzer.detect_rr_peaks does
+    segment_sec = float(settings.get("segment_sec", 0) or 0)
+    if segment_sec > 0:
+        params["segment_sec"] = segment_sec
+        params["segment_overlap_sec"] = float(
+            settings.get("segment_overlap_sec", 5.0)
+        )
+    decimation = int(settings.get("coarse_decimation", 1))
+    if decimation > 1:
+        params["coarse_decimation"] = decimation
+        params["coarse_min_fs"] = float(settings.get("coarse_min_fs", 250.0))
+        params["coarse_refine_sec"] = float(
+            settings.get("coarse_refine_sec", 0.01)
+        )
+    return dict(sorted(params.items()))
+
+
+def detection_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Canonical params plus the detector version of their strategy."""
+    # Local import: the processing layer is only needed for the version
+    from aurora.processing.peak_detection_strategies import strategy_registry
+
+    try:
+        version = strategy_registry.get_strategy(params["method"]).version
+    except ValueError:
+        version = 0  # Unknown strategy: detection falls back to another one
+    return dict(sorted({**params, "detector_version": version}.items()))
+
+
+class RPeakStore:
+    """
+    On-disk R-peak store keyed by (ECG hash, strategy, canonical params).
+
+    Each entry holds delta-encoded peak indices (compressed), the ECG length,
+    sampling rate and first timestamp needed to rebuild hr_aurora, and whether
+    the peaks were manually edited.
+    """
+
+    def __init__(self, root: Path, enabled: bool = True):
+        self.root = Path(root)
+        self.enabled = enabled
+        self.logger = logging.getLogger("aurora.data.RPeakStore")
+
+    def load(self, ecg_hash: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored entry for an ECG and canonical params, or None.
+
+        Edited peaks take precedence; detected peaks only match when they
+        were saved by the current detector version.
+
+        Returns:
+            Dict with peaks (int64 array), n_samples, fs, time_start, edited
+        """
+        if not self.enabled:
+            return None
+
+        entry = self._read(self._entry_path(ecg_hash, params))
+        if entry is not None and entry["edited"]:
+            return entry
+        # Unedited entries under the unversioned key predate detector versions
+        return self._read(self._entry_path(ecg_hash, detection_params(params)))
+
+    def _read(self, npz_path: Path) -> Optional[Dict[str, Any]]:
+        if not npz_path.is_file():
+            return None
+
+        try:
+            with np.load(npz_path) as npz:
+                deltas = npz["deltas"].astype(np.int64)
+                entry = {
+                    "peaks": np.cumsum(deltas),
+                    "n_samples": int(npz["n_samples"]),
+                    "fs": float(npz["fs"]),
+                    "time_start": float(npz["time_start"]),
+                    "edited": bool(npz["edited"]),
+                }
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning(f"Ignoring unreadable R-peak file {npz_path}: {e}")
+            return None
+
+        self.logger.debug(
+            f"Loaded {len(entry['peaks'])} stored R-peaks "
+            f"({'edited' if entry['edited'] else 'detected'}) from {npz_path.name}"
+        )
+        return entry
+
+    def save(
+        self,
+        ecg_hash: str,
+        params: Dict[str, Any],
+        peaks: np.ndarray,
+        n_samples: int,
+        fs: float,
+        time_start: float = 0.0,
+        edited: bool = False,
+    ) -> None:
+        """
+        Persist R-peaks (sorted sample indices) for an ECG and canonical params.
+
+        Detected peaks are saved under the detector version of the strategy,
+        edited peaks under the canonical params alone.
+        """
+        if not self.enabled:
+            return
+
+        if not edited:
+            params = detection_params(params)
+        npz_path = self._entry_path(ecg_hash, params)
+        tmp_path = npz_path.with_name(npz_path.name + ".tmp")
+        peaks = np.sort(np.asarray(peaks, dtype=np.int64))
+        deltas = np.diff(peaks, prepend=0)
+        dtype = np.uint32 if len(deltas) == 0 or deltas.max() < 2**32 else np.int64
+
+        try:
+            npz_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    deltas=deltas.astype(dtype),
+                    n_samples=np.int64(n_samples),
+                    fs=np.float64(fs),
+                    time_start=np.float64(time_start),
+                    edited=np.bool_(edited),
+                    params=np.array(json.dumps(params, sort_keys=True, default=str)),
+                )
+            os.replace(tmp_path, npz_path)
+        except OSError as e:
+            self.logger.warning(f"Could not save R-peaks to {npz_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        self.logger.debug(f"Saved {len(peaks)} R-peaks to {npz_path}")
+
+    def _entry_path(self, ecg_hash: str, params: Dict[str, Any]) -> Path:
+        params = dict(params)
+        strategy = str(params.pop("method", "dwt"))
+        blob = json.dumps(params, sort_keys=True, default=str)
+        digest = hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+        return self.root / ecg_hash / f"{strategy}_{digest}.npz"
+
+
+# Global instance
+_rpeak_store = None
+
+
+def get_rpeak_store() -> RPeakStore:
+    """Get global R-peak store configured from ConfigManager."""
+    global _rpeak_store
+    if _rpeak_store is None:
+        settings = get_config_manager().get_disk_cache_settings()
+        root = settings.get("directory") or AuroraLoggerConfig.get_cache_directory()
+        _rpeak_store = RPeakStore(
+            root=Path(root) / "rpeaks",
+            enabled=bool(settings.get("store_rpeaks", True)),
+        )
+    return _rpeak_store
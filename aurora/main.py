@@ -14,6 +14,7 @@ if parent_dir not in sys.path:
 
 from PySide6.QtWidgets import QApplication
 from aurora.ui.main_window import MainWindow
+from aurora.core.watchdog import start_watchdog_from_env, stop_watchdog
 
 def main():
     """Main entry point for Aurora application"""
@@ -26,9 +27,13 @@ def main():
     # logger = get_logger("Aurora.Main")
 
     app = QApplication(sys.argv)
+    # Opt-in event-loop stall watchdog (AURORA_WATCHDOG)
+    start_watchdog_from_env()
+
     window = MainWindow()
     window.show()
     exit_code = app.exec()
+    stop_watchdog()
 
     # TODO: Shutdown logging when implemented
     # shutdown_logging()
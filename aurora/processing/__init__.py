@@ -4,10 +4,22 @@ from .ecg_analyzer import ECGAnalyzer
 from .interval_extractor import extract_event_intervals
 from .peak_detection_strategies import (
     PeakDetectionStrategy,
+    StagedPeakDetectionStrategy,
     WaveletSWTStrategy,
     WaveletDWTStrategy,
     ScipyBasicStrategy,
     SimpleThresholdStrategy,
+    PanTompkinsStrategy,
+    OnlinePanTompkinsDetector,
     strategy_registry,
+    refractory_filter,
 )
-from .chunk_loader import ChunkLoader
+
+
+def __getattr__(name):
+    # ChunkLoader needs Qt; imported on first use so the rest stays Qt-free
+    if name == "ChunkLoader":
+        from .chunk_loader import ChunkLoader
+
+        return ChunkLoader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
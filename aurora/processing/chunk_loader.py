@@ -7,6 +7,7 @@ with support for the session-based architecture. Features include:
 - Session-isolated chunk loading
 - Asynchronous and synchronous interfaces
 - Intelligent downsampling for smooth visualization
+- Min/max level-of-detail pyramids so zoomed-out windows cost O(pixels)
 - Memory-efficient caching with LRU eviction
 - Support for parameterized hr_aurora signals (formerly HR_gen)
 - Qt signal-based communication with UI components
@@ -14,15 +15,21 @@ with support for the session-based architecture. Features include:
 Architecture:
 - Integrated with Session and DataManager
 - Compatible with VisualizationBaseTab and PlotContainerWidget
-- Throttled requests to prevent UI blocking
+- Worker-thread loading with throttled, coalesced requests
 - Automatic memory management per session
 """
 
 import numpy as np
 import logging
-from typing import Dict, List, Optional, Tuple
-from PySide6.QtCore import QObject, Signal as QtSignal
+import threading
+from collections import deque
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal as QtSignal
 from aurora.core.session import Session
+from aurora.core.tracing import span, traced
+from aurora.data.rpeak_store import canonical_hr_params
+from aurora.processing.lod_pyramid import MinMaxPyramid, bucket_size, minmax_envelope
+from aurora.processing.tile_cache import TileCache
 
 
 class ChunkLoader(QObject):
@@ -35,21 +42,32 @@ class ChunkLoader(QObject):
     - Session-isolated data access through Session.data_manager
     - Asynchronous chunk loading with Qt signals
     - Intelligent downsampling for smooth visualization
-    - LRU caching with memory limits
+    - Byte-bounded LRU tile cache; shifted windows reuse overlapping tiles
     - Support for hr_aurora (formerly HR_gen) with different parameters
     - Request throttling to prevent UI blocking
 
     Signals:
-        chunk_loaded: Emitted when chunk data is ready (start_sec, end_sec, data_dict)
+        chunk_loaded: Emitted when chunk data is ready
+                      (start_sec, end_sec, data_dict, request_id)
         chunk_error: Emitted when chunk loading fails (error_message)
         cache_stats_updated: Emitted when cache statistics change (stats_dict)
     """
 
-    # Qt Signals for asynchronous communication (simplified like working tree)
+    # Qt Signals for asynchronous communication
     chunk_loaded = QtSignal(
-        float, float, dict
-    )  # start_sec, end_sec, {channel: chunk_data}
+        float, float, dict, int
+    )  # start_sec, end_sec, {channel: chunk_data}, request_id
     chunk_error = QtSignal(str)  # error_message
+    cache_stats_updated = QtSignal(dict)  # get_cache_stats()
+
+    # Internal: worker -> GUI thread (consumer, request_id, result, error)
+    _task_finished = QtSignal(object, int, object, object)
+
+    # Buckets (min/max pairs, or raw samples at full resolution) per cache tile
+    TILE_BUCKETS = 2048
+
+    # Minimum interval between cache_stats_updated emissions
+    STATS_INTERVAL_MS = 1000
 
     def __init__(self, session: Session, parent=None):
         """
@@ -67,20 +85,18 @@ class ChunkLoader(QObject):
         )
         # Keep at DEBUG to avoid excessive info-level noise for each session creation
         self.logger.debug(
-            f"ChunkLoader.__init__ starting with session: {session.session_id}"
+            "ChunkLoader.__init__ starting with session: %s", session.session_id
         )
         self.logger.debug("ChunkLoader parent QObject initialization completed")
 
-        # Simple cache (initial values; overridden by runtime/session config)
-        self._cache = {}
-        self._cache_order = []  # For LRU tracking
-        # Retrieve configuration from session.config (injected via ConfigManager)
-        chunk_cache_size = (
-            session.get_config("chunk_cache_size", 50)
+        # Tile cache bounded by memory (retrieved from session.config, which is
+        # injected via ConfigManager)
+        chunk_cache_mb = (
+            session.get_config("chunk_cache_mb", 128)
             if hasattr(session, "get_config")
-            else 50
+            else 128
         )
-        self._max_cache_size = int(chunk_cache_size)
+        self._tiles = TileCache(int(chunk_cache_mb) * 1024 * 1024)
 
         # Establish maximum points per plot from global configuration
         self.max_points_per_plot = (
@@ -89,208 +105,572 @@ class ChunkLoader(QObject):
             else 5000
         )
 
+        # Level-of-detail pyramids per raw channel, built in background threads
+        self.lod_enabled = (
+            bool(session.get_config("enable_lod_pyramid", True))
+            if hasattr(session, "get_config")
+            else True
+        )
+        self._pyramids: Dict[str, MinMaxPyramid] = {}
+        self._pyramid_builds: Dict[str, threading.Thread] = {}
+        # Channel durations in seconds, recorded by workers for prefetch planning
+        self._durations: Dict[tuple, float] = {}
+        # Tile workers look pyramids up concurrently
+        self._pyramid_lock = threading.Lock()
+        self._stop_builds = threading.Event()
+
+        # Asynchronous requests: one worker task in flight per consumer, newer
+        # requests replace the pending one, dispatch throttled by a timer
+        self._request_seq = 0
+        self._latest_ids: Dict[Hashable, int] = {}
+        self._pending: Dict[Hashable, tuple] = {}
+        self._in_flight: Dict[Hashable, tuple] = {}
+        throttle_ms = (
+            int(session.get_config("throttle_delay_ms", 50))
+            if hasattr(session, "get_config")
+            else 50
+        )
+        self._throttle_timer = QTimer(self)
+        self._throttle_timer.setSingleShot(True)
+        self._throttle_timer.setInterval(max(0, throttle_ms))
+        self._throttle_timer.timeout.connect(self._dispatch_pending)
+        # Speculative loading of the windows most likely to be requested next
+        self.prefetch_enabled = (
+            bool(session.get_config("prefetch_enabled", True))
+            if hasattr(session, "get_config")
+            else True
+        )
+        self.prefetch_comment_windows = (
+            int(session.get_config("prefetch_comment_windows", 4))
+            if hasattr(session, "get_config")
+            else 4
+        )
+        self.prefetch_scroll_step = (
+            float(session.get_config("prefetch_scroll_step_sec", 5.0))
+            if hasattr(session, "get_config")
+            else 5.0
+        )
+        self._prefetch_queue: deque = deque()
+        self._prefetch_floor = 0
+
+        # Whether the latest request_chunk was served from the tile cache
+        self.last_request_cache_hit = False
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        self._task_finished.connect(self._on_task_finished)
+
+        # cache_stats_updated is emitted at most once per interval while busy
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.setInterval(self.STATS_INTERVAL_MS)
+        self._stats_timer.timeout.connect(self._emit_cache_stats)
+
+        # Edited R-peaks change hr_aurora: cached tiles must be recomputed
+        session.data_manager.hr_peaks_changed.connect(self._on_hr_peaks_changed)
+
         self.logger.debug(
-            f"ChunkLoader initialization completed successfully for session {session.session_id}"
+            "ChunkLoader initialization completed successfully for session %s",
+            session.session_id,
         )
         self.logger.debug(
-            f"ChunkLoader config: cache_size={self._max_cache_size}, max_points={self.max_points_per_plot}"
+            "ChunkLoader config: cache_mb=%s, max_points=%s",
+            chunk_cache_mb,
+            self.max_points_per_plot,
         )
 
     def update_runtime_config(
-        self, *, cache_size: int | None = None, max_points_per_plot: int | None = None
+        self, *, cache_mb: int | None = None, max_points_per_plot: int | None = None
     ):
         """Update performance-related parameters at runtime (hot reconfiguration)."""
-        if cache_size is not None and cache_size > 0:
-            self._max_cache_size = int(cache_size)
-            # Trim cache if it exceeds the new limit
-            while len(self._cache_order) > self._max_cache_size:
-                oldest_key = self._cache_order.pop(0)
-                self._cache.pop(oldest_key, None)
+        if cache_mb is not None and cache_mb > 0:
+            # Evicts immediately if the cache exceeds the new limit
+            self._tiles.resize(int(cache_mb) * 1024 * 1024)
         if (
             max_points_per_plot is not None and max_points_per_plot > 100
         ):  # Protect against unrealistically low values
             self.max_points_per_plot = int(max_points_per_plot)
         self.logger.debug(
-            f"Runtime config updated: cache_size={self._max_cache_size}, max_points={self.max_points_per_plot}"
+            "Runtime config updated: cache_mb=%s, max_points=%s",
+            self._tiles.max_bytes // (1024 * 1024),
+            self.max_points_per_plot,
         )
 
-    def _generate_cache_key(
-        self, file_path: str, channel_names: list, start_sec: float, duration_sec: float
-    ) -> str:
-        """Generate a unique cache key for the chunk request (like working tree)."""
-        import hashlib
+    def request_chunk(
+        self,
+        channel_names: List[str],
+        start_sec: float,
+        duration_sec: float,
+        consumer: Hashable = None,
+        **hr_params,
+    ) -> int:
+        """
+        Request a chunk asynchronously; the result arrives through chunk_loaded.
 
-        key_data = (
-            f"{file_path}|{sorted(channel_names)}|{start_sec:.2f}|{duration_sec:.2f}"
-        )
-        return hashlib.md5(key_data.encode()).hexdigest()
+        Requests are coalesced per consumer: only the most recent pending request
+        is computed, a computation that becomes stale is abandoned between
+        channels, and new work is dispatched at most once per throttle_delay_ms
+        (the first request after an idle period is dispatched immediately).
+        Cache hits are delivered on the next event-loop iteration (and set
+        last_request_cache_hit).
 
-    def _get_from_cache(
-        self, cache_key: str
-    ) -> Optional[Tuple[float, float, Dict[str, np.ndarray]]]:
-        """Retrieve chunk from cache if available."""
-        if cache_key in self._cache:
-            # Move to end (most recently used)
-            self._cache_order.remove(cache_key)
-            self._cache_order.append(cache_key)
-            return self._cache[cache_key]
-        return None
-
-    def _store_in_cache(
-        self, cache_key: str, start: float, end: float, data: Dict[str, np.ndarray]
-    ):
-        """Store chunk data in cache with LRU eviction."""
-        if cache_key in self._cache:
-            self._cache_order.remove(cache_key)
-        elif len(self._cache) >= self._max_cache_size:
-            # Evict oldest entry
-            oldest_key = self._cache_order.pop(0)
-            del self._cache[oldest_key]
+        Args:
+            channel_names: Channels to load
+            start_sec: Window start in seconds
+            duration_sec: Window duration in seconds
+            consumer: Key identifying the requester (e.g. the tab); requests
+                      from different consumers do not cancel each other
+            **hr_params: hr_aurora generation parameters
+
+        Returns:
+            int: Request id, echoed as the last argument of chunk_loaded
+        """
+        self._request_seq += 1
+        request_id = self._request_seq
+        self._latest_ids[consumer] = request_id
+
+        request = (
+            request_id,
+            list(channel_names),
+            start_sec,
+            duration_sec,
+            dict(hr_params),
+        )
+        with span(
+            "ChunkLoader.request_chunk",
+            request_id=request_id,
+            start_sec=start_sec,
+            channels=len(channel_names),
+        ) as sp:
+            cached_result = self._try_assemble(*request[1:])
+            self.last_request_cache_hit = cached_result is not None
+            sp.set(cache_hit=self.last_request_cache_hit)
+        if cached_result is not None:
+            # Newer than anything pending or in flight for this consumer
+            self._pending.pop(consumer, None)
+            # Deliver on the next event-loop pass so the caller can record the id
+            QTimer.singleShot(
+                0, lambda: self._deliver(consumer, request, cached_result)
+            )
+            return request_id
 
-        self._cache[cache_key] = (start, end, data)
-        self._cache_order.append(cache_key)
+        self._pending[consumer] = request
+        if not self._throttle_timer.isActive():
+            self._dispatch_pending()
+            self._throttle_timer.start()
+        return request_id
 
-    def request_chunk(
+    def load_chunk(
         self,
         channel_names: List[str],
         start_sec: float,
         duration_sec: float,
         **hr_params,
+    ) -> Tuple[float, float, Dict[str, np.ndarray]]:
+        """
+        Synchronous chunk load (no signals); uses and fills the tile cache.
+
+        Returns:
+            (start_sec, end_sec, {channel: chunk_data})
+        """
+        result = self._compute_chunk(channel_names, start_sec, duration_sec, hr_params)
+        return start_sec, start_sec + duration_sec, result
+
+    def _dispatch_pending(self) -> None:
+        """Start the latest pending request of every consumer with nothing in flight."""
+        for consumer in list(self._pending):
+            if consumer in self._in_flight:
+                continue
+            request = self._pending.pop(consumer)
+            self._in_flight[consumer] = request
+            self._pool.start(_ChunkTask(self, consumer, request))
+
+        self._dispatch_prefetch()
+
+    def _is_stale(self, consumer: Hashable, request_id: int) -> bool:
+        if consumer is _PREFETCH:
+            # Prefetches are superseded by the next batch, not by each other
+            return request_id < self._prefetch_floor
+        return self._latest_ids.get(consumer) != request_id
+
+    def _on_task_finished(
+        self, consumer: Hashable, request_id: int, result: object, error: object
     ) -> None:
+        """GUI-thread completion of a worker task: cache, emit, dispatch next."""
+        request = self._in_flight.pop(consumer, None)
+
+        if consumer is _PREFETCH:
+            # Tiles were stored by the worker; nothing to deliver
+            self._schedule_cache_stats()
+            self._dispatch_pending()
+            return
+
+        if error is not None:
+            self.logger.error("Chunk request failed: %s", error)
+            if not self._is_stale(consumer, request_id):
+                self.chunk_error.emit(str(error))
+        elif result is not None and request is not None:
+            self._deliver(consumer, request, result)
+
+        if not self._throttle_timer.isActive():
+            self._dispatch_pending()
+
+    def _deliver(self, consumer: Hashable, request: tuple, result: tuple) -> None:
+        """Emit chunk_loaded unless a newer request of the consumer exists."""
+        request_id = request[0]
+        if self._is_stale(consumer, request_id):
+            self.logger.debug("Dropped stale chunk result #%s", request_id)
+            return
+        start_sec, end_sec, data = result
+        # Consumers draw in their chunk_loaded slots, so this span covers rendering
+        with span("ChunkLoader.deliver", request_id=request_id):
+            self.chunk_loaded.emit(start_sec, end_sec, data, request_id)
+        self._schedule_prefetch(request)
+        self._schedule_cache_stats()
+
+    def _schedule_prefetch(self, request: tuple) -> None:
         """
-        Simplified chunk request similar to previous working implementation.
+        Queue likely next windows of a delivered request for background loading.
+
+        Candidates, in order: the next and previous chunk (arrow buttons), one
+        wheel step forward and back, and windows centred on the comments nearest
+        to the viewport (comment list navigation). Start times are clamped and
+        truncated exactly as VisualizationBaseTab does, so that the navigation
+        request finds every tile of the window already cached.
         """
-        try:
-            # Check cache first
-            file_path = self.session.file_path
-            cache_key = self._generate_cache_key(
-                file_path, channel_names, start_sec, duration_sec
+        if not self.prefetch_enabled:
+            return
+
+        _, channel_names, start_sec, duration_sec, hr_params = request
+        file_path = self.session.file_path
+        data_manager = self.session.data_manager
+        # Recorded by the worker that computed the window: runs on the GUI
+        # thread, so nothing here may read the file or generate hr_aurora
+        total = self._durations.get(self._duration_key(channel_names[0], hr_params))
+        if total is None:
+            self.logger.debug(
+                "Prefetch skipped: duration of %s unknown", channel_names[0]
             )
-            cached_result = self._get_from_cache(cache_key)
-
-            if cached_result is not None:
-                start_cached, end_cached, data_cached = cached_result
-                self.chunk_loaded.emit(start_cached, end_cached, data_cached)
-                return
-
-            # Process chunk if not in cache
-            result = {}
-            data_manager = self.session.data_manager
-
-            for ch in channel_names:
-                try:
-                    ch_lower = ch.lower()
-                    if ch_lower in ("hr_gen", "hr_aurora"):
-                        # Normalize to canonical internal name
-                        sig = data_manager.get_trace(
-                            file_path, "hr_aurora", **hr_params
-                        )
-                    else:
-                        sig = data_manager.get_trace(file_path, ch)
-
-                    if sig is None:
-                        continue
-
-                    fs = sig.fs
-                    start_idx = int(start_sec * fs)
-                    end_idx = int((start_sec + duration_sec) * fs)
-                    chunk = sig.data[start_idx:end_idx]
-
-                    if len(chunk) > self.max_points_per_plot:
-                        chunk = self._apply_downsampling(chunk, fs, start_sec, ch)
+            return
+        max_start = max(0.0, total - duration_sec)
+
+        def clamp(t: float) -> float:
+            return float(int(min(max_start, max(0.0, t))))
+
+        starts = [
+            clamp(start_sec + duration_sec),
+            clamp(start_sec - duration_sec),
+            clamp(start_sec + self.prefetch_scroll_step),
+            clamp(start_sec - self.prefetch_scroll_step),
+        ]
+
+        if self.prefetch_comment_windows > 0:
+            center = start_sec + duration_sec / 2
+            reach = duration_sec * 5
+            nearby = data_manager.get_comments_in_range(
+                file_path, max(0.0, center - reach), center + reach
+            )
+            nearby = sorted(nearby, key=lambda c: abs(c.time - center))
+            for comment in nearby[: self.prefetch_comment_windows]:
+                starts.append(clamp(comment.time - duration_sec / 2))
+
+        # New batch supersedes whatever is still queued or in flight
+        self._prefetch_floor = self._request_seq + 1
+        self._prefetch_queue.clear()
+        seen = set()
+        for t in starts:
+            if t == start_sec or t in seen:
+                continue
+            seen.add(t)
+            self._request_seq += 1
+            self._prefetch_queue.append(
+                (self._request_seq, channel_names, t, duration_sec, hr_params)
+            )
+        self._dispatch_prefetch()
+
+    def _dispatch_prefetch(self) -> None:
+        """Run one queued prefetch at a time, only while no user request waits."""
+        if not self._prefetch_queue or self._pending or self._in_flight:
+            return
+        request = self._prefetch_queue.popleft()
+        if self._try_assemble(*request[1:]) is not None:
+            self._dispatch_prefetch()
+            return
+        self._in_flight[_PREFETCH] = request
+        self._pool.start(_ChunkTask(self, _PREFETCH, request), -1)
+
+    def _compute_chunk(
+        self,
+        channel_names: List[str],
+        start_sec: float,
+        duration_sec: float,
+        hr_params: dict,
+        is_stale: Optional[Callable[[], bool]] = None,
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Assemble every channel of a window, computing and caching missing tiles.
 
+        Returns None if is_stale() turns true between channels.
+        """
+        result = {}
+        end_sec = start_sec + duration_sec
+        if channel_names:
+            self._record_duration(channel_names[0], hr_params)
+
+        for ch in channel_names:
+            if is_stale is not None and is_stale():
+                return None
+            try:
+                with span("ChunkLoader.compute_channel", channel=ch):
+                    chunk = self._assemble_channel(
+                        ch, start_sec, end_sec, hr_params, compute=True
+                    )
+                if chunk is not None:
                     result[ch] = chunk
-                except Exception as e:
-                    self.logger.error(f"Error processing channel {ch}: {e}")
-                    continue
+            except Exception as e:
+                self.logger.error("Error processing channel %s: %s", ch, e)
+                continue
+
+        return result
+
+    @staticmethod
+    def _duration_key(channel: str, hr_params: dict) -> tuple:
+        if channel.lower() in ("hr_gen", "hr_aurora"):
+            return "hr_aurora", tuple(canonical_hr_params(**hr_params).items())
+        return channel, None
+
+    def _record_duration(self, channel: str, hr_params: dict) -> None:
+        """Worker: remember a channel's duration once (see _schedule_prefetch)."""
+        key = self._duration_key(channel, hr_params)
+        if key in self._durations:
+            return
+        try:
+            self._durations[key] = self.session.data_manager.get_channel_duration(
+                self.session.file_path, channel, **hr_params
+            )
+        except Exception as e:
+            self.logger.debug("Duration of %s unavailable: %s", channel, e)
 
-            self._store_in_cache(cache_key, start_sec, start_sec + duration_sec, result)
-            self.chunk_loaded.emit(start_sec, start_sec + duration_sec, result)
+    def _try_assemble(
+        self,
+        channel_names: List[str],
+        start_sec: float,
+        duration_sec: float,
+        hr_params: dict,
+    ) -> Optional[Tuple[float, float, Dict[str, np.ndarray]]]:
+        """Assemble a window purely from cached tiles; None if any tile is missing."""
+        end_sec = start_sec + duration_sec
+        result = {}
+        try:
+            for ch in channel_names:
+                chunk = self._assemble_channel(
+                    ch, start_sec, end_sec, hr_params, compute=False
+                )
+                if chunk is None:
+                    return None
+                result[ch] = chunk
         except Exception as e:
-            self.logger.error(f"Chunk request failed: {e}")
-            self.chunk_error.emit(str(e))
+            self.logger.debug("Cache assembly failed, computing instead: %s", e)
+            return None
+        return start_sec, end_sec, result
 
-    def _apply_downsampling(
-        self, chunk: np.ndarray, fs: float, start_sec: float, channel_name: str = ""
-    ) -> np.ndarray:
+    def _channel_source(
+        self, channel: str, hr_params: dict, generate: bool
+    ) -> Optional[Tuple[str, Optional[tuple], float, Callable[[int, int], np.ndarray]]]:
         """
-        Apply intelligent downsampling to chunk data for visualization performance.
+        Resolve a channel to (cache name, hr key, fs, read(start_idx, stop_idx)).
 
-        Uses adaptive decimation strategy:
-        - Small datasets: no downsampling
-        - Medium datasets: simple decimation
-        - Large datasets: block averaging to preserve signal characteristics
+        hr_aurora is only taken from memory unless generate is True, so cache
+        lookups on the GUI thread never trigger HR generation.
+        """
+        file_path = self.session.file_path
+        data_manager = self.session.data_manager
 
-        Args:
-            chunk: Original chunk data
-            fs: Sampling frequency
-            start_sec: Start time for time axis generation
-            channel_name: Name of the channel (for logging)
+        if channel.lower() in ("hr_gen", "hr_aurora"):
+            # Derived signal: normalize to canonical internal name
+            if generate:
+                sig = data_manager.get_trace(file_path, "hr_aurora", **hr_params)
+            else:
+                sig = data_manager.peek_trace(file_path, "hr_aurora", **hr_params)
+            if sig is None:
+                return None
+            # Same canonical key as DataManager's hr_cache: equivalent spellings
+            # share tiles, and changed detection settings get new ones
+            hr_key = tuple(canonical_hr_params(**hr_params).items())
+            # Dense HR is only materialized for the requested tile
+            return "hr_aurora", hr_key, sig.fs, sig.get_range
+
+        fs = data_manager.get_metadata(file_path)["fs"][channel]
+        return (
+            channel,
+            None,
+            fs,
+            lambda a, b: data_manager.read_samples(file_path, channel, a, b),
+        )
 
-        Returns:
-            Downsampled chunk data optimized for visualization
+    def _assemble_channel(
+        self,
+        channel: str,
+        start_sec: float,
+        end_sec: float,
+        hr_params: dict,
+        compute: bool,
+    ) -> Optional[np.ndarray]:
         """
-        if len(chunk) <= self.max_points_per_plot:
-            # No downsampling needed
-            return chunk
-
-        # Compute downsampling factor. For min-max strategy we duplicate points, so adjust step.
-        # Approximation: if step > 2 we use min-max → output_points ≈ 2 * len / step <= max_points ⇒ step >= 2*len/max
-        # First compute a base estimate (without duplication) then correct if needed.
-        base_step = max(1, int(np.ceil(len(chunk) / self.max_points_per_plot)))
-        # Ajuste para caso min-max (cuando el step final vaya a ser >2)
-        step = base_step
-        if base_step > 2:
-            target_step = int(np.ceil(2 * len(chunk) / self.max_points_per_plot))
-            step = max(base_step, target_step)
-
-        est_points = (
-            len(chunk) // step
-            if step <= 2
-            else min(self.max_points_per_plot, 2 * (len(chunk) // step) + 2)
-        )
-        self.logger.debug(
-            f"Downsampling {channel_name}: {len(chunk)} → ≤{est_points} points (step={step})"
-        )
+        Build one channel of a window from cache tiles.
 
-        # Apply intelligent decimation based on step size
-        if step <= 2:
-            # Simple decimation for small factors - preserves peaks
-            downsampled = chunk[::step]
-        else:
-            # For larger factors, use min-max decimation to preserve signal envelope
-            # This prevents losing important peaks and valleys
-            n_blocks = len(chunk) // step
-            remainder = len(chunk) % step
-
-            if n_blocks > 0:
-                # Reshape data into blocks for min-max extraction
-                reshaped = chunk[: n_blocks * step].reshape(n_blocks, step)
-
-                # Extract min and max from each block
-                mins = np.min(reshaped, axis=1)
-                maxs = np.max(reshaped, axis=1)
-
-                # Interleave mins and maxs to preserve envelope
-                downsampled = np.empty(n_blocks * 2)
-                downsampled[0::2] = mins
-                downsampled[1::2] = maxs
-
-                # Add remaining samples if any
-                if remainder > 0:
-                    remaining_chunk = chunk[n_blocks * step :]
-                    remaining_min = np.min(remaining_chunk)
-                    remaining_max = np.max(remaining_chunk)
-                    downsampled = np.append(downsampled, [remaining_min, remaining_max])
-            else:
-                # Fallback for very small chunks
-                downsampled = np.array([np.min(chunk), np.max(chunk)])
+        The resolution is the power-of-two bucket that fits max_points_per_plot
+        (1 = raw samples, otherwise interleaved min/max pairs). Tiles hold
+        TILE_BUCKETS buckets and are aligned to sample 0, so any window that
+        overlaps a previous one at the same resolution reuses its tiles.
 
-        self.logger.debug(
-            f"Downsampled {channel_name}: {len(chunk)} → {len(downsampled)} points"
-        )
+        Args:
+            compute: Compute and store missing tiles; if False, return None on
+                     the first missing tile
+        """
+        source = self._channel_source(channel, hr_params, generate=compute)
+        if source is None:
+            return None
+        name, hr_key, fs, read = source
+
+        start_idx = max(0, int(start_sec * fs))
+        end_idx = int(end_sec * fs)
+        if end_idx <= start_idx:
+            return np.array([])
+
+        bucket = bucket_size(end_idx - start_idx, self.max_points_per_plot)
+        tile_samples = bucket * self.TILE_BUCKETS
+        first = start_idx // tile_samples
+        last = (end_idx - 1) // tile_samples
+
+        tiles = []
+        for index in range(first, last + 1):
+            key = (name, hr_key, bucket, index)
+            tile = self._tiles.get(key)
+            if tile is None:
+                if not compute:
+                    return None
+                tile = self._compute_tile(name, hr_key, read, bucket, index)
+                self._tiles.put(key, tile)
+            tiles.append(tile)
+
+        data = tiles[0] if len(tiles) == 1 else np.concatenate(tiles)
+        if bucket == 1:
+            offset = first * tile_samples
+            return data[start_idx - offset : end_idx - offset]
+
+        offset = first * self.TILE_BUCKETS
+        lo = start_idx // bucket - offset
+        hi = -(-end_idx // bucket) - offset
+        return data[2 * lo : 2 * hi]
+
+    def _compute_tile(
+        self,
+        name: str,
+        hr_key: Optional[tuple],
+        read: Callable[[int, int], np.ndarray],
+        bucket: int,
+        index: int,
+    ) -> np.ndarray:
+        """Compute one tile: raw samples, or min/max from the LOD pyramid or raw."""
+        start = index * bucket * self.TILE_BUCKETS
+        stop = start + bucket * self.TILE_BUCKETS
+        with span("ChunkLoader.compute_tile", channel=name, bucket=bucket) as sp:
+            if bucket == 1:
+                return np.asarray(read(start, stop))
+
+            # Raw channels: coarse tiles come from the pyramid once it is built
+            if hr_key is None and self.lod_enabled and bucket >= 16:
+                pyramid = self._get_pyramid(name)
+                if pyramid is not None:
+                    sp.set(source="pyramid")
+                    first = index * self.TILE_BUCKETS
+                    return pyramid.buckets(
+                        bucket, first, first + self.TILE_BUCKETS, raw=read
+                    )
+
+            return minmax_envelope(np.asarray(read(start, stop)), bucket)
+
+    def _get_pyramid(self, channel: str) -> Optional[MinMaxPyramid]:
+        """
+        Return the channel's pyramid, loading or scheduling its build if needed.
+
+        Called from pool workers. File and disk-cache reads happen outside
+        _pyramid_lock (they may wait on the data manager's loader lock); only
+        the lookup and the registration of a restored pyramid or build thread
+        happen under it, so a channel is never built twice.
+        """
+        with self._pyramid_lock:
+            pyramid = self._pyramids.get(channel)
+            if pyramid is not None or channel in self._pyramid_builds:
+                return pyramid
+
+        file_path = self.session.file_path
+        data_manager = self.session.data_manager
+        n_samples = data_manager.get_n_samples(file_path, channel)
+
+        # Persisted pyramid from an earlier session
+        stored = data_manager.disk_cache.load_aux(file_path, f"lod:{channel}")
+        restored = None
+        if stored is not None and int(stored["n_samples"]) == n_samples:
+            restored = MinMaxPyramid(n_samples, int(stored["base_bucket"]))
+            restored.set_base_level(stored["mins"], stored["maxs"])
+
+        with self._pyramid_lock:
+            # Another worker may have registered the channel meanwhile
+            pyramid = self._pyramids.get(channel)
+            if pyramid is not None or channel in self._pyramid_builds:
+                return pyramid
+            if restored is not None:
+                self._pyramids[channel] = restored
+                self.logger.debug(
+                    "LOD pyramid for %s restored from disk cache", channel
+                )
+                return restored
+
+            thread = threading.Thread(
+                target=self._build_pyramid,
+                args=(channel, n_samples),
+                name=f"lod-{channel}",
+                daemon=True,
+            )
+            self._pyramid_builds[channel] = thread
+            thread.start()
+            return None
+
+    @traced("ChunkLoader.build_pyramid")
+    def _build_pyramid(self, channel: str, n_samples: int) -> None:
+        """Worker: stream the channel once and build its pyramid."""
+        file_path = self.session.file_path
+        data_manager = self.session.data_manager
+        try:
+            pyramid = MinMaxPyramid.build(
+                lambda a, b: data_manager.read_samples(file_path, channel, a, b),
+                n_samples,
+                should_stop=self._stop_builds.is_set,
+            )
+            if pyramid is None or not pyramid.ready:
+                return
 
-        return downsampled
+            with self._pyramid_lock:
+                self._pyramids[channel] = pyramid
+            mins, maxs = pyramid.levels[0]
+            data_manager.disk_cache.store_aux(
+                file_path,
+                f"lod:{channel}",
+                mins=mins,
+                maxs=maxs,
+                base_bucket=np.array(pyramid.base_bucket),
+                n_samples=np.array(n_samples),
+            )
+            self.logger.debug(
+                "LOD pyramid for %s built: %s levels, %.1f MB",
+                channel,
+                len(pyramid.levels),
+                pyramid.nbytes / 1e6,
+            )
+        except Exception as e:
+            self.logger.error("LOD pyramid build failed for %s: %s", channel, e)
 
     def _create_downsampled_time_axis(
         self,
@@ -345,8 +725,101 @@ class ChunkLoader(QObject):
 
             return time_axis
 
+    def get_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Sizes and counters of the chunk tile cache and the LOD pyramids.
+
+        Returns:
+            {"chunk_tiles": TileCache.get_stats(), "lod_pyramids": {entries, bytes}}
+        """
+        with self._pyramid_lock:
+            pyramids = list(self._pyramids.values())
+        return {
+            "chunk_tiles": self._tiles.get_stats(),
+            "lod_pyramids": {
+                "entries": len(pyramids),
+                "bytes": sum(p.nbytes for p in pyramids),
+            },
+        }
+
+    def _schedule_cache_stats(self) -> None:
+        if not self._stats_timer.isActive():
+            self._stats_timer.start()
+
+    def _emit_cache_stats(self) -> None:
+        self.cache_stats_updated.emit(self.get_cache_stats())
+
     def clear_cache(self) -> None:
         """Clear all cached chunk data."""
-        self._cache.clear()
-        self._cache_order.clear()
+        self._tiles.clear()
         self.logger.debug("Chunk cache cleared")
+
+    def invalidate_channel(self, channel: str) -> None:
+        """Drop cached tiles of one channel (e.g. after hr_aurora edits)."""
+        if channel.lower() in ("hr_gen", "hr_aurora"):
+            channel = "hr_aurora"
+        removed = self._tiles.discard(lambda key: key[0] == channel)
+        self.logger.debug("Invalidated %s cached tiles of %s", removed, channel)
+
+    def _on_hr_peaks_changed(self, file_path: str) -> None:
+        if file_path == self.session.file_path:
+            self.invalidate_channel("hr_aurora")
+
+    def cleanup(self) -> None:
+        """Stop background work and release cached data."""
+        try:
+            self.session.data_manager.hr_peaks_changed.disconnect(
+                self._on_hr_peaks_changed
+            )
+        except (RuntimeError, TypeError):
+            pass  # Already disconnected
+        self._throttle_timer.stop()
+        self._stats_timer.stop()
+        self._pending.clear()
+        self._prefetch_queue.clear()
+        self._prefetch_floor = self._request_seq + 1
+        self._latest_ids.clear()  # Marks in-flight tasks stale
+        self._pool.waitForDone(1000)
+        self._stop_builds.set()
+        with self._pyramid_lock:
+            builds = list(self._pyramid_builds.values())
+        for thread in builds:
+            thread.join(timeout=1.0)
+        with self._pyramid_lock:
+            self._pyramid_builds.clear()
+            self._pyramids.clear()
+        self._durations.clear()
+        self.clear_cache()
+
+
+# Consumer key of speculative (prefetch) tasks
+_PREFETCH = object()
+
+
+class _ChunkTask(QRunnable):
+    """Computes one chunk request on the ChunkLoader thread pool."""
+
+    def __init__(self, loader: ChunkLoader, consumer: Hashable, request: tuple):
+        super().__init__()
+        self.loader = loader
+        self.consumer = consumer
+        self.request = request
+
+    def run(self) -> None:
+        request_id, channel_names, start_sec, duration_sec, hr_params = self.request
+        result = None
+        error = None
+        try:
+            data = self.loader._compute_chunk(
+                channel_names,
+                start_sec,
+                duration_sec,
+                hr_params,
+                is_stale=lambda: self.loader._is_stale(self.consumer, request_id),
+            )
+            if data is not None:
+                result = (start_sec, start_sec + duration_sec, data)
+        except Exception as e:
+            error = str(e)
+        # Queued to the loader's (GUI) thread
+        self.loader._task_finished.emit(self.consumer, request_id, result, error)
@@ -1,8 +1,12 @@
 # processing/ecg_analyzer.py
 
+import os
 import numpy as np
 import warnings
-from typing import Optional, Dict, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional, Dict, Any, List, Tuple
+from aurora.core.config_manager import get_config_manager
+from aurora.core.tracing import span
 from aurora.processing.peak_detection_strategies import strategy_registry, PeakDetectionStrategy
 
 
@@ -15,6 +19,11 @@ class ECGAnalyzer:
     - SciPy-based detectors (basic filtering)  
     - Simple threshold detection
     - Custom user-defined strategies
+    - Segmented execution of any strategy over overlapping windows in a
+      thread or process pool (long recordings)
+    - Coarse-to-fine execution of any strategy: detection on a decimated
+      copy, refinement at full rate
+    - Single-pass streaming detection (Pan-Tompkins) with bounded memory
     
     The analyzer maintains backward compatibility while enabling easy integration
     of new detection algorithms.
@@ -25,6 +34,8 @@ class ECGAnalyzer:
                         fs: float,
                         method: str = "dwt",
                         strategy: Optional[PeakDetectionStrategy] = None,
+                        segment_sec: Optional[float] = None,
+                        decimation: Optional[int] = None,
                         **kwargs) -> np.ndarray:
         """
         Detect R-peaks in ECG signal using configurable detection strategies.
@@ -41,8 +52,16 @@ class ECGAnalyzer:
                 - "swt": Stationary Wavelet Transform (robust)
                 - "scipy_basic": SciPy find_peaks with bandpass filter
                 - "simple_threshold": Basic threshold detection (no dependencies)
+                - "pan_tompkins": Streaming Pan-Tompkins (adaptive thresholds)
             strategy (Optional[PeakDetectionStrategy]): Custom strategy instance.
                 If provided, overrides the method parameter.
+            segment_sec (Optional[float]): Segment length for segmented detection
+                (see detect_rr_peaks_segmented). None uses the hr_generation
+                "segment_sec" setting; 0 always processes the whole signal.
+                Signals shorter than two segments are processed whole.
+            decimation (Optional[int]): Coarse-to-fine decimation factor (see
+                detect_rr_peaks_coarse_to_fine). None uses the hr_generation
+                "coarse_decimation" setting; 1 detects at the native rate.
             **kwargs: Strategy-specific parameters. Common parameters:
                 - wavelet (str): Wavelet type for wavelet-based methods
                 - level (int): Decomposition level for SWT/DWT
@@ -73,6 +92,346 @@ class ECGAnalyzer:
                 ecg_data, fs=1000, strategy=custom_strategy
             )
         """
+        if segment_sec is None:
+            settings = get_config_manager().get_hr_generation_settings()
+            segment_sec = settings.get("segment_sec", 0)
+        
+        with span("ECGAnalyzer.detect_rr_peaks",
+                  method=strategy.name if strategy is not None else method,
+                  samples=len(ecg_signal)):
+            if segment_sec and len(ecg_signal) > 2 * segment_sec * fs:
+                return ECGAnalyzer.detect_rr_peaks_segmented(
+                    ecg_signal, fs, method=method, strategy=strategy,
+                    segment_sec=segment_sec, decimation=decimation, **kwargs
+                )
+            
+            return _detect_segment(ecg_signal, fs, method, strategy, decimation, kwargs)
+    
+    @staticmethod
+    def detect_rr_peaks_streaming(read_block: Callable[[int, int], np.ndarray],
+                                  n_samples: int,
+                                  fs: float,
+                                  block_sec: float = 10.0,
+                                  **kwargs) -> np.ndarray:
+        """
+        Detect R-peaks in a single pass without holding the ECG in memory.
+        
+        The ECG is read block by block through read_block(start, stop) (e.g. a
+        memory-mapped EDF channel) and fed to an OnlinePanTompkinsDetector, so
+        memory is bounded by the block size whatever the recording length.
+        For live data, use strategy_registry.get_strategy("pan_tompkins")
+        .create_detector(fs) and feed samples as they arrive.
+        
+        Args:
+            read_block: Returns ECG samples [start, stop)
+            n_samples (int): Number of samples to process
+            fs (float): Sampling frequency in Hz
+            block_sec (float): Seconds of ECG read per block
+            **kwargs: pan_tompkins parameters (see get_method_defaults)
+            
+        Returns:
+            np.ndarray: Sorted sample indices of the detected R-peaks
+        """
+        detector = strategy_registry.get_strategy("pan_tompkins").create_detector(fs, **kwargs)
+        block = max(1, int(block_sec * fs))
+        
+        peaks = [detector.feed(read_block(start, min(n_samples, start + block)))
+                 for start in range(0, n_samples, block)]
+        peaks.append(detector.flush())
+        return np.concatenate(peaks).astype(int)
+    
+    @staticmethod
+    def detect_rr_peaks_segmented(ecg_signal: np.ndarray,
+                                  fs: float,
+                                  method: str = "dwt",
+                                  strategy: Optional[PeakDetectionStrategy] = None,
+                                  segment_sec: Optional[float] = None,
+                                  overlap_sec: Optional[float] = None,
+                                  workers: Optional[int] = None,
+                                  executor: Optional[str] = None,
+                                  decimation: Optional[int] = None,
+                                  **kwargs) -> np.ndarray:
+        """
+        Detect R-peaks segment by segment, in parallel, and stitch the results.
+        
+        The signal is split into consecutive core segments of segment_sec. Each
+        segment is extended by overlap_sec on both sides so wavelet/filter edge
+        effects stay outside the core, the strategy runs on the extended window,
+        and only peaks inside the core are kept. A beat detected at slightly
+        different positions on both sides of a seam (closer than
+        min_distance_sec) is kept once, at the larger ECG amplitude.
+        
+        Peak memory is bounded by the segment size times the number of workers.
+        Note that amplitude thresholds (e.g. height_threshold_std) are computed
+        per segment rather than over the whole recording.
+        
+        Args:
+            ecg_signal (np.ndarray): Raw ECG signal, 1D numpy array
+            fs (float): Sampling frequency in Hz
+            method (str): Detection strategy name (see detect_rr_peaks)
+            strategy (Optional[PeakDetectionStrategy]): Custom strategy instance
+            segment_sec (Optional[float]): Core segment length in seconds
+            overlap_sec (Optional[float]): Context added on each side in seconds
+            workers (Optional[int]): Pool size; 0 uses all CPU cores
+            executor (Optional[str]): "thread" or "process" pool
+            decimation (Optional[int]): Coarse-to-fine factor for each segment
+            **kwargs: Strategy-specific parameters
+            
+        Defaults for segment_sec, overlap_sec, workers and executor come from
+        the hr_generation settings (segment_sec falls back to 300 s when the
+        setting is 0, i.e. when detect_rr_peaks does not segment).
+        
+        Returns:
+            np.ndarray: Sorted sample indices of the detected R-peaks
+        """
+        settings = get_config_manager().get_hr_generation_settings()
+        if segment_sec is None:
+            segment_sec = settings.get("segment_sec") or 300.0
+        if overlap_sec is None:
+            overlap_sec = settings.get("segment_overlap_sec", 5.0)
+        if workers is None:
+            workers = settings.get("detection_workers", 0)
+        if executor is None:
+            executor = settings.get("detection_executor", "thread")
+        
+        n = len(ecg_signal)
+        segments = ECGAnalyzer._segment_bounds(
+            n, int(segment_sec * fs), int(overlap_sec * fs)
+        )
+        workers = min(len(segments), workers or os.cpu_count() or 1)
+        
+        if workers <= 1:
+            results = [
+                _detect_segment(ecg_signal[start:stop], fs, method, strategy,
+                                decimation, kwargs)
+                for _, _, start, stop in segments
+            ]
+        else:
+            pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+            results = []
+            with pool_class(max_workers=workers) as pool:
+                # Submit one batch per worker round so a process pool never
+                # holds more than `workers` pickled segments at a time
+                for i in range(0, len(segments), workers):
+                    batch = [
+                        pool.submit(_detect_segment, ecg_signal[start:stop],
+                                    fs, method, strategy, decimation, kwargs)
+                        for _, _, start, stop in segments[i:i + workers]
+                    ]
+                    results.extend(future.result() for future in batch)
+        
+        # Keep the peaks inside each core, in absolute sample indices
+        per_segment = []
+        for (core_start, core_stop, start, _), peaks in zip(segments, results):
+            peaks = np.asarray(peaks, dtype=int) + start
+            per_segment.append(peaks[(peaks >= core_start) & (peaks < core_stop)])
+        
+        if strategy is not None:
+            defaults = strategy.get_default_params()
+        elif method in strategy_registry.list_strategies():
+            defaults = strategy_registry.get_strategy(method).get_default_params()
+        else:
+            defaults = {}
+        min_distance = int(
+            kwargs.get("min_distance_sec", defaults.get("min_distance_sec", 0.0)) * fs
+        )
+        
+        return ECGAnalyzer._stitch_segments(per_segment, ecg_signal, min_distance)
+    
+    @staticmethod
+    def detect_rr_peaks_coarse_to_fine(ecg_signal: np.ndarray,
+                                       fs: float,
+                                       method: str = "dwt",
+                                       strategy: Optional[PeakDetectionStrategy] = None,
+                                       decimation: int = 4,
+                                       refine_sec: Optional[float] = None,
+                                       **kwargs) -> np.ndarray:
+        """
+        Detect R-peaks on a decimated ECG and refine them at full rate.
+        
+        The ECG is low-pass filtered (polyphase FIR, delay compensated) and
+        decimated by `decimation`, the strategy runs on the coarse copy (its parameters are
+        in seconds, so they carry over), and each coarse peak is moved to the
+        ECG maximum within ±refine_sec of its full-rate position. Strategy work
+        shrinks by the decimation factor; refinement costs O(peaks).
+        
+        Results can differ from native-rate detection: peaks land on the raw
+        ECG maximum rather than where the strategy's own filtered signal peaks
+        (a few ms for filtering strategies), peaks refined onto the same sample
+        are merged, and leads with inverted polarity are not handled. This is
+        why the hr_generation "coarse_decimation" setting defaults to 1.
+        
+        Args:
+            ecg_signal (np.ndarray): Raw ECG signal, 1D numpy array
+            fs (float): Sampling frequency in Hz
+            method (str): Detection strategy name (see detect_rr_peaks)
+            strategy (Optional[PeakDetectionStrategy]): Custom strategy instance
+            decimation (int): Integer decimation factor (1 disables)
+            refine_sec (Optional[float]): Refinement half-window in seconds;
+                defaults to the hr_generation "coarse_refine_sec" setting
+            **kwargs: Strategy-specific parameters
+            
+        Returns:
+            np.ndarray: Sorted sample indices (full rate) of the R-peaks
+        """
+        decimation = int(decimation)
+        if decimation <= 1:
+            return ECGAnalyzer._detect_whole(ecg_signal, fs, method, strategy, **kwargs)
+        
+        try:
+            from scipy.signal import resample_poly
+        except ImportError:
+            warnings.warn("SciPy not available, detecting at the native rate")
+            return ECGAnalyzer._detect_whole(ecg_signal, fs, method, strategy, **kwargs)
+        
+        if refine_sec is None:
+            settings = get_config_manager().get_hr_generation_settings()
+            refine_sec = settings.get("coarse_refine_sec", 0.01)
+        
+        ecg = np.asarray(ecg_signal, dtype=np.float64)
+        coarse = resample_poly(ecg, 1, decimation)
+        coarse_peaks = ECGAnalyzer._detect_whole(
+            coarse, fs / decimation, method, strategy, **kwargs
+        )
+        
+        return ECGAnalyzer._refine_peaks(
+            ecg, np.asarray(coarse_peaks, dtype=int) * decimation,
+            max(decimation, int(round(refine_sec * fs)))
+        )
+    
+    @staticmethod
+    def _refine_peaks(ecg_signal: np.ndarray, approx_peaks: np.ndarray,
+                      half_window: int) -> np.ndarray:
+        """
+        Move each approximate peak to the signal maximum within ±half_window.
+        """
+        if len(approx_peaks) == 0:
+            return np.array([], dtype=int)
+        offsets = np.arange(-half_window, half_window + 1)
+        windows = np.clip(approx_peaks[:, None] + offsets, 0, len(ecg_signal) - 1)
+        refined = windows[np.arange(len(windows)), np.argmax(ecg_signal[windows], axis=1)]
+        return np.unique(refined)
+    
+    @staticmethod
+    def _resolve_decimation(fs: float, decimation: Optional[int]) -> int:
+        """
+        Decimation factor to use at a sampling rate (1 = native rate).
+        
+        The configured factor is reduced so the coarse rate never drops below
+        the hr_generation "coarse_min_fs" setting (QRS content must survive).
+        """
+        if decimation is not None:
+            return max(1, int(decimation))
+        settings = get_config_manager().get_hr_generation_settings()
+        decimation = int(settings.get("coarse_decimation", 1))
+        min_fs = float(settings.get("coarse_min_fs", 250.0))
+        return max(1, min(decimation, int(fs // min_fs)))
+    
+    @staticmethod
+    def compare_peaks(reference: np.ndarray, detected: np.ndarray, fs: float,
+                      tolerance_sec: float = 0.05) -> Dict[str, float]:
+        """
+        Compare detected R-peaks against reference peaks.
+        
+        A detected peak matches the nearest unmatched reference peak within
+        tolerance_sec (greedy, in time order).
+        
+        Args:
+            reference (np.ndarray): Reference peak indices (e.g. full-rate result)
+            detected (np.ndarray): Peak indices to evaluate
+            fs (float): Sampling frequency in Hz
+            tolerance_sec (float): Maximum distance for a match in seconds
+            
+        Returns:
+            Dict[str, float]: true_positives, false_positives, false_negatives,
+            sensitivity, ppv, mean_abs_error_ms and max_abs_error_ms (over matches)
+        """
+        reference = np.sort(np.asarray(reference, dtype=int))
+        detected = np.sort(np.asarray(detected, dtype=int))
+        tolerance = tolerance_sec * fs
+        
+        errors = []
+        i = j = 0
+        while i < len(reference) and j < len(detected):
+            diff = detected[j] - reference[i]
+            if abs(diff) <= tolerance:
+                errors.append(diff)
+                i += 1
+                j += 1
+            elif diff < 0:
+                j += 1
+            else:
+                i += 1
+        
+        tp = len(errors)
+        errors_ms = np.abs(np.asarray(errors, dtype=float)) * 1000.0 / fs
+        return {
+            "true_positives": tp,
+            "false_positives": len(detected) - tp,
+            "false_negatives": len(reference) - tp,
+            "sensitivity": tp / len(reference) if len(reference) else 1.0,
+            "ppv": tp / len(detected) if len(detected) else 1.0,
+            "mean_abs_error_ms": float(errors_ms.mean()) if tp else 0.0,
+            "max_abs_error_ms": float(errors_ms.max()) if tp else 0.0,
+        }
+    
+    @staticmethod
+    def _segment_bounds(n: int, segment: int,
+                        overlap: int) -> List[Tuple[int, int, int, int]]:
+        """
+        Split [0, n) into cores of `segment` samples extended by `overlap`.
+        
+        Returns:
+            List of (core_start, core_stop, start, stop) tuples
+        """
+        segment = max(1, segment)
+        bounds = []
+        for core_start in range(0, n, segment):
+            core_stop = min(n, core_start + segment)
+            bounds.append((core_start, core_stop,
+                           max(0, core_start - overlap), min(n, core_stop + overlap)))
+        return bounds
+    
+    @staticmethod
+    def _stitch_segments(per_segment: List[np.ndarray], ecg_signal: np.ndarray,
+                         min_distance: int) -> np.ndarray:
+        """
+        Concatenate per-segment peaks, dropping seam duplicates.
+        
+        The first peaks of each segment are compared with the last peaks kept
+        before the seam, from whichever earlier segment they come, until the
+        two sides are min_distance apart; of each close pair the larger ECG
+        amplitude is kept. Within a segment the strategy's own spacing is kept.
+        """
+        stitched: List[np.ndarray] = []  # Non-empty arrays only
+        for peaks in per_segment:
+            while min_distance > 0 and stitched and len(peaks):
+                last = stitched[-1]
+                if peaks[0] - last[-1] >= min_distance:
+                    break
+                if ecg_signal[peaks[0]] > ecg_signal[last[-1]]:
+                    if len(last) > 1:
+                        stitched[-1] = last[:-1]
+                    else:
+                        stitched.pop()
+                else:
+                    peaks = peaks[1:]
+            if len(peaks):
+                stitched.append(peaks)
+        
+        if not stitched:
+            return np.array([], dtype=int)
+        return np.sort(np.concatenate(stitched))
+    
+    @staticmethod
+    def _detect_whole(ecg_signal: np.ndarray,
+                      fs: float,
+                      method: str = "dwt",
+                      strategy: Optional[PeakDetectionStrategy] = None,
+                      **kwargs) -> np.ndarray:
+        """
+        Run one strategy over the whole signal, with the fallback chain.
+        """
         # Use custom strategy if provided
         if strategy is not None:
             try:
@@ -158,4 +517,22 @@ class ECGAnalyzer:
             ValueError: If method is not available
         """
         strategy = strategy_registry.get_strategy(method)
-        return strategy.get_default_params()
\ No newline at end of file
+        return strategy.get_default_params()
+
+
+def _detect_segment(segment: np.ndarray, fs: float, method: str,
+                    strategy: Optional[PeakDetectionStrategy],
+                    decimation: Optional[int],
+                    kwargs: Dict[str, Any]) -> np.ndarray:
+    """
+    Detect one block at the native rate or coarse-to-fine.
+    
+    Also the pool task of detect_rr_peaks_segmented (module level so it pickles).
+    """
+    decimation = ECGAnalyzer._resolve_decimation(fs, decimation)
+    with span("ECGAnalyzer.detect_segment", samples=len(segment), decimation=decimation):
+        if decimation > 1:
+            return ECGAnalyzer.detect_rr_peaks_coarse_to_fine(
+                np.asarray(segment), fs, method, strategy, decimation=decimation, **kwargs
+            )
+        return ECGAnalyzer._detect_whole(np.asarray(segment), fs, method, strategy, **kwargs)
@@ -9,6 +9,7 @@ import numpy as np
 from typing import Dict, Tuple, List, Optional, Any
 import logging
 from aurora.core.signal import Signal
+from aurora.core.tracing import traced
 
 
 class HemodynamicAnalyzer:
@@ -209,13 +210,21 @@ class HemodynamicAnalyzer:
         results = {}
 
         for time_point in time_points:
+            # Only samples within the ±2s tolerance can qualify
+            time_data, data = HemodynamicAnalyzer.slice_by_time(
+                signal, time_point - 2.0, time_point + 2.0
+            )
+            if len(time_data) == 0:
+                results[time_point] = np.nan
+                continue
+
             # Find closest index to requested time
-            time_diff = np.abs(signal.time - time_point)
+            time_diff = np.abs(time_data - time_point)
             closest_idx = np.argmin(time_diff)
 
             # Ensure within ±2s tolerance
             if time_diff[closest_idx] <= 2.0:
-                results[time_point] = float(signal.data[closest_idx])
+                results[time_point] = float(data[closest_idx])
             else:
                 results[time_point] = np.nan
 
@@ -236,12 +245,15 @@ class HemodynamicAnalyzer:
             Returns:
                 Dict with computed statistics
         """
-        mask = (signal.time >= start_time) & (signal.time <= end_time)
+        time_data, data = HemodynamicAnalyzer.slice_by_time(
+            signal, start_time, end_time
+        )
+        mask = (time_data >= start_time) & (time_data <= end_time)
 
         if not np.any(mask):
             return {"mean": np.nan, "max": np.nan, "min": np.nan}
 
-        windowed_data = signal.data[mask]
+        windowed_data = data[mask]
 
         return {
             "mean": float(np.nanmean(windowed_data)),
@@ -249,6 +261,41 @@ class HemodynamicAnalyzer:
             "min": float(np.nanmin(windowed_data)),
         }
 
+    @staticmethod
+    def slice_by_time(
+        signal: Signal, start_time: float, end_time: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Materialize (time, data) covering [start_time, end_time] of a signal.
+
+        Indices are derived from the sampling rate, so derived signals such as
+        hr_aurora only expand the requested slice. The result may include one
+        extra sample at each edge; callers apply their exact time mask.
+
+            Args:
+                signal: Uniformly sampled signal
+                start_time: Start time (s)
+                end_time: End time (s)
+
+            Returns:
+                Tuple[np.ndarray, np.ndarray]: (time, data)
+        """
+        n = len(signal)
+        if n == 0 or end_time < start_time:
+            return np.array([]), np.array([])
+
+        t0 = float(signal.get_time_range(0, 1)[0])
+        start_time = max(start_time, t0)
+        start_idx = max(0, int(np.floor((start_time - t0) * signal.fs)) - 1)
+        stop_idx = min(n, int(np.ceil((end_time - t0) * signal.fs)) + 2)
+        if start_idx >= stop_idx:
+            return np.array([]), np.array([])
+        return (
+            signal.get_time_range(start_idx, stop_idx),
+            signal.get_range(start_idx, stop_idx),
+        )
+
+    @traced("HemodynamicAnalyzer.prepare_hemodynamic_analysis")
     def prepare_hemodynamic_analysis(
         self, signals: Dict[str, Signal], protocol: str = "stand"
     ) -> Dict[str, Any]:
@@ -309,9 +356,10 @@ class HemodynamicAnalyzer:
             try:
                 # Find HR peaks
                 nadir_time = results["nadir_events"].get("time")
-                peak_info = self.find_peak_hr_events(
-                    hr_signal.data, hr_signal.time, nadir_time
-                )
+                # Peak searches never look past 10 min (or 60s after nadir)
+                search_end = max(600.0, (nadir_time or 0.0) + 60.0)
+                hr_time, hr_data = self.slice_by_time(hr_signal, 0.0, search_end)
+                peak_info = self.find_peak_hr_events(hr_data, hr_time, nadir_time)
                 results["peak_events"] = peak_info
 
                 # Standard temporal windows
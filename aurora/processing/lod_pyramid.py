@@ -0,0 +1,206 @@
+"""
+Level-of-detail min/max pyramid for chunk rendering.
+
+A MinMaxPyramid stores, for power-of-two bucket sizes, the NaN-aware minimum and
+maximum of every bucket of a signal. Querying a window at a point budget picks
+the coarsest level that still fits, so the work per request depends on the
+number of points drawn rather than on the window duration.
+"""
+
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+
+class MinMaxPyramid:
+    """
+    Power-of-two min/max pyramid over a 1D signal.
+
+    Level k aggregates buckets of base_bucket * 2**k samples. The base level is
+    built by streaming blocks of the source signal (see build()); higher levels
+    are pairwise reductions of the level below. Buckets that contain only NaN
+    stay NaN; otherwise NaN samples are ignored (np.fmin/np.fmax semantics).
+
+    Windows that need buckets smaller than base_bucket are reduced directly from
+    the raw samples, which are at most base_bucket * max_points / 2 long.
+    """
+
+    def __init__(self, n_samples: int, base_bucket: int = 16, dtype=np.float64):
+        if base_bucket < 2 or base_bucket & (base_bucket - 1):
+            raise ValueError("base_bucket must be a power of two >= 2")
+        self.n_samples = int(n_samples)
+        self.base_bucket = int(base_bucket)
+        self.dtype = np.dtype(dtype)
+        self.levels: List[Tuple[np.ndarray, np.ndarray]] = []
+
+    @property
+    def ready(self) -> bool:
+        """True once the base level has been built."""
+        return bool(self.levels)
+
+    @classmethod
+    def build(
+        cls,
+        read_block: Callable[[int, int], np.ndarray],
+        n_samples: int,
+        base_bucket: int = 16,
+        block_buckets: int = 65536,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> Optional["MinMaxPyramid"]:
+        """
+        Build a pyramid by streaming the source through read_block(start, stop).
+
+        Args:
+            read_block: Returns samples [start, stop) of the source signal
+            n_samples: Total number of samples
+            base_bucket: Samples per bucket at level 0 (power of two)
+            block_buckets: Base buckets reduced per read (bounds peak memory)
+            should_stop: Optional callable polled between blocks to abort
+
+        Returns:
+            The built pyramid, or None if aborted
+        """
+        n_buckets = -(-int(n_samples) // base_bucket)
+        mins = None
+        maxs = None
+        block_len = base_bucket * block_buckets
+
+        for start in range(0, n_samples, block_len):
+            if should_stop is not None and should_stop():
+                return None
+            stop = min(n_samples, start + block_len)
+            block = np.asarray(read_block(start, stop))
+            if mins is None:
+                dtype = np.result_type(block.dtype, np.float32)
+                mins = np.empty(n_buckets, dtype=dtype)
+                maxs = np.empty(n_buckets, dtype=dtype)
+            b_min, b_max = _reduce_buckets(block, base_bucket, mins.dtype)
+            first = start // base_bucket
+            mins[first : first + len(b_min)] = b_min
+            maxs[first : first + len(b_max)] = b_max
+
+        pyramid = cls(n_samples, base_bucket, mins.dtype if mins is not None else None)
+        if mins is not None:
+            pyramid.set_base_level(mins, maxs)
+        return pyramid
+
+    def set_base_level(self, mins: np.ndarray, maxs: np.ndarray) -> None:
+        """Install the base level (e.g. restored from disk) and derive the others."""
+        self.levels = [(np.asarray(mins), np.asarray(maxs))]
+        while len(self.levels[-1][0]) > 1:
+            prev_min, prev_max = self.levels[-1]
+            if len(prev_min) % 2:
+                prev_min = np.append(prev_min, np.nan)
+                prev_max = np.append(prev_max, np.nan)
+            self.levels.append(
+                (
+                    np.fmin(prev_min[0::2], prev_min[1::2]),
+                    np.fmax(prev_max[0::2], prev_max[1::2]),
+                )
+            )
+
+    def query(
+        self,
+        start_idx: int,
+        end_idx: int,
+        max_points: int,
+        raw: Optional[Callable[[int, int], np.ndarray]] = None,
+    ) -> Optional[np.ndarray]:
+        """
+        Return interleaved [min, max, min, max, ...] for samples [start_idx, end_idx).
+
+        The result has at most max_points values (plus one trailing pair when the
+        window is not bucket-aligned). Returns None when the window does not need
+        downsampling, so the caller can use the raw samples instead.
+
+        Args:
+            start_idx: First sample of the window
+            end_idx: End sample of the window (exclusive)
+            max_points: Point budget for the window
+            raw: read_block(start, stop) used when the needed bucket is smaller
+                 than the base level
+        """
+        start_idx = max(0, int(start_idx))
+        end_idx = min(self.n_samples, int(end_idx))
+        bucket = bucket_size(end_idx - start_idx, max_points)
+        if bucket == 1:
+            return None
+        return self.buckets(bucket, start_idx // bucket, -(-end_idx // bucket), raw)
+
+    def buckets(
+        self,
+        bucket: int,
+        first: int,
+        last: int,
+        raw: Optional[Callable[[int, int], np.ndarray]] = None,
+    ) -> Optional[np.ndarray]:
+        """
+        Return the interleaved min/max of buckets [first, last) of a given size.
+
+        Bucket i covers samples [i * bucket, (i + 1) * bucket). Sizes below the
+        base level (or any size before the pyramid is built) are reduced from
+        raw(start, stop); None is returned if raw is not given in that case.
+        """
+        level = (
+            int(np.log2(bucket // self.base_bucket))
+            if bucket >= self.base_bucket
+            else -1
+        )
+        if 0 <= level < len(self.levels):
+            mins, maxs = self.levels[level]
+            return _interleave(mins[first:last], maxs[first:last])
+
+        if raw is None:
+            return None
+        start = first * bucket
+        stop = min(self.n_samples, last * bucket)
+        return minmax_envelope(np.asarray(raw(start, stop)), bucket)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by all levels."""
+        return sum(m.nbytes + x.nbytes for m, x in self.levels)
+
+
+def bucket_size(n_samples: int, max_points: int) -> int:
+    """
+    Power-of-two samples per bucket needed to draw n_samples within max_points.
+
+    Returns 1 when no downsampling is needed (each bucket contributes a min and
+    a max, so 2 * n_samples / bucket <= max_points).
+    """
+    if n_samples <= max_points or max_points < 2:
+        return 1
+    return 1 << int(np.ceil(np.log2(2 * n_samples / max_points)))
+
+
+def minmax_envelope(block: np.ndarray, bucket: int) -> np.ndarray:
+    """Interleaved NaN-aware min/max of consecutive buckets of block."""
+    dtype = np.result_type(block.dtype, np.float32)
+    mins, maxs = _reduce_buckets(block, bucket, dtype)
+    return _interleave(mins, maxs)
+
+
+def _reduce_buckets(
+    block: np.ndarray, bucket: int, dtype
+) -> Tuple[np.ndarray, np.ndarray]:
+    """NaN-aware min/max of consecutive buckets; the last bucket may be partial."""
+    n_full = len(block) // bucket
+    tail = len(block) - n_full * bucket
+    head = block[: n_full * bucket].astype(dtype, copy=False).reshape(n_full, bucket)
+
+    with np.errstate(invalid="ignore"):
+        mins = np.fmin.reduce(head, axis=1)
+        maxs = np.fmax.reduce(head, axis=1)
+        if tail:
+            rest = block[n_full * bucket :].astype(dtype, copy=False)
+            mins = np.append(mins, np.fmin.reduce(rest))
+            maxs = np.append(maxs, np.fmax.reduce(rest))
+    return mins, maxs
+
+
+def _interleave(mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+    out = np.empty(2 * len(mins), dtype=mins.dtype)
+    out[0::2] = mins
+    out[1::2] = maxs
+    return out
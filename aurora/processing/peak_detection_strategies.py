@@ -3,13 +3,23 @@ Peak detection strategies for signal analysis using the Strategy design pattern.
 
 This module provides a flexible framework for implementing various peak detection
 algorithms for any type of physiological signal, including ECG, blood pressure, etc.
+
+Strategies with an expensive transform (wavelets, filtering) are split into a
+preprocessing stage and a peak-picking stage. Preprocessing output is cached per
+signal content and preprocessing parameters, so sweeps that only change
+thresholds or minimum distances rerun find_peaks alone.
 """
 
+import hashlib
+import threading
+import weakref
 import numpy as np
 import warnings
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from collections import deque
+from typing import Dict, Any, List, Optional, Tuple
 from aurora.core.config_manager import get_config_manager
+from aurora.processing.tile_cache import TileCache
 
 
 class PeakDetectionStrategy(ABC):
@@ -20,6 +30,10 @@ class PeakDetectionStrategy(ABC):
     enabling easy switching between different detection methods for any signal type.
     """
     
+    # Detector version: increase whenever a change alters the detected peaks,
+    # so automatically detected peaks persisted by RPeakStore are recomputed
+    version: int = 1
+    
     @abstractmethod
     def detect_peaks(self, signal: np.ndarray, fs: float, **kwargs) -> np.ndarray:
         """
@@ -63,7 +77,60 @@ class PeakDetectionStrategy(ABC):
         return ["generic"]  # Override in subclasses for specific signals
 
 
-class WaveletSWTStrategy(PeakDetectionStrategy):
+class StagedPeakDetectionStrategy(PeakDetectionStrategy):
+    """
+    Peak detection split into a cached preprocessing stage and peak picking.
+    
+    Subclasses implement preprocess() and pick_peaks() and list in
+    preprocess_params the parameters that affect preprocessing. detect_peaks()
+    reuses cached preprocessing output when the signal content and those
+    parameters match a previous call.
+    """
+    
+    preprocess_params: Tuple[str, ...] = ()
+    
+    @abstractmethod
+    def preprocess(self, signal: np.ndarray, fs: float, params: Dict[str, Any]) -> np.ndarray:
+        """
+        Transform the raw signal (e.g. wavelet reconstruction, filtering).
+        
+        Only parameters named in preprocess_params may be used here.
+        """
+        pass
+    
+    @abstractmethod
+    def pick_peaks(self, processed: np.ndarray, fs: float, params: Dict[str, Any]) -> np.ndarray:
+        """
+        Find peaks in the preprocessed signal (must not modify it).
+        """
+        pass
+    
+    def detect_peaks(self, signal: np.ndarray, fs: float, **kwargs) -> np.ndarray:
+        """
+        Detect peaks, reusing cached preprocessing output when possible.
+        """
+        params = self.get_default_params()
+        params.update(kwargs)
+        
+        cache = get_preprocessing_cache()
+        key = (
+            self.name,
+            signal_fingerprint(signal),
+            float(fs),
+            tuple(params.get(name) for name in self.preprocess_params),
+        )
+        processed = cache.get(key)
+        if processed is None:
+            processed = np.asarray(self.preprocess(signal, fs, params))
+            # Shared between calls: make accidental in-place edits fail loudly
+            processed.flags.writeable = False
+            if processed.nbytes <= cache.max_bytes:
+                cache.put(key, processed)
+        
+        return self.pick_peaks(processed, fs, params)
+
+
+class WaveletSWTStrategy(StagedPeakDetectionStrategy):
     """
     Stationary Wavelet Transform (SWT) based peak detection strategy.
     
@@ -92,34 +159,27 @@ class WaveletSWTStrategy(PeakDetectionStrategy):
             "height_threshold_std": 1.0  # Threshold as multiple of signal std
         }
     
-    def detect_peaks(self, signal: np.ndarray, fs: float, **kwargs) -> np.ndarray:
+    preprocess_params = ("wavelet", "level")
+    
+    def preprocess(self, signal: np.ndarray, fs: float, params: Dict[str, Any]) -> np.ndarray:
         """
-        Detect peaks using Stationary Wavelet Transform.
+        Reconstruct the signal through SWT/ISWT.
         
         Args:
             signal: Raw signal
             fs: Sampling frequency 
-            wavelet: Wavelet type (default: 'db3')
-            level: Decomposition level (default: 4)
-            min_distance_sec: Minimum interval between peaks in seconds
-            height_threshold_std: Height threshold as multiple of signal std
+            params: wavelet (default: 'db3') and level (default: 4)
             
         Returns:
-            Array of peak indices
+            Reconstructed signal
         """
         try:
             import pywt
-            from scipy.signal import find_peaks
         except ImportError as e:
             raise ImportError("PyWavelets and SciPy are required for SWT strategy") from e
         
-        params = self.get_default_params()
-        params.update(kwargs)
-        
         wavelet = params["wavelet"]
         level = params["level"]
-        min_distance_sec = params["min_distance_sec"]
-        height_threshold_std = params["height_threshold_std"]
         
         # Adjust level to maximum allowed by signal length
         max_level = pywt.swt_max_level(len(signal))
@@ -131,21 +191,39 @@ class WaveletSWTStrategy(PeakDetectionStrategy):
         coeffs = pywt.swt(signal, wavelet, level=level)
         
         # Reconstruct signal using ISWT
-        reconstructed = pywt.iswt(coeffs, wavelet)
+        return pywt.iswt(coeffs, wavelet)
+    
+    def pick_peaks(self, processed: np.ndarray, fs: float, params: Dict[str, Any]) -> np.ndarray:
+        """
+        Find peaks in the reconstructed signal.
+        
+        Args:
+            processed: Reconstructed signal
+            fs: Sampling frequency 
+            params: min_distance_sec (minimum interval between peaks in seconds)
+                    and height_threshold_std (height threshold as multiple of std)
+            
+        Returns:
+            Array of peak indices
+        """
+        try:
+            from scipy.signal import find_peaks
+        except ImportError as e:
+            raise ImportError("PyWavelets and SciPy are required for SWT strategy") from e
         
         # Calculate detection parameters
-        min_distance = int(min_distance_sec * fs)
-        height_threshold = np.std(reconstructed) * height_threshold_std
+        min_distance = int(params["min_distance_sec"] * fs)
+        height_threshold = np.std(processed) * params["height_threshold_std"]
         
         # Detect peaks in reconstructed signal
-        peaks, _ = find_peaks(reconstructed, 
+        peaks, _ = find_peaks(processed, 
                             distance=min_distance,
                             height=height_threshold)
         
         return peaks
 
 
-class WaveletDWTStrategy(PeakDetectionStrategy):
+class WaveletDWTStrategy(StagedPeakDetectionStrategy):
     """
     Discrete Wavelet Transform (DWT) based peak detection strategy.
     
@@ -177,54 +255,62 @@ class WaveletDWTStrategy(PeakDetectionStrategy):
             "height_threshold_std": 1.0
         }
     
-    def detect_peaks(self, signal: np.ndarray, fs: float, **kwargs) -> np.ndarray:
+    preprocess_params = ("wavelet", "level")
+    
+    def preprocess(self, signal: np.ndarray, fs: float, params: Dict[str, Any]) -> np.ndarray:
         """
-        Detect peaks using Discrete Wavelet Transform.
+        Reconstruct the signal through DWT decomposition/reconstruction.
         
         Args:
             signal: Raw signal
             fs: Sampling frequency
-            wavelet: Wavelet type (default: 'haar')
-            level: Decomposition level (default: 4)
-            min_distance_sec: Minimum interval between peaks in seconds
-            height_threshold_std: Height threshold as multiple of signal std
+            params: wavelet (default: 'haar') and level (default: 4)
             
         Returns:
-            Array of peak indices
+            Reconstructed signal
         """
         try:
             import pywt
-            from scipy.signal import find_peaks
         except ImportError as e:
             raise ImportError("PyWavelets and SciPy are required for DWT strategy") from e
         
-        params = self.get_default_params()
-        params.update(kwargs)
-        
-        wavelet = params["wavelet"]
-        level = params["level"] 
-        min_distance_sec = params["min_distance_sec"]
-        height_threshold_std = params["height_threshold_std"]
-        
         # Perform DWT decomposition
-        coeffs = pywt.wavedec(signal, wavelet, level=level)
+        coeffs = pywt.wavedec(signal, params["wavelet"], level=params["level"])
         
         # Reconstruct signal 
-        reconstructed = pywt.waverec(coeffs, wavelet)
+        return pywt.waverec(coeffs, params["wavelet"])
+    
+    def pick_peaks(self, processed: np.ndarray, fs: float, params: Dict[str, Any]) -> np.ndarray:
+        """
+        Find peaks in the reconstructed signal.
+        
+        Args:
+            processed: Reconstructed signal
+            fs: Sampling frequency
+            params: min_distance_sec (minimum interval between peaks in seconds)
+                    and height_threshold_std (height threshold as multiple of std)
+            
+        Returns:
+            Array of peak indices
+        """
+        try:
+            from scipy.signal import find_peaks
+        except ImportError as e:
+            raise ImportError("PyWavelets and SciPy are required for DWT strategy") from e
         
         # Calculate detection parameters
-        min_distance = int(min_distance_sec * fs)
-        height_threshold = np.std(reconstructed) * height_threshold_std
+        min_distance = int(params["min_distance_sec"] * fs)
+        height_threshold = np.std(processed) * params["height_threshold_std"]
         
         # Detect peaks in reconstructed signal
-        peaks, _ = find_peaks(reconstructed, 
+        peaks, _ = find_peaks(processed, 
                             distance=min_distance,
                             height=height_threshold)
         
         return peaks
 
 
-class ScipyBasicStrategy(PeakDetectionStrategy):
+class ScipyBasicStrategy(StagedPeakDetectionStrategy):
     """
     Basic peak detection using SciPy's find_peaks with preprocessing.
     
@@ -253,30 +339,26 @@ class ScipyBasicStrategy(PeakDetectionStrategy):
             "high_cutoff": 40.0,  # Hz
         }
     
-    def detect_peaks(self, signal: np.ndarray, fs: float, **kwargs) -> np.ndarray:
+    preprocess_params = ("filter_signal", "low_cutoff", "high_cutoff")
+    
+    def preprocess(self, signal: np.ndarray, fs: float, params: Dict[str, Any]) -> np.ndarray:
         """
-        Detect peaks using SciPy find_peaks with optional filtering.
+        Optionally bandpass-filter the signal.
         
         Args:
             signal: Raw signal
             fs: Sampling frequency
-            min_distance_sec: Minimum interval between peaks in seconds
-            height_threshold_std: Height threshold as multiple of signal std
-            filter_signal: Whether to apply bandpass filter
-            low_cutoff: Low cutoff frequency for bandpass filter (Hz)
-            high_cutoff: High cutoff frequency for bandpass filter (Hz)
+            params: filter_signal (whether to apply bandpass filter),
+                    low_cutoff and high_cutoff (bandpass cutoffs in Hz)
             
         Returns:
-            Array of peak indices
+            Filtered (or copied) signal
         """
         try:
-            from scipy.signal import find_peaks, butter, filtfilt
+            from scipy.signal import butter, filtfilt
         except ImportError as e:
             raise ImportError("SciPy is required for scipy_basic strategy") from e
         
-        params = self.get_default_params()
-        params.update(kwargs)
-        
         processed_signal = signal.copy()
         
         # Optional bandpass filtering
@@ -291,18 +373,343 @@ class ScipyBasicStrategy(PeakDetectionStrategy):
             except Exception as e:
                 warnings.warn(f"Filtering failed: {e}, using unfiltered signal")
         
+        return processed_signal
+    
+    def pick_peaks(self, processed: np.ndarray, fs: float, params: Dict[str, Any]) -> np.ndarray:
+        """
+        Find peaks in the filtered signal.
+        
+        Args:
+            processed: Filtered signal
+            fs: Sampling frequency
+            params: min_distance_sec (minimum interval between peaks in seconds)
+                    and height_threshold_std (height threshold as multiple of std)
+            
+        Returns:
+            Array of peak indices
+        """
+        try:
+            from scipy.signal import find_peaks
+        except ImportError as e:
+            raise ImportError("SciPy is required for scipy_basic strategy") from e
+        
         # Calculate detection parameters
         min_distance = int(params["min_distance_sec"] * fs)
-        height_threshold = np.std(processed_signal) * params["height_threshold_std"]
+        height_threshold = np.std(processed) * params["height_threshold_std"]
         
         # Find peaks
-        peaks, _ = find_peaks(processed_signal, 
+        peaks, _ = find_peaks(processed, 
                             distance=min_distance,
                             height=height_threshold)
         
         return peaks
 
 
+class OnlinePanTompkinsDetector:
+    """
+    Incremental Pan-Tompkins QRS detector with bounded state.
+    
+    Samples are pushed with feed() in blocks of any size (a whole recording
+    split into blocks, or live data as it arrives) and each call returns the
+    R-peaks confirmed by that block, as absolute sample indices. The pipeline
+    is the classic one: causal band-pass, five-point derivative, squaring and
+    moving-window integration, followed by adaptive signal/noise thresholds,
+    a refractory period, T-wave rejection by slope and search-back for missed
+    beats. Each R-peak is placed on the ECG maximum just before the
+    integrator peak.
+    
+    Filter states, the integration window and the search history are carried
+    between calls, so memory does not grow with the number of samples fed and
+    the peaks do not depend on how the signal is split into blocks.
+    """
+    
+    def __init__(self, fs: float,
+                 low_cutoff: float = 5.0,
+                 high_cutoff: float = 15.0,
+                 integration_sec: float = 0.15,
+                 refractory_sec: float = 0.2,
+                 t_wave_sec: float = 0.36,
+                 learning_sec: float = 2.0):
+        try:
+            from scipy.signal import butter, lfilter_zi
+        except ImportError as e:
+            raise ImportError("SciPy is required for pan_tompkins strategy") from e
+        
+        self.fs = float(fs)
+        nyquist = self.fs / 2
+        low = max(low_cutoff / nyquist, 0.001)
+        high = min(high_cutoff / nyquist, 0.9)
+        self._bp_b, self._bp_a = butter(2, [low, high], btype='band')
+        self._bp_zi0 = lfilter_zi(self._bp_b, self._bp_a)
+        # Five-point derivative, scaled to signal units per second
+        self._deriv_b = np.array([2.0, 1.0, 0.0, -1.0, -2.0]) * self.fs / 8
+        
+        self._window = max(1, int(round(integration_sec * self.fs)))
+        self._refractory = int(round(refractory_sec * self.fs))
+        self._t_wave = int(round(t_wave_sec * self.fs))
+        self._learning = max(1, int(round(learning_sec * self.fs)))
+        # R-peak search span before the integrator peak (integration window
+        # plus band-pass delay)
+        self._search = self._window + int(round(0.05 * self.fs))
+        # An integrator peak is confirmed once it is the maximum within one
+        # refractory period on both sides, so output lags input by that much
+        self._lookahead = max(1, self._refractory)
+        self.reset()
+    
+    def reset(self) -> None:
+        """Forget all state and restart at sample 0."""
+        self.n_samples = 0
+        self._bp_zi = None
+        self._deriv_zi = np.zeros(len(self._deriv_b) - 1)
+        self._sq_tail = np.zeros(self._window - 1)
+        
+        # Bounded history of the ECG, |slope| and integrator output
+        self._hist_start = 0
+        self._hist_raw = np.zeros(0)
+        self._hist_slope = np.zeros(0)
+        self._hist_mwi = np.zeros(0)
+        self._next = 0  # first integrator index not yet examined
+        
+        # Learning phase: candidates are held until thresholds are initialised
+        self._learning_candidates = []
+        self._learning_max = 0.0
+        self._learning_sum = 0.0
+        self._learning_count = 0
+        self._initialised = False
+        
+        self._spki = 0.0
+        self._npki = 0.0
+        self._last_qrs = None  # integrator index of the last QRS
+        self._last_r = None  # R-peak index of the last QRS
+        self._last_slope = 0.0
+        self._rr = deque(maxlen=8)
+        self._best_noise = None  # largest sub-threshold candidate since last QRS
+    
+    def feed(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Push the next block of samples.
+        
+        Args:
+            samples: Consecutive ECG samples following those already fed
+            
+        Returns:
+            np.ndarray: Sample indices (from the first sample ever fed) of the
+                        R-peaks confirmed by this block, ascending
+        """
+        from scipy.signal import lfilter
+        
+        x = np.asarray(samples, dtype=np.float64).ravel()
+        if len(x) == 0:
+            return np.array([], dtype=int)
+        self.n_samples += len(x)
+        
+        if self._bp_zi is None:
+            self._bp_zi = self._bp_zi0 * x[0]
+        filtered, self._bp_zi = lfilter(self._bp_b, self._bp_a, x, zi=self._bp_zi)
+        deriv, self._deriv_zi = lfilter(self._deriv_b, 1.0, filtered, zi=self._deriv_zi)
+        
+        # Moving-window integration of the squared slope (running sums)
+        squared = np.concatenate((self._sq_tail, deriv * deriv))
+        csum = np.concatenate(([0.0], np.cumsum(squared)))
+        mwi = (csum[self._window:] - csum[:-self._window]) / self._window
+        self._sq_tail = squared[len(squared) - (self._window - 1):]
+        
+        self._hist_raw = np.concatenate((self._hist_raw, x))
+        self._hist_slope = np.concatenate((self._hist_slope, np.abs(deriv)))
+        self._hist_mwi = np.concatenate((self._hist_mwi, mwi))
+        
+        if not self._initialised:
+            n_learn = min(len(mwi), self._learning - self._learning_count)
+            if n_learn > 0:
+                self._learning_max = max(self._learning_max, float(mwi[:n_learn].max()))
+                self._learning_sum += float(mwi[:n_learn].sum())
+                self._learning_count += n_learn
+        
+        found = []
+        self._scan(self.n_samples - 1 - self._lookahead, found)
+        if not self._initialised and self._learning_count >= self._learning:
+            self._finish_learning(found)
+        return np.array(found, dtype=int)
+    
+    def flush(self) -> np.ndarray:
+        """
+        End the stream.
+        
+        Examines the samples still held for look-ahead and, for a stream
+        shorter than the learning period, initialises the thresholds from what
+        was seen. Returns the resulting peaks; call reset() before reusing the
+        detector.
+        """
+        found = []
+        self._scan(self.n_samples - 1, found)
+        if not self._initialised and self._learning_count:
+            self._finish_learning(found)
+        return np.array(found, dtype=int)
+    
+    def _scan(self, stop: int, found: List[int]) -> None:
+        """Examine integrator peaks at indices [self._next, stop]."""
+        from scipy.ndimage import maximum_filter1d
+        
+        if stop < self._next:
+            return
+        
+        hist_start = self._hist_start
+        lo = max(self._next - self._lookahead, hist_start)
+        mwi = self._hist_mwi[lo - hist_start:]
+        local_max = maximum_filter1d(mwi, 2 * self._lookahead + 1, mode='nearest')
+        
+        first = self._next - lo
+        last = stop - lo + 1
+        values = mwi[first:last]
+        if first > 0:
+            previous = mwi[first - 1:last - 1]
+        else:
+            previous = np.concatenate(([-np.inf], mwi[:last - 1]))
+        # Strict rise keeps only the first sample of a plateau
+        is_peak = (values == local_max[first:last]) & (values > previous)
+        positions = np.flatnonzero(is_peak) + first
+        
+        for pos in positions:
+            idx = lo + int(pos)
+            r_lo = max(idx - self._search, hist_start) - hist_start
+            r_hi = idx + 1 - hist_start
+            candidate = (idx, float(mwi[pos]),
+                         hist_start + r_lo + int(np.argmax(self._hist_raw[r_lo:r_hi])),
+                         float(self._hist_slope[r_lo:r_hi].max()))
+            if self._initialised:
+                self._evaluate(candidate, found)
+            else:
+                self._learning_candidates.append(candidate)
+        
+        self._next = stop + 1
+        
+        # Keep what later look-ahead and R-peak searches can still reach
+        keep_from = max(hist_start, self._next - max(self._lookahead, self._search) - 1)
+        drop = keep_from - hist_start
+        if drop > 0:
+            self._hist_raw = self._hist_raw[drop:]
+            self._hist_slope = self._hist_slope[drop:]
+            self._hist_mwi = self._hist_mwi[drop:]
+            self._hist_start = keep_from
+    
+    def _finish_learning(self, found: List[int]) -> None:
+        """Initialise thresholds from the learning period and replay it."""
+        self._spki = self._learning_max / 3
+        self._npki = self._learning_sum / self._learning_count / 2
+        self._initialised = True
+        candidates, self._learning_candidates = self._learning_candidates, []
+        for candidate in candidates:
+            self._evaluate(candidate, found)
+    
+    def _evaluate(self, candidate: Tuple[int, float, int, float], found: List[int]) -> None:
+        """Classify one integrator peak as QRS or noise."""
+        idx, value, r_idx, slope = candidate
+        if self._last_qrs is not None and idx - self._last_qrs < self._refractory:
+            return
+        
+        threshold = self._npki + 0.25 * (self._spki - self._npki)
+        
+        # Search back for a beat missed since the last QRS
+        if (self._last_qrs is not None and self._rr and self._best_noise is not None
+                and idx - self._last_qrs > 1.66 * np.mean(self._rr)
+                and self._best_noise[1] > 0.5 * threshold):
+            missed = self._best_noise
+            self._spki = 0.25 * missed[1] + 0.75 * self._spki
+            self._accept(missed, found)
+            threshold = self._npki + 0.25 * (self._spki - self._npki)
+            if idx - self._last_qrs < self._refractory:
+                return
+        
+        if value > threshold:
+            is_t_wave = (self._last_qrs is not None
+                         and idx - self._last_qrs < self._t_wave
+                         and slope < 0.5 * self._last_slope)
+            if not is_t_wave:
+                self._spki = 0.125 * value + 0.875 * self._spki
+                self._accept(candidate, found)
+                return
+        
+        self._npki = 0.125 * value + 0.875 * self._npki
+        if self._best_noise is None or value > self._best_noise[1]:
+            self._best_noise = candidate
+    
+    def _accept(self, candidate: Tuple[int, float, int, float], found: List[int]) -> None:
+        idx, _, r_idx, slope = candidate
+        if self._last_qrs is not None:
+            self._rr.append(idx - self._last_qrs)
+        self._last_qrs = idx
+        self._last_slope = slope
+        self._best_noise = None
+        # Two integrator peaks may resolve to the same ECG maximum
+        if self._last_r is None or r_idx - self._last_r >= self._refractory:
+            self._last_r = r_idx
+            found.append(r_idx)
+
+
+class PanTompkinsStrategy(PeakDetectionStrategy):
+    """
+    Pan-Tompkins detection in a single streaming pass.
+    
+    Runs OnlinePanTompkinsDetector over the signal block by block. Thresholds
+    adapt to the local signal instead of using a global standard deviation,
+    and create_detector() gives the same detector for live data.
+    """
+    
+    @property
+    def name(self) -> str:
+        return "pan_tompkins"
+    
+    @property
+    def description(self) -> str:
+        return "Pan-Tompkins with adaptive thresholds - single pass, bounded memory"
+    
+    @property
+    def signal_types(self) -> List[str]:
+        return ["ecg"]
+    
+    def get_default_params(self) -> Dict[str, Any]:
+        return {
+            "low_cutoff": 5.0,  # Hz
+            "high_cutoff": 15.0,  # Hz
+            "integration_sec": 0.15,
+            "min_distance_sec": 0.2,  # Refractory period
+            "t_wave_sec": 0.36,
+            "learning_sec": 2.0,
+            "block_sec": 10.0,  # Samples fed per call in batch mode
+        }
+    
+    def create_detector(self, fs: float, **kwargs) -> OnlinePanTompkinsDetector:
+        """
+        Create an incremental detector (e.g. for live data) with this
+        strategy's parameters.
+        """
+        params = self.get_default_params()
+        params.update(kwargs)
+        return OnlinePanTompkinsDetector(
+            fs,
+            low_cutoff=params["low_cutoff"],
+            high_cutoff=params["high_cutoff"],
+            integration_sec=params["integration_sec"],
+            refractory_sec=params["min_distance_sec"],
+            t_wave_sec=params["t_wave_sec"],
+            learning_sec=params["learning_sec"],
+        )
+    
+    def detect_peaks(self, signal: np.ndarray, fs: float, **kwargs) -> np.ndarray:
+        """
+        Feed the signal to a fresh detector in blocks of block_sec.
+        """
+        params = self.get_default_params()
+        params.update(kwargs)
+        detector = self.create_detector(fs, **params)
+        block = max(1, int(params["block_sec"] * fs))
+        
+        peaks = [detector.feed(signal[start:start + block])
+                 for start in range(0, len(signal), block)]
+        peaks.append(detector.flush())
+        return np.concatenate(peaks).astype(int)
+
+
 class SimpleThresholdStrategy(PeakDetectionStrategy):
     """
     Simple threshold-based peak detection.
@@ -331,21 +738,17 @@ class SimpleThresholdStrategy(PeakDetectionStrategy):
         params = self.get_default_params()
         params.update(kwargs)
         
+        signal = np.asarray(signal)
         threshold = np.mean(signal) + params["threshold_std_multiplier"] * np.std(signal)
         min_distance = int(params["min_distance_sec"] * fs)
         
-        peaks = []
-        last_peak = -min_distance
+        # Strict local maxima above the threshold
+        middle = signal[1:-1]
+        is_peak = (middle > signal[:-2]) & (middle > signal[2:]) & (middle > threshold)
+        candidates = np.flatnonzero(is_peak) + 1
         
-        for i in range(1, len(signal) - 1):
-            if (signal[i] > signal[i-1] and 
-                signal[i] > signal[i+1] and
-                signal[i] > threshold and
-                i - last_peak > min_distance):
-                peaks.append(i)
-                last_peak = i
-        
-        return np.array(peaks, dtype=int)
+        # Earliest peak wins within each refractory period
+        return refractory_filter(candidates, min_distance)
 
 
 class PeakDetectionStrategyRegistry:
@@ -371,6 +774,9 @@ class PeakDetectionStrategyRegistry:
         except ImportError:
             warnings.warn("SciPy not available, skipping scipy_basic strategy")
         
+        # Streaming strategies
+        self.register_strategy(PanTompkinsStrategy())
+        
         # Wavelet-based strategies
         try:
             self.register_strategy(WaveletDWTStrategy())
@@ -432,4 +838,109 @@ class PeakDetectionStrategyRegistry:
 
 
 # Global registry instance
-strategy_registry = PeakDetectionStrategyRegistry()
\ No newline at end of file
+strategy_registry = PeakDetectionStrategyRegistry()
+
+
+def refractory_filter(peaks: np.ndarray, min_distance: int) -> np.ndarray:
+    """
+    Greedy refractory-period suppression of sorted peak indices.
+    
+    Scans peaks in ascending order and keeps a peak only if it lies more than
+    min_distance samples after the last kept one, i.e. the earliest peak wins.
+    Each step jumps straight to the next admissible peak (searchsorted), so
+    the Python work is proportional to the number of peaks kept rather than
+    to the number of candidates or samples.
+    
+    Args:
+        peaks: Ascending sample indices
+        min_distance: Refractory period in samples
+        
+    Returns:
+        np.ndarray: The kept peak indices (int)
+    """
+    peaks = np.asarray(peaks, dtype=int)
+    if len(peaks) == 0 or min_distance <= 0:
+        return peaks
+    
+    # Index of the first peak beyond the refractory period of each peak
+    next_allowed = np.searchsorted(peaks, peaks + min_distance, side='right')
+    
+    kept = []
+    k = 0
+    while k < len(peaks):
+        kept.append(k)
+        k = next_allowed[k]
+    return peaks[kept]
+
+
+def signal_fingerprint(signal: np.ndarray) -> str:
+    """
+    Content hash of a signal (dtype, length and samples).
+    
+    Arrays loaded again from the same file get the same fingerprint, unlike
+    id(), so cached preprocessing survives reloading a channel. Hashing reads
+    every sample, so the digest is remembered per array (and per view of it,
+    e.g. detection segments) for as long as the array is alive: repeated
+    detection on the same array hashes it once. Signals must not be modified
+    in place between detections (pass a copy instead).
+    """
+    signal = np.asarray(signal)
+    owner = signal
+    while isinstance(owner.base, np.ndarray):
+        owner = owner.base
+    view_key = (
+        signal.__array_interface__["data"][0],
+        signal.shape,
+        signal.strides,
+        signal.dtype.str,
+    )
+    
+    with _fingerprint_lock:
+        known = _fingerprints.get(id(owner))
+        if known is not None and known[0]() is owner and view_key in known[1]:
+            return known[1][view_key]
+    
+    data = np.ascontiguousarray(signal)
+    digest = hashlib.sha1(f"{data.dtype.str}|{data.shape}".encode("utf-8"))
+    digest.update(memoryview(data).cast("B"))
+    fingerprint = digest.hexdigest()
+    
+    with _fingerprint_lock:
+        known = _fingerprints.get(id(owner))
+        if known is None or known[0]() is not owner:
+            try:
+                ref = weakref.ref(owner, _forget_fingerprints(id(owner)))
+            except TypeError:
+                return fingerprint
+            known = _fingerprints[id(owner)] = (ref, {})
+        known[1][view_key] = fingerprint
+    return fingerprint
+
+
+def _forget_fingerprints(owner_id: int):
+    """Weakref callback dropping the remembered digests of a collected array."""
+    def forget(ref):
+        with _fingerprint_lock:
+            known = _fingerprints.get(owner_id)
+            if known is not None and known[0] is ref:
+                del _fingerprints[owner_id]
+    return forget
+
+
+# Digests of live arrays: id(owner array) -> (weakref, {view key: digest})
+_fingerprints: Dict[int, Tuple[Any, Dict[tuple, str]]] = {}
+_fingerprint_lock = threading.RLock()  # Reentrant: GC may run the callback
+
+
+# Global cache of preprocessing output
+_preprocessing_cache = None
+
+
+def get_preprocessing_cache() -> TileCache:
+    """Get global byte-bounded LRU cache of strategy preprocessing output."""
+    global _preprocessing_cache
+    if _preprocessing_cache is None:
+        settings = get_config_manager().get_hr_generation_settings()
+        max_mb = settings.get("preprocess_cache_mb", 256)
+        _preprocessing_cache = TileCache(int(max_mb) * 1024 * 1024)
+    return _preprocessing_cache
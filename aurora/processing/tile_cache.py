@@ -0,0 +1,102 @@
+"""
+TileCache - byte-bounded LRU cache of chunk tiles.
+
+ChunkLoader splits every window into fixed, globally aligned tiles (per channel,
+resolution and hr_aurora configuration), so overlapping or shifted windows
+reuse the tiles they share and only newly exposed tiles are computed. The same
+cache class bounds the preprocessing output kept by peak detection strategies.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+
+import numpy as np
+
+
+class TileCache:
+    """
+    Thread-safe LRU mapping of tile keys to numpy arrays, bounded by total bytes.
+
+    Lookups and insertions are O(1) (OrderedDict.move_to_end / popitem). Worker
+    threads fill the cache while the GUI thread assembles windows from it.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = int(max_bytes)
+        self._tiles: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """Return a tile and mark it most recently used, or None."""
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is None:
+                self.misses += 1
+                return None
+            self._tiles.move_to_end(key)
+            self.hits += 1
+            return tile
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Membership test that does not affect LRU order or statistics."""
+        with self._lock:
+            return key in self._tiles
+
+    def put(self, key: Hashable, tile: np.ndarray) -> None:
+        """Insert a tile, evicting least recently used tiles beyond max_bytes."""
+        with self._lock:
+            old = self._tiles.pop(key, None)
+            if old is not None:
+                self._nbytes -= old.nbytes
+            self._tiles[key] = tile
+            self._nbytes += tile.nbytes
+            while self._nbytes > self.max_bytes and len(self._tiles) > 1:
+                _, evicted = self._tiles.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+                self.evictions += 1
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove every tile whose key matches predicate; returns the count."""
+        with self._lock:
+            keys = [k for k in self._tiles if predicate(k)]
+            for key in keys:
+                self._nbytes -= self._tiles.pop(key).nbytes
+            return len(keys)
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the byte limit, evicting immediately if needed."""
+        with self._lock:
+            self.max_bytes = int(max_bytes)
+            while self._nbytes > self.max_bytes and self._tiles:
+                _, evicted = self._tiles.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tiles.clear()
+            self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return size and hit/miss counters."""
+        with self._lock:
+            return {
+                "tiles": len(self._tiles),
+                "bytes": self._nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -5,5 +5,6 @@ Contains dialog windows for user interaction.
 
 from .channel_selection_dialog import ChannelSelectionDialog
 from .export_config_dialog import ExportConfigDialog
+from .cache_diagnostics_dialog import CacheDiagnosticsDialog
 
-__all__ = ["ChannelSelectionDialog", "ExportConfigDialog"]
+__all__ = ["ChannelSelectionDialog", "ExportConfigDialog", "CacheDiagnosticsDialog"]
@@ -0,0 +1,184 @@
+"""
+CacheDiagnosticsDialog - Memory and cache statistics of every open session.
+Shows, per session and cache, the entries, memory held and hit/miss counters.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+from PySide6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QDialogButtonBox,
+    QLabel,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QPushButton,
+    QCheckBox,
+)
+from PySide6.QtCore import Qt, QTimer
+
+from aurora.core.session_manager import get_session_manager
+
+
+class CacheDiagnosticsDialog(QDialog):
+    """
+    Non-modal dialog listing the caches of all sessions.
+
+    Each session row shows its total resident and memory-mapped size; child
+    rows show the individual caches (Session.get_cache_stats). Process-wide
+    caches shared by all sessions are listed under "Shared".
+    """
+
+    COLUMNS = [
+        "Session / cache",
+        "Entries",
+        "Memory (MB)",
+        "Mapped (MB)",
+        "Hits",
+        "Misses",
+        "Evictions",
+        "Hit rate",
+    ]
+
+    REFRESH_MS = 2000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.logger = logging.getLogger("aurora.ui.CacheDiagnosticsDialog")
+        self.session_manager = get_session_manager()
+
+        self.setWindowTitle("Cache Diagnostics")
+        self.setModal(False)
+        self.setMinimumSize(760, 400)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(self.REFRESH_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+        self.init_ui()
+        self.refresh()
+
+    def init_ui(self):
+        """Initialize the dialog UI."""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+
+        self.summary_label = QLabel()
+        self.summary_label.setStyleSheet("font-weight: bold; font-size: 12px;")
+        layout.addWidget(self.summary_label)
+
+        self.tree = QTreeWidget()
+        self.tree.setColumnCount(len(self.COLUMNS))
+        self.tree.setHeaderLabels(self.COLUMNS)
+        self.tree.setRootIsDecorated(True)
+        self.tree.setAlternatingRowColors(True)
+        layout.addWidget(self.tree)
+
+        controls_layout = QHBoxLayout()
+
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.refresh)
+        controls_layout.addWidget(refresh_btn)
+
+        self.auto_refresh_check = QCheckBox("Auto refresh")
+        self.auto_refresh_check.toggled.connect(self._on_auto_refresh_toggled)
+        controls_layout.addWidget(self.auto_refresh_check)
+
+        controls_layout.addStretch()
+        layout.addLayout(controls_layout)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.Close)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+    def refresh(self):
+        """Rebuild the tree from the current session statistics."""
+        self.tree.clear()
+        total_bytes = 0
+        total_mapped = 0
+
+        sessions = list(self.session_manager.sessions.values())
+        for session in sessions:
+            try:
+                stats = session.get_cache_stats()
+            except Exception as e:
+                self.logger.error(
+                    f"Could not read cache stats of {session.session_id}: {e}"
+                )
+                continue
+
+            total_bytes += stats["total_bytes"]
+            total_mapped += stats["mapped_bytes"]
+            session_item = self._add_row(
+                None,
+                session.display_name,
+                {"bytes": stats["total_bytes"], "mapped_bytes": stats["mapped_bytes"]},
+            )
+            session_item.setToolTip(0, session.file_path)
+            for name, cache_stats in stats["caches"].items():
+                self._add_row(session_item, name, cache_stats)
+            session_item.setExpanded(True)
+
+        shared = self._shared_cache_stats()
+        if shared:
+            shared_bytes = sum(c.get("bytes", 0) for c in shared.values())
+            total_bytes += shared_bytes
+            shared_item = self._add_row(None, "Shared", {"bytes": shared_bytes})
+            for name, cache_stats in shared.items():
+                self._add_row(shared_item, name, cache_stats)
+            shared_item.setExpanded(True)
+
+        for column in range(len(self.COLUMNS)):
+            self.tree.resizeColumnToContents(column)
+
+        self.summary_label.setText(
+            f"{len(sessions)} session(s): {total_bytes / 1e6:.1f} MB in memory, "
+            f"{total_mapped / 1e6:.1f} MB memory-mapped"
+        )
+
+    def _add_row(
+        self, parent: Optional[QTreeWidgetItem], label: str, stats: Dict[str, Any]
+    ) -> QTreeWidgetItem:
+        hits = stats.get("hits")
+        misses = stats.get("misses")
+        lookups = (hits or 0) + (misses or 0)
+        entries = stats.get("entries", stats.get("tiles"))
+        values: List[str] = [
+            label,
+            "" if entries is None else str(entries),
+            f"{stats.get('bytes', 0) / 1e6:.1f}",
+            f"{stats['mapped_bytes'] / 1e6:.1f}" if stats.get("mapped_bytes") else "",
+            "" if hits is None else str(hits),
+            "" if misses is None else str(misses),
+            "" if stats.get("evictions") is None else str(stats["evictions"]),
+            f"{hits / lookups:.0%}" if hits is not None and lookups else "",
+        ]
+
+        item = QTreeWidgetItem(values)
+        for column in range(1, len(values)):
+            item.setTextAlignment(column, Qt.AlignRight | Qt.AlignVCenter)
+        if parent is None:
+            self.tree.addTopLevelItem(item)
+        else:
+            parent.addChild(item)
+        return item
+
+    def _shared_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Process-wide caches (not owned by a single session)."""
+        from aurora.processing.peak_detection_strategies import get_preprocessing_cache
+
+        stats = get_preprocessing_cache().get_stats()
+        stats["entries"] = stats.pop("tiles")
+        return {"preprocessing": stats}
+
+    def _on_auto_refresh_toggled(self, enabled: bool):
+        if enabled:
+            self._refresh_timer.start()
+        else:
+            self._refresh_timer.stop()
+
+    def done(self, result):
+        self._refresh_timer.stop()
+        super().done(result)
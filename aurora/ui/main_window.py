@@ -9,6 +9,7 @@ from PySide6.QtWidgets import QMainWindow, QTabWidget, QFileDialog, QMessageBox,
 from PySide6.QtGui import QAction
 
 from aurora.core.session_manager import get_session_manager
+from aurora.core.tracing import traced
 from aurora.ui.tabs.session_tab_host import SessionTabHost
 from aurora.ui.dialogs.config_dialog import ConfigDialog
 
@@ -97,6 +98,10 @@ class MainWindow(QMainWindow):
         config_action.triggered.connect(self._open_config_dialog)
         settings_menu.addAction(config_action)
 
+        diagnostics_action = QAction("Cache Diagnostics...", self)
+        diagnostics_action.triggered.connect(self._open_cache_diagnostics)
+        settings_menu.addAction(diagnostics_action)
+
     def _connect_signals(self):
         """Connect signals from SessionManager and tabs."""
         # SessionManager signals
@@ -250,6 +255,7 @@ class MainWindow(QMainWindow):
         # Default protocol
         return "stand"
 
+    @traced("MainWindow.export_csv")
     def _execute_export(self, export_config: dict) -> bool:
         """Execute export process with specified configuration.
 
@@ -407,6 +413,16 @@ class MainWindow(QMainWindow):
             # Configuration saved - (future) propagate to sessions if needed
             self.logger.info("Configuration updated by user")
 
+    def _open_cache_diagnostics(self):
+        """Show memory and cache statistics of all sessions (non-modal)."""
+        from aurora.ui.dialogs.cache_diagnostics_dialog import CacheDiagnosticsDialog
+
+        if getattr(self, "_cache_diagnostics", None) is None:
+            self._cache_diagnostics = CacheDiagnosticsDialog(self)
+        self._cache_diagnostics.refresh()
+        self._cache_diagnostics.show()
+        self._cache_diagnostics.raise_()
+
     def _on_session_created(self, session_id: str, session):
         """Handle new session created by SessionManager."""
         self.logger.info(f"=== SESSION CREATED SIGNAL RECEIVED ===")
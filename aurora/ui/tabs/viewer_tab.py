@@ -10,7 +10,7 @@ import logging
 import os
 
 from aurora.core.session import Session
-from aurora.ui.tabs.visualization_base_tab import VisualizationBaseTab
+from aurora.ui.tabs.visualization_base_tab import VisualizationBaseTab, navigation_action
 from aurora.ui.widgets.plot_container_widget import PlotContainerWidget
 
 
@@ -153,6 +153,7 @@ class ViewerTab(VisualizationBaseTab):
         hr_params = hr_params or {}
         return self.display_signals(data_manager, file_path, target_signals, hr_params)
     
+    @navigation_action("hr_params")
     def update_hr_params(self, hr_params: Dict, force_cache_refresh: bool = False):
         """
         Legacy interface method for HR parameter updates.
@@ -3,6 +3,7 @@ VisualizationBaseTab - Base class for session-based visualization tabs.
 Adapted for the new session system - each tab receives and works with a Session object.
 """
 
+import functools
 from abc import abstractmethod
 from typing import Dict, Any, List, Optional
 from PySide6.QtWidgets import (
@@ -21,6 +22,30 @@ import logging
 from aurora.core.session import Session
 from aurora.ui.widgets.plot_container_widget import PlotContainerWidget
 from aurora.core.comments import get_comment_manager
+from aurora.core.tracing import traced
+
+
+def navigation_action(action: str):
+    """
+    Label the chunk requests issued by a navigation handler for the navigation
+    log (AURORA_NAV_RECORD). Handlers called from another handler keep the
+    outer label, e.g. "next" -> spinbox -> slider is recorded as "next".
+    """
+
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            outer = self._navigation_action
+            if outer is None:
+                self._navigation_action = action
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._navigation_action = outer
+
+        return wrapper
+
+    return decorate
 
 
 class VisualizationBaseTab(QWidget):
@@ -73,6 +98,13 @@ class VisualizationBaseTab(QWidget):
         # HR parameters for ChunkLoader - initialize to avoid AttributeError
         self.hr_params: Dict = {}
 
+        # Id of the latest ChunkLoader request issued by this tab; results of
+        # older requests (or of other tabs sharing the loader) are ignored
+        self._chunk_request_id: Optional[int] = None
+
+        # User action behind the current chunk requests (see navigation_action)
+        self._navigation_action: Optional[str] = None
+
         # Layout components
         self.main_layout = QVBoxLayout(self)
         self.controls_layout = QHBoxLayout()
@@ -93,8 +125,8 @@ class VisualizationBaseTab(QWidget):
         self.chunk_size = 60.0
         self.duration = 100.0
 
-        # Direct navigation without throttling for optimal performance
-        # Timer and throttling removed to eliminate delays
+        # Navigation requests go straight to the ChunkLoader, which coalesces
+        # and throttles them (chunk_loading.throttle_delay_ms)
 
         # Setup base UI
         self._setup_base_ui()
@@ -105,14 +137,14 @@ class VisualizationBaseTab(QWidget):
             self.session.session_ready.connect(self._on_session_ready)
             self.logger.debug("session_ready signal connected")
         except Exception as e:
-            self.logger.error(f"Failed to connect session_ready: {e}")
+            self.logger.error("Failed to connect session_ready: %s", e)
 
         if hasattr(self.session, "data_loaded"):
             try:
                 self.session.data_loaded.connect(self._on_session_data_loaded)
                 self.logger.debug("data_loaded signal connected")
             except Exception as e:
-                self.logger.error(f"Failed to connect data_loaded: {e}")
+                self.logger.error("Failed to connect data_loaded: %s", e)
 
         # If session is already loaded, refresh immediately
         if self.session.is_loaded:
@@ -123,7 +155,9 @@ class VisualizationBaseTab(QWidget):
             self._connect_chunk_loader()
 
         self.logger.debug(
-            f"{self.__class__.__name__} initialized with session {session.session_id}"
+            "%s initialized with session %s",
+            self.__class__.__name__,
+            session.session_id,
         )
 
     def _connect_chunk_loader(self):
@@ -133,13 +167,14 @@ class VisualizationBaseTab(QWidget):
                 chunk_loader = self.session.chunk_loader
                 chunk_loader.chunk_loaded.connect(self._on_chunk_loaded)
                 chunk_loader.chunk_error.connect(self._on_chunk_error)
+                chunk_loader.cache_stats_updated.connect(self._on_cache_stats_updated)
                 self.logger.debug("ChunkLoader signals connected")
 
                 # Request initial chunk load now that signals are connected
                 self._request_initial_chunk_load()
 
             except Exception as e:
-                self.logger.error(f"Failed to connect ChunkLoader signals: {e}")
+                self.logger.error("Failed to connect ChunkLoader signals: %s", e)
         else:
             self.logger.debug("ChunkLoader not available in session")
 
@@ -154,26 +189,35 @@ class VisualizationBaseTab(QWidget):
                 chunk_loader = self.session.chunk_loader
                 hr_params = getattr(self, "hr_params", {})
 
-                chunk_loader.request_chunk(
+                self._chunk_request_id = chunk_loader.request_chunk(
+                    consumer=self,
                     channel_names=self.session.selected_channels,
                     start_sec=self.start_time,
                     duration_sec=self.chunk_size,
                     **hr_params,
                 )
+                self._record_navigation(self.start_time, self.chunk_size)
                 self.logger.info(
-                    f"Initial chunk requested: {self.start_time:.2f}s duration: {self.chunk_size:.2f}s"
+                    "Initial chunk requested: %.2fs duration: %.2fs",
+                    self.start_time,
+                    self.chunk_size,
                 )
             except Exception as e:
-                self.logger.error(f"Failed to request initial chunk: {e}")
+                self.logger.error("Failed to request initial chunk: %s", e)
         else:
             self.logger.warning(
                 "ChunkLoader or selected channels not available for initial load"
             )
 
-    def _on_chunk_loaded(self, start_sec: float, end_sec: float, data_dict: dict):
-        """Handle chunk data loaded from ChunkLoader (simplified like working tree)."""
+    def _on_chunk_loaded(
+        self, start_sec: float, end_sec: float, data_dict: dict, request_id: int
+    ):
+        """Handle chunk data loaded from ChunkLoader for this tab's latest request."""
+        if request_id != self._chunk_request_id:
+            return
+
         self.logger.debug(
-            f"Chunk loaded: {start_sec:.2f}-{end_sec:.2f}s, {len(data_dict)} channels"
+            "Chunk loaded: %.2f-%.2fs, %s channels", start_sec, end_sec, len(data_dict)
         )
 
         # Update plot container with chunk data (simplified)
@@ -190,17 +234,17 @@ class VisualizationBaseTab(QWidget):
 
             except Exception as e:
                 self.logger.error(
-                    f"Failed to update plot container with chunk data: {e}"
+                    "Failed to update plot container with chunk data: %s", e
                 )
 
     def _on_chunk_error(self, error_message: str):
         """Handle chunk loading errors."""
-        self.logger.error(f"ChunkLoader error: {error_message}")
+        self.logger.error("ChunkLoader error: %s", error_message)
         # Could show error in UI if needed
 
     def _on_cache_stats_updated(self, stats: dict):
         """Handle cache statistics updates."""
-        self.logger.debug(f"Chunk cache stats: {stats}")
+        self.logger.debug("Chunk cache stats: %s", stats)
         # Could update UI with cache information if needed
 
     def _setup_base_ui(self) -> None:
@@ -297,8 +341,8 @@ class VisualizationBaseTab(QWidget):
 
     def _on_session_ready(self) -> None:
         """Called when session is fully loaded and ready."""
-        self.logger.info(f"=== SESSION READY SIGNAL RECEIVED ===")
-        self.logger.info(f"Session: {self.session.session_id}")
+        self.logger.info("=== SESSION READY SIGNAL RECEIVED ===")
+        self.logger.info("Session: %s", self.session.session_id)
 
         # Connect ChunkLoader signals now that session is ready
         self._connect_chunk_loader()
@@ -307,22 +351,22 @@ class VisualizationBaseTab(QWidget):
 
     def _on_session_data_loaded(self, file_path: str) -> None:
         """Called when session data is loaded."""
-        self.logger.info(f"Session data loaded: {file_path}")
+        self.logger.info("Session data loaded: %s", file_path)
         self.refresh_from_session()
 
     def refresh_from_session(self) -> None:
         """Refresh tab data from session."""
-        self.logger.info(f"=== REFRESH FROM SESSION STARTED ===")
-        self.logger.info(f"Tab: {self.__class__.__name__}")
+        self.logger.info("=== REFRESH FROM SESSION STARTED ===")
+        self.logger.info("Tab: %s", self.__class__.__name__)
         self.logger.debug(
-            f"Session: {self.session.session_id if self.session else 'None'}"
+            "Session: %s", self.session.session_id if self.session else "None"
         )
 
         if not self.session:
             self.logger.error("No session available - cannot refresh")
             return
 
-        self.logger.debug(f"Session is_loaded: {self.session.is_loaded}")
+        self.logger.debug("Session is_loaded: %s", self.session.is_loaded)
         if not self.session.is_loaded:
             self.logger.warning("Session not ready for refresh - is_loaded=False")
             return
@@ -335,15 +379,15 @@ class VisualizationBaseTab(QWidget):
             selected_channels = self.session.selected_channels
             config = self.session.config
 
-            self.logger.info(f"Data manager: {data_manager}")
-            self.logger.info(f"File path: {file_path}")
-            self.logger.info(f"Selected channels: {selected_channels}")
+            self.logger.info("Data manager: %s", data_manager)
+            self.logger.info("File path: %s", file_path)
+            self.logger.info("Selected channels: %s", selected_channels)
             self.logger.debug(
-                f"Config keys: {list(config.keys()) if config else 'None'}"
+                "Config keys: %s", list(config.keys()) if config else "None"
             )
 
             # Display signals using the standard interface
-            self.logger.debug(f"Calling display_signals()...")
+            self.logger.debug("Calling display_signals()...")
             hr_params = config.get("hr_params", {})
             success = self.display_signals(
                 data_manager=data_manager,
@@ -351,18 +395,18 @@ class VisualizationBaseTab(QWidget):
                 target_signals=selected_channels,
                 hr_params=hr_params,
             )
-            self.logger.info(f"display_signals() result: {success}")
+            self.logger.info("display_signals() result: %s", success)
 
             if success:
-                self.logger.info(f"=== REFRESH FROM SESSION SUCCESS ===")
+                self.logger.info("=== REFRESH FROM SESSION SUCCESS ===")
             else:
                 self.logger.warning(
-                    f"=== REFRESH FROM SESSION FAILED - display_signals returned False ==="
+                    "=== REFRESH FROM SESSION FAILED - display_signals returned False ===",
                 )
 
         except Exception as e:
-            self.logger.error(f"=== REFRESH FROM SESSION ERROR ===")
-            self.logger.error(f"Exception during refresh: {e}", exc_info=True)
+            self.logger.error("=== REFRESH FROM SESSION ERROR ===")
+            self.logger.error("Exception during refresh: %s", e, exc_info=True)
             self.error_occurred.emit(str(e))
 
     @abstractmethod
@@ -424,13 +468,14 @@ class VisualizationBaseTab(QWidget):
 
             if success:
                 self.logger.info(
-                    f"Tab data update successful, proceeding with plot display"
+                    "Tab data update successful, proceeding with plot display"
                 )
 
                 # Display signals in plot container
                 if self.plot_container:
                     self.logger.info(
-                        f"Calling plot_container.display_signals with {len(target_signals)} signals"
+                        "Calling plot_container.display_signals with %s signals",
+                        len(target_signals),
                     )
 
                     try:
@@ -438,26 +483,28 @@ class VisualizationBaseTab(QWidget):
                             data_manager, file_path, target_signals, hr_params
                         )
                         self.logger.info(
-                            f"plot_container.display_signals returned: {plot_result}"
+                            "plot_container.display_signals returned: %s", plot_result
                         )
                     except Exception as e:
                         self.logger.error(
-                            f"Error in plot_container.display_signals: {e}",
+                            "Error in plot_container.display_signals: %s",
+                            e,
                             exc_info=True,
                         )
 
                     # Update navigation controls with duration from data
                     if file_path and target_signals:
                         try:
-                            # Get duration from first available signal
+                            # Get duration from first available signal (no full decode)
                             first_signal_name = target_signals[0]
-                            signal = data_manager.get_trace(
+                            duration = data_manager.get_channel_duration(
                                 file_path, first_signal_name
                             )
-                            if signal and len(signal.time) > 1:
-                                duration = float(signal.time[-1] - signal.time[0])
+                            if duration > 0:
                                 self.logger.info(
-                                    f"Calculated duration from signal '{first_signal_name}': {duration:.1f}s"
+                                    "Calculated duration from signal '%s': %.1fs",
+                                    first_signal_name,
+                                    duration,
                                 )
                                 self._set_duration(duration)
                                 # Also set duration in plot container
@@ -465,11 +512,12 @@ class VisualizationBaseTab(QWidget):
                                     self.plot_container.set_duration(duration)
                             else:
                                 self.logger.warning(
-                                    f"Could not calculate duration - signal '{first_signal_name}' has insufficient data"
+                                    "Could not calculate duration - signal '%s' has insufficient data",
+                                    first_signal_name,
                                 )
                         except Exception as e:
                             self.logger.warning(
-                                f"Could not calculate duration from signals: {e}"
+                                "Could not calculate duration from signals: %s", e
                             )
                 else:
                     self.logger.error("plot_container is None!")
@@ -483,10 +531,11 @@ class VisualizationBaseTab(QWidget):
             return success
 
         except Exception as e:
-            self.logger.error(f"Error displaying signals: {e}", exc_info=True)
+            self.logger.error("Error displaying signals: %s", e, exc_info=True)
             self.error_occurred.emit(str(e))
             return False
 
+    @navigation_action("spinbox")
     def _on_start_time_changed(self, value: int):
         """Handle start time change from spinbox."""
         self.start_time = float(value)
@@ -504,15 +553,17 @@ class VisualizationBaseTab(QWidget):
         ):
             try:
                 chunk_loader = self.session.chunk_loader
-                chunk_loader.request_chunk(
+                self._chunk_request_id = chunk_loader.request_chunk(
+                    consumer=self,
                     channel_names=self.session.selected_channels,
                     start_sec=float(value),
                     duration_sec=self.chunk_size,
                     **self.hr_params,
                 )
-                self.logger.debug(f"Chunk requested from spinbox: {value:.2f}s")
+                self._record_navigation(float(value), self.chunk_size)
+                self.logger.debug("Chunk requested from spinbox: %.2fs", value)
             except Exception as e:
-                self.logger.error(f"ChunkLoader request from spinbox failed: {e}")
+                self.logger.error("ChunkLoader request from spinbox failed: %s", e)
         else:
             self.logger.warning("ChunkLoader not available for spinbox navigation")
 
@@ -521,6 +572,7 @@ class VisualizationBaseTab(QWidget):
         # Emit signal for other components
         self.time_changed.emit(self.start_time)
 
+    @navigation_action("chunk_size")
     def _on_chunk_size_changed(self, value: int):
         """Handle chunk size change from spinbox."""
         self.chunk_size = float(value)
@@ -534,16 +586,18 @@ class VisualizationBaseTab(QWidget):
         ):
             try:
                 chunk_loader = self.session.chunk_loader
-                chunk_loader.request_chunk(
+                self._chunk_request_id = chunk_loader.request_chunk(
+                    consumer=self,
                     channel_names=self.session.selected_channels,
                     start_sec=self.start_time,
                     duration_sec=float(value),
                     **self.hr_params,
                 )
-                self.logger.debug(f"Chunk requested with new chunk size: {value:.2f}s")
+                self._record_navigation(self.start_time, float(value))
+                self.logger.debug("Chunk requested with new chunk size: %.2fs", value)
             except Exception as e:
                 self.logger.error(
-                    f"ChunkLoader request with new chunk size failed: {e}"
+                    "ChunkLoader request with new chunk size failed: %s", e
                 )
         else:
             self.logger.warning("ChunkLoader not available for chunk size change")
@@ -553,6 +607,7 @@ class VisualizationBaseTab(QWidget):
         # Emit signal for other components
         self.chunk_size_changed.emit(self.chunk_size)
 
+    @navigation_action("slider")
     def _on_slider_changed(self, value: int):
         """Handle position slider change with throttling for better performance."""
         # Update UI immediately for responsiveness
@@ -574,15 +629,17 @@ class VisualizationBaseTab(QWidget):
         ):
             try:
                 chunk_loader = self.session.chunk_loader
-                chunk_loader.request_chunk(
+                self._chunk_request_id = chunk_loader.request_chunk(
+                    consumer=self,
                     channel_names=self.session.selected_channels,
                     start_sec=float(value),
                     duration_sec=self.chunk_size,
                     **self.hr_params,
                 )
-                self.logger.debug(f"ChunkLoader navigation: {value:.2f}s")
+                self._record_navigation(float(value), self.chunk_size)
+                self.logger.debug("ChunkLoader navigation: %.2fs", value)
             except Exception as e:
-                self.logger.error(f"ChunkLoader request failed: {e}")
+                self.logger.error("ChunkLoader request failed: %s", e)
         else:
             self.logger.warning("ChunkLoader not available for navigation")
 
@@ -591,11 +648,26 @@ class VisualizationBaseTab(QWidget):
 
     # Fallback method removed - using ChunkLoader exclusively for navigation
 
+    def _record_navigation(self, start_sec: float, duration_sec: float) -> None:
+        """Append a chunk request to the session's navigation log, if recording."""
+        recorder = getattr(self.session, "navigation_recorder", None)
+        if recorder is not None:
+            recorder.record(
+                self._navigation_action or "initial",
+                start_sec,
+                duration_sec,
+                self.session.selected_channels,
+                self.hr_params,
+                consumer=self.__class__.__name__,
+            )
+
+    @navigation_action("previous")
     def _go_previous_chunk(self):
         """Navigate to previous chunk."""
         new_start = max(0, self.start_time - self.chunk_size)
         self.start_spinbox.setValue(int(new_start))
 
+    @navigation_action("next")
     def _go_next_chunk(self):
         """Navigate to next chunk."""
         max_start = self.duration - self.chunk_size
@@ -605,20 +677,20 @@ class VisualizationBaseTab(QWidget):
     def _set_duration(self, duration: float):
         """Set the total duration and update control ranges."""
         self.logger.debug(
-            f"Setting duration to {duration}s (previous: {self.duration}s)"
+            "Setting duration to %ss (previous: %ss)", duration, self.duration
         )
         self.duration = duration
         max_start = max(0, int(duration - self.chunk_size))
         self.logger.debug(
-            f"Calculated max_start: {max_start} (chunk_size: {self.chunk_size}s)"
+            "Calculated max_start: %s (chunk_size: %ss)", max_start, self.chunk_size
         )
 
         if self.start_spinbox:
             self.start_spinbox.setRange(0, max_start)
-            self.logger.debug(f"Updated start_spinbox range to 0-{max_start}")
+            self.logger.debug("Updated start_spinbox range to 0-%s", max_start)
         if self.position_slider:
             self.position_slider.setRange(0, max_start)
-            self.logger.debug(f"Updated position_slider range to 0-{max_start}")
+            self.logger.debug("Updated position_slider range to 0-%s", max_start)
 
     @abstractmethod
     def _customize_for_tab(self) -> None:
@@ -639,7 +711,7 @@ class VisualizationBaseTab(QWidget):
         if emit_signal:
             self.parameters_changed.emit(self.current_parameters.copy())
 
-        self.logger.debug(f"Parameters updated: {new_params}")
+        self.logger.debug("Parameters updated: %s", new_params)
 
     def get_current_parameters(self) -> Dict:
         """Get current tab parameters."""
@@ -665,6 +737,7 @@ class VisualizationBaseTab(QWidget):
             self.session.file_path, start_time, end_time
         )
 
+    @traced("VisualizationBaseTab.refresh_comment_markers")
     def refresh_comment_markers(self):
         """Request PlotContainer to refresh comment markers display."""
         if self.plot_container and hasattr(
@@ -682,7 +755,7 @@ class VisualizationBaseTab(QWidget):
             # Tell PlotContainer to render these comments
             self.plot_container.refresh_comment_display(visible_comments)
             self.logger.debug(
-                f"Refreshed {len(visible_comments)} comment markers for time window"
+                "Refreshed %s comment markers for time window", len(visible_comments)
             )
 
     def _on_comments_changed(self, file_path: str):
@@ -691,12 +764,13 @@ class VisualizationBaseTab(QWidget):
         if self.session and self.session.file_path == file_path:
             self.refresh_comment_markers()
             self.logger.debug(
-                f"Comment markers refreshed due to comment change in {file_path}"
+                "Comment markers refreshed due to comment change in %s", file_path
             )
 
+    @navigation_action("comment")
     def navigate_to_comment_time(self, time_sec: float):
         """Navigate to specific comment time. Available in all visualization tabs."""
-        self.logger.info(f"Navigating to comment time: {time_sec:.2f}s")
+        self.logger.info("Navigating to comment time: %.2fs", time_sec)
 
         # Calculate new start time to center the comment
         # Use half chunk size to center the comment in the view
@@ -711,13 +785,15 @@ class VisualizationBaseTab(QWidget):
             new_start_time = max(0, self.duration - self.chunk_size)
 
         self.logger.debug(
-            f"Calculated new start time: {new_start_time:.2f}s (chunk_size: {self.chunk_size}s)"
+            "Calculated new start time: %.2fs (chunk_size: %ss)",
+            new_start_time,
+            self.chunk_size,
         )
 
         # Update the spinbox which will trigger the proper navigation chain
         if self.start_spinbox:
             self.start_spinbox.setValue(int(new_start_time))
-            self.logger.debug(f"Navigation completed to comment time: {time_sec:.2f}s")
+            self.logger.debug("Navigation completed to comment time: %.2fs", time_sec)
 
     # ================================
     # EXPORT SUPPORT
@@ -757,7 +833,7 @@ class VisualizationBaseTab(QWidget):
         self.current_signals.clear()
         self.current_parameters.clear()
         self.clear_displays()
-        self.logger.debug(f"{self.__class__.__name__} reset")
+        self.logger.debug("%s reset", self.__class__.__name__)
 
     def cleanup(self) -> None:
         """Cleanup when tab is being destroyed."""
@@ -771,7 +847,7 @@ class VisualizationBaseTab(QWidget):
             # Reset tab
             self.reset_tab()
 
-            self.logger.debug(f"{self.__class__.__name__} cleanup completed")
+            self.logger.debug("%s cleanup completed", self.__class__.__name__)
 
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
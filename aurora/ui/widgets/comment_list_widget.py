@@ -207,8 +207,8 @@ class CommentListWidget(QWidget):
             data_manager: DataManager instance
             file_path: Path to the current file
         """
-        self.logger.info(f"Setting data context - file_path: {file_path}")
-        self.logger.info(f"DataManager type: {type(data_manager)}")
+        self.logger.info("Setting data context - file_path: %s", file_path)
+        self.logger.info("DataManager type: %s", type(data_manager))
         
         # Disconnect previous data manager signals if any
         if self.data_manager:
@@ -229,7 +229,7 @@ class CommentListWidget(QWidget):
     def refresh_comments(self):
         """Refresh comments from data manager."""
         if not self.data_manager or not self.file_path:
-            self.logger.warning(f"Cannot refresh comments - data_manager: {self.data_manager}, file_path: {self.file_path}")
+            self.logger.warning("Cannot refresh comments - data_manager: %s, file_path: %s", self.data_manager, self.file_path)
             return
         
         try:
@@ -243,18 +243,18 @@ class CommentListWidget(QWidget):
                 # Signal wasn't connected or already disconnected, which is fine
                 pass
             
-            self.logger.debug(f"Getting comments for file: {self.file_path}")
+            self.logger.debug("Getting comments for file: %s", self.file_path)
             self.comments = self.data_manager.get_comments(self.file_path)
-            self.logger.info(f"Retrieved {len(self.comments)} comments from data manager")
+            self.logger.info("Retrieved %s comments from data manager", len(self.comments))
             
             self.filter_comments()  # Apply current filter
-            self.logger.info(f"After filtering: {len(self.filtered_comments)} comments displayed")
+            self.logger.info("After filtering: %s comments displayed", len(self.filtered_comments))
             
             # Reconnect the signal
             self.table.itemChanged.connect(self.on_item_changed)
             
         except Exception as e:
-            self.logger.error(f"Error refreshing comments: {e}", exc_info=True)
+            self.logger.error("Error refreshing comments: %s", e, exc_info=True)
             self.comments = []
             self.populate_table([])
             # Ensure signal is reconnected even on error
@@ -352,7 +352,7 @@ class CommentListWidget(QWidget):
         comment = self.get_selected_comment()
         if comment:
             # Navigate to comment time
-            self.logger.debug(f"Clicked comment at {comment.time:.2f}s, emitting navigate signal")
+            self.logger.debug("Clicked comment at %.2fs, emitting navigate signal", comment.time)
             self.comment_time_navigate.emit(comment.time)
     
     def on_item_changed(self, item):
@@ -411,10 +411,10 @@ class CommentListWidget(QWidget):
                 **updates
             )
             
-            self.logger.info(f"Updated comment via table editing")
+            self.logger.info("Updated comment via table editing")
             
         except Exception as e:
-            self.logger.error(f"Error updating comment via table: {e}")
+            self.logger.error("Error updating comment via table: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to update comment: {e}")
             # Refresh to revert changes if update failed
             self.refresh_comments()
@@ -473,10 +473,10 @@ class CommentListWidget(QWidget):
                 # Navigate to new comment
                 self.comment_time_navigate.emit(data['time_sec'])
                 
-                self.logger.info(f"Added comment at {data['time_sec']:.2f}s")
+                self.logger.info("Added comment at %.2fs", data['time_sec'])
                 
             except Exception as e:
-                self.logger.error(f"Error adding comment: {e}")
+                self.logger.error("Error adding comment: %s", e)
                 QMessageBox.critical(self, "Error", f"Failed to add comment: {e}")
     
     def edit_comment(self):
@@ -506,10 +506,10 @@ class CommentListWidget(QWidget):
                     label=data['label']
                 )
                 
-                self.logger.info(f"Updated comment at {data['time_sec']:.2f}s")
+                self.logger.info("Updated comment at %.2fs", data['time_sec'])
                 
             except Exception as e:
-                self.logger.error(f"Error updating comment: {e}")
+                self.logger.error("Error updating comment: %s", e)
                 QMessageBox.critical(self, "Error", f"Failed to update comment: {e}")
     
     def delete_comment(self):
@@ -553,15 +553,15 @@ class CommentListWidget(QWidget):
                 for comment in selected_comments:
                     try:
                         # Debug: Log the comment_id we're trying to delete
-                        self.logger.debug(f"Attempting to delete comment - ID: '{comment.comment_id}' (type: {type(comment.comment_id)}) at time {comment.time:.2f}s")
+                        self.logger.debug("Attempting to delete comment - ID: '%s' (type: %s) at time %.2fs", comment.comment_id, type(comment.comment_id), comment.time)
                         
                         comment_manager.delete_comment(self.file_path, comment.comment_id)
                         deleted_count += 1
-                        self.logger.info(f"Delete request sent for comment {comment.comment_id} at {comment.time:.2f}s")
+                        self.logger.info("Delete request sent for comment %s at %.2fs", comment.comment_id, comment.time)
                         
                     except Exception as e:
                         failed_count += 1
-                        self.logger.error(f"Error deleting comment {comment.comment_id}: {e}")
+                        self.logger.error("Error deleting comment %s: %s", comment.comment_id, e)
                 
                 # Show summary if there were failures
                 if failed_count > 0:
@@ -571,10 +571,10 @@ class CommentListWidget(QWidget):
                         f"Deleted {deleted_count} comments successfully.\n{failed_count} comments failed to delete."
                     )
                 elif len(selected_comments) > 1:
-                    self.logger.info(f"Successfully deleted {deleted_count} comments")
+                    self.logger.info("Successfully deleted %s comments", deleted_count)
                     
             except Exception as e:
-                self.logger.error(f"Error during mass deletion: {e}")
+                self.logger.error("Error during mass deletion: %s", e)
                 QMessageBox.critical(self, "Error", f"Failed to delete comments: {e}")
     
     def navigate_to_comment(self, comment: EMSComment):
@@ -594,5 +594,5 @@ class CommentListWidget(QWidget):
     def on_comments_changed(self, file_path: str):
         """Handle comments changed signal from DataManager."""
         if file_path == self.file_path:
-            self.logger.debug(f"Comments changed for {file_path}, refreshing display")
+            self.logger.debug("Comments changed for %s, refreshing display", file_path)
             self.refresh_comments()
\ No newline at end of file
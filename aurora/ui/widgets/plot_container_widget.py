@@ -18,6 +18,7 @@ from typing import List, Dict, Optional, Tuple
 import logging
 import numpy as np
 
+from aurora.core.tracing import span, traced
 from aurora.ui.widgets.custom_plot import CustomPlot
 from aurora.ui.managers.plot_style_manager import get_plot_style_manager
 import pyqtgraph as pg
@@ -131,7 +132,10 @@ class PlotContainerWidget(QWidget):
         """
         # Demote a DEBUG para evitar ruido en cada refresco
         self.logger.debug(
-            f"display_signals start file={file_path} targets={target_signals} dm={type(data_manager)}"
+            "display_signals start file=%s targets=%s dm=%s",
+            file_path,
+            target_signals,
+            type(data_manager),
         )
 
         try:
@@ -151,11 +155,11 @@ class PlotContainerWidget(QWidget):
 
             # Comments are handled by VisualizationBaseTab and rendered here when requested
 
-            self.logger.debug(f"display_signals success count={len(target_signals)}")
+            self.logger.debug("display_signals success count=%s", len(target_signals))
             return True
 
         except Exception as e:
-            self.logger.error(f"Error displaying signals: {e}", exc_info=True)
+            self.logger.error("Error displaying signals: %s", e, exc_info=True)
             return False
 
     def _request_initial_chunk_load(self):
@@ -179,15 +183,18 @@ class PlotContainerWidget(QWidget):
                     chunk_size = getattr(parent_tab, "chunk_size", 60.0)
                     hr_params = getattr(parent_tab, "hr_params", {})
 
-                    chunk_loader.request_chunk(
+                    parent_tab._chunk_request_id = chunk_loader.request_chunk(
+                        consumer=parent_tab,
                         channel_names=parent_tab.session.selected_channels,
                         start_sec=start_time,
                         duration_sec=chunk_size,
                         **hr_params,
                     )
-                    self.logger.debug(f"Initial chunk requested: {start_time:.2f}s")
+                    if hasattr(parent_tab, "_record_navigation"):
+                        parent_tab._record_navigation(start_time, chunk_size)
+                    self.logger.debug("Initial chunk requested: %.2fs", start_time)
                 except Exception as e:
-                    self.logger.error(f"Failed to request initial chunk: {e}")
+                    self.logger.error("Failed to request initial chunk: %s", e)
             else:
                 self.logger.warning("ChunkLoader not available for initial load")
         else:
@@ -198,7 +205,7 @@ class PlotContainerWidget(QWidget):
         # Clear existing plots
         self.clear_plots()
 
-        self.logger.debug(f"Creating plots for signals: {self.target_signals}")
+        self.logger.debug("Creating plots for signals: %s", self.target_signals)
 
         # Create new plots
         for plot_index, signal_name in enumerate(self.target_signals):
@@ -231,7 +238,7 @@ class PlotContainerWidget(QWidget):
             idx = self.plots_splitter.count() - 1
             self.plots_splitter.setStretchFactor(idx, 1)
 
-        self.logger.debug(f"Created {len(self.plots)} plots total")
+        self.logger.debug("Created %s plots total", len(self.plots))
 
         # CRITICAL: Calculate and set total splitter size for scroll area
         self._update_splitter_size()
@@ -244,10 +251,12 @@ class PlotContainerWidget(QWidget):
         min_height = plot.minimumHeight()
         size_policy = plot.sizePolicy()
 
-        self.logger.debug(f"Plot {plot.signal_name} ready for splitter:")
-        self.logger.debug(f"  - minimumHeight(): {min_height}px")
+        self.logger.debug("Plot %s ready for splitter:", plot.signal_name)
+        self.logger.debug("  - minimumHeight(): %spx", min_height)
         self.logger.debug(
-            f"  - sizePolicy: H={size_policy.horizontalPolicy()}, V={size_policy.verticalPolicy()}"
+            "  - sizePolicy: H=%s, V=%s",
+            size_policy.horizontalPolicy(),
+            size_policy.verticalPolicy(),
         )
 
     def clear_plots(self):
@@ -272,7 +281,7 @@ class PlotContainerWidget(QWidget):
             if plot.signal_name in self.target_signals:
                 self.target_signals.remove(plot.signal_name)
 
-            self.logger.debug(f"Removed plot {plot.signal_name} from splitter")
+            self.logger.debug("Removed plot %s from splitter", plot.signal_name)
 
             # Update splitter size after removing plot
             self._update_splitter_size()
@@ -320,14 +329,14 @@ class PlotContainerWidget(QWidget):
             # New plot will be populated by next ChunkLoader update
             # No need to load data manually - ChunkLoader handles all data loading
 
-            self.logger.debug(f"Added plot {signal_name} to splitter")
+            self.logger.debug("Added plot %s to splitter", signal_name)
 
             # Update splitter size after adding plot
             self._update_splitter_size()
 
     def on_plot_color_changed(self, plot: CustomPlot, new_color: str):
         """Handle plot color change."""
-        self.logger.debug(f"Plot {plot.signal_name} color changed to {new_color}")
+        self.logger.debug("Plot %s color changed to %s", plot.signal_name, new_color)
 
     def on_plot_signal_changed(self, plot: CustomPlot, new_signal_name: str):
         """Handle signal change in plot."""
@@ -341,7 +350,7 @@ class PlotContainerWidget(QWidget):
         # Signal change will trigger ChunkLoader refresh automatically
         # No need for load_and_display_data() - ChunkLoader handles data loading
 
-        self.logger.debug(f"Plot signal changed {old_signal} -> {new_signal_name}")
+        self.logger.debug("Plot signal changed %s -> %s", old_signal, new_signal_name)
         self.signal_changed_in_plot.emit(old_signal, new_signal_name)
 
     # load_and_display_data() REMOVED - obsolete method
@@ -353,22 +362,29 @@ class PlotContainerWidget(QWidget):
         This is now the only comment-related method - just pure rendering.
         """
         try:
-            # Clear existing markers
-            self._clear_comment_markers()
+            with span(
+                "PlotContainerWidget.refresh_comment_display",
+                comments=len(comments_to_render or []),
+                plots=len(self.plots),
+            ):
+                # Clear existing markers
+                self._clear_comment_markers()
 
-            if not self.plots or not comments_to_render:
-                return
+                if not self.plots or not comments_to_render:
+                    return
 
-            # Create vertical line marker for each comment in each plot
-            for comment in comments_to_render:
-                self._create_comment_markers_for_all_plots(comment)
+                # Create vertical line marker for each comment in each plot
+                for comment in comments_to_render:
+                    self._create_comment_markers_for_all_plots(comment)
 
             self.logger.debug(
-                f"Rendered {len(self.comment_markers)} comment markers across {len(self.plots)} plots"
+                "Rendered %s comment markers across %s plots",
+                len(self.comment_markers),
+                len(self.plots),
             )
 
         except Exception as e:
-            self.logger.error(f"Error rendering comments: {e}")
+            self.logger.error("Error rendering comments: %s", e)
 
     def _create_comment_markers_for_all_plots(self, comment):
         """Create vertical line marker for a comment in each plot."""
@@ -417,7 +433,7 @@ class PlotContainerWidget(QWidget):
                     self.comment_markers.append((marker, plot.plot_widget))
 
         except Exception as e:
-            self.logger.error(f"Error creating markers for comment: {e}")
+            self.logger.error("Error creating markers for comment: %s", e)
 
     def _clear_comment_markers(self):
         """Clear all comment markers from all plots."""
@@ -484,7 +500,7 @@ class PlotContainerWidget(QWidget):
         self._reorder_plot_in_splitter(dragged_plot, target_index)
 
         event.acceptProposedAction()
-        self.logger.debug(f"Plot {signal_name} reordered to index {target_index}")
+        self.logger.debug("Plot %s reordered to index %s", signal_name, target_index)
 
         # Emit reorder signal
         new_order = [plot.signal_name for plot in self.plots]
@@ -538,7 +554,7 @@ class PlotContainerWidget(QWidget):
             self.plots_splitter.setStretchFactor(i, 1)
 
         self.logger.debug(
-            f"Reordered plot {plot.signal_name}: {current_index} -> {target_index}"
+            "Reordered plot %s: %s -> %s", plot.signal_name, current_index, target_index
         )
 
     # ========= Splitter Size Management =========
@@ -590,13 +606,15 @@ class PlotContainerWidget(QWidget):
 
             if needs_force:
                 QTimer.singleShot(10, lambda: self.plots_splitter.setSizes(min_sizes))
-                self.logger.debug(f"FORCED individual sizes: {min_sizes}")
+                self.logger.debug("FORCED individual sizes: %s", min_sizes)
 
-            self.logger.debug(f"Set minimum height to {total_height}px")
+            self.logger.debug("Set minimum height to %spx", total_height)
         else:
             # If total required height <= viewport, allow normal distribution
             self.plots_splitter.setMinimumHeight(total_min_height)
-            self.logger.debug(f"Normal distribution: {total_height}px fits in viewport")
+            self.logger.debug(
+                "Normal distribution: %spx fits in viewport", total_height
+            )
 
         # Force updates
         self.scroll_area.updateGeometry()
@@ -605,7 +623,7 @@ class PlotContainerWidget(QWidget):
     def _on_global_height_changed(self, new_min: int):
         """Handle global minimum height change from style manager."""
         self.logger.debug(
-            f"Global minimum height changed to {new_min}px -> updating splitter"
+            "Global minimum height changed to %spx -> updating splitter", new_min
         )
         # The individual plots will have already updated their minimum heights
         # Now we need to update the splitter total size
@@ -625,7 +643,10 @@ class PlotContainerWidget(QWidget):
             plot.setMinimumHeight(0)
 
         self.logger.debug(
-            f"User resize pos={pos} idx={index} plots={len(self.plots)} constraints_dropped=1"
+            "User resize pos=%s idx=%s plots=%s constraints_dropped=1",
+            pos,
+            index,
+            len(self.plots),
         )
 
     def _on_resize_timeout(self):
@@ -690,7 +711,7 @@ class PlotContainerWidget(QWidget):
             else:
                 self._regions[i] = region
 
-        self.logger.debug(f"Created regions at bounds: {region_bounds}")
+        self.logger.debug("Created regions at bounds: %s", region_bounds)
 
     def update_all_regions(self, region_bounds: List[float]):
         """
@@ -728,6 +749,7 @@ class PlotContainerWidget(QWidget):
     # set_time_window() REMOVED - now using ChunkLoader exclusively
     # Navigation is handled through update_chunk_data() from ChunkLoader only
 
+    @traced("PlotContainerWidget.update_chunk_data")
     def update_chunk_data(
         self, start_sec: float, end_sec: float, data_dict: Dict[str, np.ndarray]
     ):
@@ -735,7 +757,7 @@ class PlotContainerWidget(QWidget):
         Update plots with chunk data (simplified like working tree).
         """
         try:
-            self.logger.debug(f"Updating plots: {start_sec:.2f}-{end_sec:.2f}s")
+            self.logger.debug("Updating plots: %.2f-%.2fs", start_sec, end_sec)
 
             # Update internal time state
             self.start_time = start_sec
@@ -765,12 +787,15 @@ class PlotContainerWidget(QWidget):
                     plot_widget.update_data(time_axis, chunk_data)
 
                     self.logger.debug(
-                        f"Updated plot {i} ({channel_name}): {len(chunk_data)} points"
+                        "Updated plot %s (%s): %s points",
+                        i,
+                        channel_name,
+                        len(chunk_data),
                     )
 
                 except Exception as e:
                     self.logger.error(
-                        f"Failed to update plot {i} ({channel_name}): {e}"
+                        "Failed to update plot %s (%s): %s", i, channel_name, e
                     )
                     continue
 
@@ -778,7 +803,7 @@ class PlotContainerWidget(QWidget):
             self.time_range_changed.emit(start_sec, end_sec)
 
         except Exception as e:
-            self.logger.error(f"Failed to update chunk data: {e}", exc_info=True)
+            self.logger.error("Failed to update chunk data: %s", e, exc_info=True)
 
     def set_duration(self, duration: float):
         """Set total duration. Called by parent tab."""
@@ -807,4 +832,4 @@ class PlotContainerWidget(QWidget):
             self.logger.debug("PlotContainerWidget cleanup completed")
 
         except Exception as e:
-            self.logger.error(f"Error during PlotContainerWidget cleanup: {e}")
+            self.logger.error("Error during PlotContainerWidget cleanup: %s", e)
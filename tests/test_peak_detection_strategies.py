@@ -0,0 +1,107 @@
+"""
+Equivalence of the vectorized SimpleThresholdStrategy / refractory_filter
+with the original per-sample loop, kept here as the reference.
+"""
+
+import numpy as np
+import pytest
+
+from aurora.processing.peak_detection_strategies import (
+    SimpleThresholdStrategy,
+    refractory_filter,
+)
+
+
+def reference_simple_threshold(
+    signal, fs, min_distance_sec=0.4, threshold_std_multiplier=2.0
+):
+    """Original SimpleThresholdStrategy.detect_peaks loop."""
+    threshold = np.mean(signal) + threshold_std_multiplier * np.std(signal)
+    min_distance = int(min_distance_sec * fs)
+
+    peaks = []
+    last_peak = -min_distance
+
+    for i in range(1, len(signal) - 1):
+        if (signal[i] > signal[i-1] and
+            signal[i] > signal[i+1] and
+            signal[i] > threshold and
+            i - last_peak > min_distance):
+            peaks.append(i)
+            last_peak = i
+
+    return np.array(peaks, dtype=int)
+
+
+def reference_refractory_filter(peaks, min_distance):
+    """Earliest-wins suppression, one candidate at a time."""
+    kept = []
+    for p in peaks:
+        if not kept or p - kept[-1] > min_distance:
+            kept.append(int(p))
+    return np.array(kept, dtype=int)
+
+
+def _signals(rng, n):
+    """Random, integer, tied (quantised), NaN-containing and periodic signals."""
+    noise = rng.normal(size=n)
+    with_nan = noise.copy()
+    if n:
+        with_nan[rng.integers(0, n, size=max(1, n // 50))] = np.nan
+    t = np.arange(n) / 100.0
+    return {
+        "random": noise,
+        "integer": rng.integers(-5, 6, size=n),
+        "tied": np.round(noise * 2) / 2,
+        "nan": with_nan,
+        "periodic": np.sin(2 * np.pi * 1.2 * t) ** 15 + 0.05 * noise,
+    }
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("min_distance_sec", [-0.5, 0.0, 0.01, 0.05, 0.4, 5.0])
+@pytest.mark.parametrize("threshold_std_multiplier", [-1.0, 0.0, 0.5, 2.0])
+def test_simple_threshold_matches_reference(
+    seed, min_distance_sec, threshold_std_multiplier
+):
+    rng = np.random.default_rng(seed)
+    fs = 100.0
+    n = int(rng.integers(0, 3000))
+    strategy = SimpleThresholdStrategy()
+
+    for name, signal in _signals(rng, n).items():
+        expected = reference_simple_threshold(
+            signal, fs, min_distance_sec, threshold_std_multiplier
+        )
+        peaks = strategy.detect_peaks(
+            signal, fs,
+            min_distance_sec=min_distance_sec,
+            threshold_std_multiplier=threshold_std_multiplier,
+        )
+        np.testing.assert_array_equal(peaks, expected, err_msg=name)
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3])
+def test_simple_threshold_short_signals(n):
+    signal = np.arange(n, dtype=float)
+    peaks = SimpleThresholdStrategy().detect_peaks(signal, 100.0)
+    np.testing.assert_array_equal(peaks, reference_simple_threshold(signal, 100.0))
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("min_distance", [-3, 0, 1, 7, 50, 10_000])
+def test_refractory_filter_matches_reference(seed, min_distance):
+    rng = np.random.default_rng(seed)
+    peaks = np.unique(rng.integers(0, 5000, size=int(rng.integers(0, 500))))
+
+    np.testing.assert_array_equal(
+        refractory_filter(peaks, min_distance),
+        reference_refractory_filter(peaks, min_distance),
+    )
+
+
+def test_refractory_filter_keeps_earliest_peak():
+    np.testing.assert_array_equal(
+        refractory_filter(np.array([10, 12, 15, 16, 30]), 5), [10, 16, 30]
+    )
+    assert refractory_filter(np.array([], dtype=int), 5).dtype.kind == "i"